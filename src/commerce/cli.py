@@ -9,6 +9,7 @@ from zoneinfo import ZoneInfo
 import typer
 
 from commerce.config import Settings
+from commerce.connectors.base import close_connector
 from commerce.db import AdsDB
 from commerce.executor import ExecutionError, execute_proposal
 from commerce.importers.cafe24_orders import Cafe24OrdersImportOptions, import_cafe24_orders_csv
@@ -159,23 +160,26 @@ def backfill_cmd(
     )
 
     async def _run() -> None:
-        ok, err = await connector.health_check()
-        if not ok and not settings.demo_mode:
-            raise RuntimeError(err or "health_check failed")
-
         try:
-            await connector.sync_entities()
-        except NotImplementedError:
-            pass
-
-        cur = start_d
-        key = f"{p}:{c['id']}:last_fetch_daily"
-        while cur <= end_d:
-            chunk_end = min(cur + timedelta(days=int(chunk_days) - 1), end_d)
-            repo.set_meta(key, "")
-            await connector.fetch_metrics_daily(cur.isoformat(), chunk_end.isoformat())
-            typer.echo(f"OK {p} {cur.isoformat()} ~ {chunk_end.isoformat()}")
-            cur = chunk_end + timedelta(days=1)
+            ok, err = await connector.health_check()
+            if not ok and not settings.demo_mode:
+                raise RuntimeError(err or "health_check failed")
+
+            try:
+                await connector.sync_entities()
+            except NotImplementedError:
+                pass
+
+            cur = start_d
+            key = f"{p}:{c['id']}:last_fetch_daily"
+            while cur <= end_d:
+                chunk_end = min(cur + timedelta(days=int(chunk_days) - 1), end_d)
+                repo.set_meta(key, "")
+                await connector.fetch_metrics_daily(cur.isoformat(), chunk_end.isoformat())
+                typer.echo(f"OK {p} {cur.isoformat()} ~ {chunk_end.isoformat()}")
+                cur = chunk_end + timedelta(days=1)
+        finally:
+            await close_connector(connector)
 
     try:
         asyncio.run(_run())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from typing import Any, Protocol
 
@@ -36,7 +37,45 @@ class ConnectorContext:
     config: dict[str, Any]
 
 
+def simulated_result(mode: str, platform: str, proposal: dict[str, Any]) -> dict[str, Any]:
+    """Result JSON for apply_action in import/fixture modes, where nothing is sent upstream."""
+    get = proposal.get
+    return {
+        "simulated": True,
+        "mode": mode,
+        "platform": platform,
+        "action_type": get("action_type"),
+        "entity_type": get("entity_type"),
+        "entity_id": get("entity_id"),
+    }
+
+
+def proposal_payload(proposal: dict[str, Any]) -> dict[str, Any]:
+    """Parsed payload_json of a proposal; malformed or missing payloads read as {}."""
+    raw = proposal.get("payload_json") or "{}"
+    if isinstance(raw, dict):
+        return raw
+    if raw == "{}":
+        return {}
+    try:
+        parsed = json.loads(raw)
+    except (TypeError, ValueError):
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+async def close_connector(connector: Any) -> None:
+    """Close a connector's pooled HTTP client if it keeps one (exposes aclose()); never raises."""
+    closer = getattr(connector, "aclose", None)
+    if callable(closer):
+        try:
+            await closer()
+        except Exception:  # noqa: BLE001 - closing must not mask the caller's outcome
+            pass
+
+
 class BaseConnector(Protocol):
+    ctx: ConnectorContext
     capabilities: ConnectorCapabilities
 
     async def health_check(self) -> tuple[bool, str | None]:
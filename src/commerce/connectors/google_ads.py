@@ -1,34 +1,113 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 import re
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from commerce.connectors.base import ConnectorCapabilities, ConnectorContext
+from commerce.connectors.base import ConnectorCapabilities, ConnectorContext, proposal_payload, simulated_result
 from commerce.fixtures import fixture_dir, load_entities, load_metrics_daily_rows, load_metrics_intraday_rows
 
 
+_DEFAULT_ADS_POOL = 16
+
+
+def _ads_pool_size() -> int:
+    try:
+        size = int(os.getenv("GOOGLE_ADS_POOL", str(_DEFAULT_ADS_POOL)))
+    except ValueError:
+        return _DEFAULT_ADS_POOL
+    return size if size >= 1 else _DEFAULT_ADS_POOL
+
+
+# google-ads calls are blocking gRPC; run them on a dedicated pool so a slow
+# account doesn't starve the default executor used by other `to_thread` work.
+# Built on first use so a bad GOOGLE_ADS_POOL can't break importing the module.
+@lru_cache(maxsize=1)
+def _ads_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=_ads_pool_size(), thread_name_prefix="google-ads")
+
+
+async def _run_blocking(fn: Any, *args: Any) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(_ads_executor(), fn, *args)
+
+
+class _TokenBucket:
+    """Monotonic-clock token bucket; `acquire()` blocks just long enough to stay under `rate`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Process-wide, keyed by (customer_id, connector_id): Google enforces limits per customer.
+_RATE_LIMITERS: dict[tuple[str, str], _TokenBucket] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def _rate_limiter(customer_id: str, connector_id: str, requests_per_minute: float) -> _TokenBucket:
+    rate = max(requests_per_minute, 1.0) / 60.0
+    key = (customer_id, connector_id)
+    with _RATE_LIMITERS_LOCK:
+        bucket = _RATE_LIMITERS.get(key)
+        if bucket is None or bucket.rate != rate:
+            bucket = _TokenBucket(rate=rate, capacity=max(requests_per_minute / 4.0, 1.0))
+            _RATE_LIMITERS[key] = bucket
+        return bucket
+
+
 def _normalize_customer_id(raw: str) -> str:
     # Google Ads customer id is digits only (UI shows hyphens).
     return re.sub(r"\D+", "", str(raw or ""))
 
 
-def _safe_levels(raw: Any) -> list[str]:
-    if isinstance(raw, list):
-        levels = [str(x).strip().lower() for x in raw]
-    elif isinstance(raw, str) and raw.strip():
-        levels = [s.strip().lower() for s in raw.split(",")]
+_FIXTURE_BATCH_SIZE = 500
+
+_ALLOWED_LEVELS = frozenset(("campaign", "adgroup", "keyword"))
+
+
+@lru_cache(maxsize=32)
+def _safe_levels_cached(raw_key: tuple[str, ...] | str | None) -> tuple[str, ...]:
+    if isinstance(raw_key, tuple):
+        levels = [str(x).strip().lower() for x in raw_key]
+    elif isinstance(raw_key, str) and raw_key.strip():
+        levels = [s.strip().lower() for s in raw_key.split(",")]
     else:
-        levels = ["campaign"]
+        return ("campaign",)
     ok: list[str] = []
     for lv in levels:
-        if lv in {"campaign", "adgroup", "keyword"} and lv not in ok:
+        if lv in _ALLOWED_LEVELS and lv not in ok:
             ok.append(lv)
-    return ok or ["campaign"]
+    return tuple(ok) or ("campaign",)
+
+
+def _safe_levels(raw: Any) -> tuple[str, ...]:
+    # Same connector config is sanitized on every sync; memoize on a hashable key.
+    if isinstance(raw, list):
+        return _safe_levels_cached(tuple(str(x) for x in raw))
+    if isinstance(raw, str):
+        return _safe_levels_cached(raw)
+    return ("campaign",)
 
 
 def _to_float(v: Any) -> float:
@@ -50,6 +129,130 @@ def _date_range(date_from: str, date_to: str) -> tuple[date, date]:
     return d0, d1
 
 
+_METRIC_FIELDS = """
+              metrics.impressions,
+              metrics.clicks,
+              metrics.cost_micros,
+              metrics.conversions,
+              metrics.conversions_value,
+              metrics.all_conversions,
+              metrics.all_conversions_value"""
+
+_Q_CAMPAIGN_TMPL = """
+            SELECT
+              segments.date,
+              campaign.id,
+              campaign.name,
+              campaign.status,{metrics}
+            FROM campaign
+            WHERE segments.date BETWEEN '{date_from}' AND '{date_to}'
+              AND campaign.status != 'REMOVED'
+            """
+
+_Q_ADGROUP_TMPL = """
+            SELECT
+              segments.date,
+              campaign.id,
+              campaign.name,
+              ad_group.id,
+              ad_group.name,
+              ad_group.status,{metrics}
+            FROM ad_group
+            WHERE segments.date BETWEEN '{date_from}' AND '{date_to}'
+              AND ad_group.status != 'REMOVED'
+            """
+
+# Keyword_view is keyword-only and provides criterion id + keyword text.
+_Q_KEYWORD_TMPL = """
+            SELECT
+              segments.date,
+              campaign.id,
+              campaign.name,
+              ad_group.id,
+              ad_group.name,
+              ad_group_criterion.criterion_id,
+              ad_group_criterion.keyword.text,
+              ad_group_criterion.status,{metrics}
+            FROM keyword_view
+            WHERE segments.date BETWEEN '{date_from}' AND '{date_to}'
+              AND ad_group_criterion.status != 'REMOVED'
+            """
+
+# Extractors normalize a GAQL row into
+#   (day, entity_id, entities_to_upsert, metrics_json_extra)
+# where each entity is (entity_type, entity_id, parent_type, parent_id, name, status),
+# or return None to skip the row. Protobuf ids are ints; stringify only at the DB boundary.
+
+
+def _extract_campaign_row(row: Any) -> tuple | None:
+    day = row.segments.date
+    if not day or not row.campaign.id:
+        return None
+    cid = str(row.campaign.id)
+    status = str(row.campaign.status or "") or None
+    return day, cid, (("campaign", cid, None, None, row.campaign.name or None, status),), {}
+
+
+def _extract_adgroup_row(row: Any) -> tuple | None:
+    day = row.segments.date
+    if not day or not row.ad_group.id:
+        return None
+    gid = str(row.ad_group.id)
+    parent = str(row.campaign.id) if row.campaign.id else None
+    entities: list[tuple] = []
+    if parent:
+        entities.append(("campaign", parent, None, None, row.campaign.name or None, None))
+    entities.append(
+        (
+            "adgroup",
+            gid,
+            "campaign" if parent else None,
+            parent,
+            row.ad_group.name or None,
+            str(row.ad_group.status or "") or None,
+        )
+    )
+    return day, gid, entities, {"parent_campaign_id": parent}
+
+
+def _extract_keyword_row(row: Any) -> tuple | None:
+    day = row.segments.date
+    if not day or not row.ad_group_criterion.criterion_id:
+        return None
+    kid = str(row.ad_group_criterion.criterion_id)
+    gid = str(row.ad_group.id) if row.ad_group.id else None
+    cid = str(row.campaign.id) if row.campaign.id else None
+    try:
+        kw_text = row.ad_group_criterion.keyword.text or None
+    except Exception:
+        kw_text = None
+    entities: list[tuple] = []
+    if cid:
+        entities.append(("campaign", cid, None, None, row.campaign.name or None, None))
+    if gid:
+        entities.append(("adgroup", gid, "campaign" if cid else None, cid, row.ad_group.name or None, None))
+    entities.append(
+        (
+            "keyword",
+            kid,
+            "adgroup" if gid else ("campaign" if cid else None),
+            gid or cid,
+            kw_text,
+            str(row.ad_group_criterion.status or "") or None,
+        )
+    )
+    return day, kid, entities, {"parent_adgroup_id": gid, "parent_campaign_id": cid, "keyword_text": kw_text}
+
+
+# Levels run in this order so entities carrying their own status are upserted
+# before child levels would insert them as status-less parents.
+_LEVEL_SPECS = (
+    ("campaign", _Q_CAMPAIGN_TMPL, _extract_campaign_row),
+    ("adgroup", _Q_ADGROUP_TMPL, _extract_adgroup_row),
+    ("keyword", _Q_KEYWORD_TMPL, _extract_keyword_row),
+)
+
+
 class GoogleAdsConnector:
     """
     Google Ads connector.
@@ -101,6 +304,10 @@ class GoogleAdsConnector:
             raw = str(self.ctx.config.get("customer_id") or "").strip()
         return _normalize_customer_id(raw)
 
+    def _throttle(self, customer_id: str) -> None:
+        rpm = float(self.ctx.config.get("requests_per_minute", 15) or 15)
+        _rate_limiter(customer_id, self.ctx.connector_id, rpm).acquire()
+
     async def health_check(self) -> tuple[bool, str | None]:
         mode = str(self.ctx.config.get("mode", "import")).strip().lower()
         if mode in {"import", "fixture"}:
@@ -136,22 +343,24 @@ class GoogleAdsConnector:
             return
         if mode == "fixture":
             d = fixture_dir(self.ctx.platform, self.ctx.config)
-            for e in load_entities(d):
-                self.repo.upsert_entity(
-                    platform=e.get("platform") or self.ctx.platform,
-                    account_id=e.get("account_id"),
-                    entity_type=e.get("entity_type") or "",
-                    entity_id=e.get("entity_id") or "",
-                    parent_type=e.get("parent_type"),
-                    parent_id=e.get("parent_id"),
-                    name=e.get("name"),
-                    status=e.get("status"),
-                    meta_json=e.get("meta_json") or {},
-                )
+            self.repo.upsert_entities_bulk(
+                {
+                    "platform": e.get("platform") or self.ctx.platform,
+                    "account_id": e.get("account_id"),
+                    "entity_type": e.get("entity_type") or "",
+                    "entity_id": e.get("entity_id") or "",
+                    "parent_type": e.get("parent_type"),
+                    "parent_id": e.get("parent_id"),
+                    "name": e.get("name"),
+                    "status": e.get("status"),
+                    "meta_json": e.get("meta_json") or {},
+                }
+                for e in load_entities(d)
+            )
             return
 
         # API mode (best-effort, read-only)
-        await asyncio.to_thread(self._sync_entities_api)
+        await _run_blocking(self._sync_entities_api)
 
     def _sync_entities_api(self) -> None:
         customer_id = self._google_customer_id()
@@ -161,11 +370,13 @@ class GoogleAdsConnector:
         ga_service = client.get_service("GoogleAdsService")
 
         def stream(query: str):
+            self._throttle(customer_id)
             for batch in ga_service.search_stream(customer_id=customer_id, query=query):
                 for row in batch.results:
                     yield row
 
-        # Campaigns
+        # Campaigns come from their own query: the ad_group stream below never
+        # returns campaigns without live ad groups (Performance Max, empty ones).
         q_campaigns = """
         SELECT
           campaign.id,
@@ -175,22 +386,21 @@ class GoogleAdsConnector:
         WHERE campaign.status != 'REMOVED'
         """
         for row in stream(q_campaigns):
-            cid = str(getattr(row.campaign, "id", "") or "").strip()
-            if not cid:
+            # Protobuf ids arrive as ints and names as str; stringify ids only at the DB boundary.
+            if not row.campaign.id:
                 continue
             self.repo.upsert_entity(
                 platform="google",
                 account_id=customer_id,
                 entity_type="campaign",
-                entity_id=cid,
+                entity_id=str(row.campaign.id),
                 parent_type=None,
                 parent_id=None,
-                name=str(getattr(row.campaign, "name", "") or "") or None,
-                status=str(getattr(row.campaign, "status", "") or "") or None,
+                name=row.campaign.name or None,
+                status=str(row.campaign.status or "") or None,
                 meta_json={"source": "google_ads_api"},
             )
 
-        # Ad groups
         q_adgroups = """
         SELECT
           campaign.id,
@@ -201,19 +411,18 @@ class GoogleAdsConnector:
         WHERE ad_group.status != 'REMOVED'
         """
         for row in stream(q_adgroups):
-            gid = str(getattr(row.ad_group, "id", "") or "").strip()
-            if not gid:
+            if not row.ad_group.id:
                 continue
-            parent = str(getattr(row.campaign, "id", "") or "").strip() or None
+            parent = str(row.campaign.id) if row.campaign.id else None
             self.repo.upsert_entity(
                 platform="google",
                 account_id=customer_id,
                 entity_type="adgroup",
-                entity_id=gid,
+                entity_id=str(row.ad_group.id),
                 parent_type="campaign" if parent else None,
                 parent_id=parent,
-                name=str(getattr(row.ad_group, "name", "") or "") or None,
-                status=str(getattr(row.ad_group, "status", "") or "") or None,
+                name=row.ad_group.name or None,
+                status=str(row.ad_group.status or "") or None,
                 meta_json={"source": "google_ads_api"},
             )
 
@@ -223,30 +432,29 @@ class GoogleAdsConnector:
             return
         if mode == "fixture":
             d0, d1 = _date_range(date_from, date_to)
+            # ISO-8601 dates order lexicographically, so compare strings instead of parsing per row.
+            date_from_s = d0.isoformat()
+            date_to_s = d1.isoformat()
             d = fixture_dir(self.ctx.platform, self.ctx.config)
+            # Rows stream from the CSV; only one batch is held in memory at a time.
+            batch: list[dict[str, Any]] = []
             for row in load_metrics_daily_rows(d):
-                day = str(row.get("date") or "")
+                day = row.pop("date")
                 if not day:
                     continue
-                dd = date.fromisoformat(day)
-                if dd < d0 or dd > d1:
+                if not (date_from_s <= day <= date_to_s):
                     continue
-                self.repo.upsert_metric_daily(
-                    platform=row.get("platform") or self.ctx.platform,
-                    account_id=row.get("account_id"),
-                    entity_type=row.get("entity_type") or "",
-                    entity_id=row.get("entity_id") or "",
-                    day=day,
-                    spend=row.get("spend"),
-                    impressions=row.get("impressions"),
-                    clicks=row.get("clicks"),
-                    conversions=row.get("conversions"),
-                    conversion_value=row.get("conversion_value"),
-                    metrics_json=row.get("metrics_json") or {},
-                )
+                row["day"] = day
+                row["platform"] = row["platform"] or self.ctx.platform
+                batch.append(row)
+                if len(batch) >= _FIXTURE_BATCH_SIZE:
+                    self.repo.upsert_metrics_daily_bulk(batch)
+                    batch = []
+            if batch:
+                self.repo.upsert_metrics_daily_bulk(batch)
             return
 
-        await asyncio.to_thread(self._fetch_metrics_daily_api, date_from, date_to)
+        await _run_blocking(self._fetch_metrics_daily_api, date_from, date_to)
 
     def _fetch_metrics_daily_api(self, date_from: str, date_to: str) -> None:
         customer_id = self._google_customer_id()
@@ -282,242 +490,112 @@ class GoogleAdsConnector:
         ga_service = client.get_service("GoogleAdsService")
 
         def stream(query: str):
+            self._throttle(customer_id)
             for batch in ga_service.search_stream(customer_id=customer_id, query=query):
                 for row in batch.results:
                     yield row
 
-        def upsert_metric(
-            *,
-            day: str,
-            entity_type: str,
-            entity_id: str,
-            spend: float,
-            impressions: int,
-            clicks: int,
-            conversions: float,
-            conversion_value: float,
-            conversions_all: float | None,
-            conversion_value_all: float | None,
-            extra: dict[str, Any],
-        ) -> None:
-            self.repo.upsert_metric_daily(
-                platform="google",
-                account_id=customer_id,
-                entity_type=entity_type,
-                entity_id=entity_id,
-                day=day,
-                spend=spend,
-                impressions=impressions,
-                clicks=clicks,
-                conversions=conversions,
-                conversion_value=conversion_value,
-                metrics_json={
-                    "source": "google_ads_api",
-                    "conversions_all": conversions_all,
-                    "conversion_value_all": conversion_value_all,
-                    **extra,
-                },
+        # Column-oriented accumulators (one list/array per metric) flushed per level
+        # through the bulk upsert; numeric columns avoid boxing per-row floats.
+        col_days: list[str] = []
+        col_types: list[str] = []
+        col_ids: list[str] = []
+        col_spend = array("d")
+        col_impressions = array("q")
+        col_clicks = array("q")
+        col_conversions = array("d")
+        col_conversion_value = array("d")
+        col_conversions_all = array("d")
+        col_conversion_value_all = array("d")
+        col_extra: list[dict[str, Any]] = []
+
+        def add_metric(day: str, entity_type: str, entity_id: str, m: Any, extra: dict[str, Any]) -> None:
+            col_days.append(day)
+            col_types.append(entity_type)
+            col_ids.append(entity_id)
+            col_spend.append(_cost_micros_to_currency(getattr(m, "cost_micros", 0)))
+            col_impressions.append(int(getattr(m, "impressions", 0) or 0))
+            col_clicks.append(int(getattr(m, "clicks", 0) or 0))
+            col_conversions.append(_to_float(getattr(m, "conversions", 0)))
+            col_conversion_value.append(_to_float(getattr(m, "conversions_value", 0)))
+            col_conversions_all.append(_to_float(getattr(m, "all_conversions", 0)))
+            col_conversion_value_all.append(_to_float(getattr(m, "all_conversions_value", 0)))
+            col_extra.append(extra)
+
+        def flush_metrics() -> None:
+            if not col_days:
+                return
+            self.repo.upsert_metrics_daily_bulk(
+                {
+                    "platform": "google",
+                    "account_id": customer_id,
+                    "entity_type": col_types[i],
+                    "entity_id": col_ids[i],
+                    "day": col_days[i],
+                    "spend": col_spend[i],
+                    "impressions": col_impressions[i],
+                    "clicks": col_clicks[i],
+                    "conversions": col_conversions[i],
+                    "conversion_value": col_conversion_value[i],
+                    "metrics_json": {
+                        "source": "google_ads_api",
+                        "conversions_all": col_conversions_all[i],
+                        "conversion_value_all": col_conversion_value_all[i],
+                        **col_extra[i],
+                    },
+                }
+                for i in range(len(col_days))
             )
+            for col in (
+                col_days,
+                col_types,
+                col_ids,
+                col_spend,
+                col_impressions,
+                col_clicks,
+                col_conversions,
+                col_conversion_value,
+                col_conversions_all,
+                col_conversion_value_all,
+                col_extra,
+            ):
+                del col[:]
 
         date_from_s = d0.isoformat()
         date_to_s = d1.isoformat()
 
-        if "campaign" in levels:
-            q = f"""
-            SELECT
-              segments.date,
-              campaign.id,
-              campaign.name,
-              campaign.status,
-              metrics.impressions,
-              metrics.clicks,
-              metrics.cost_micros,
-              metrics.conversions,
-              metrics.conversions_value,
-              metrics.all_conversions,
-              metrics.all_conversions_value
-            FROM campaign
-            WHERE segments.date BETWEEN '{date_from_s}' AND '{date_to_s}'
-              AND campaign.status != 'REMOVED'
-            """
-            for row in stream(q):
-                day = str(getattr(row.segments, "date", "") or "")
-                cid = str(getattr(row.campaign, "id", "") or "").strip()
-                if not day or not cid:
-                    continue
-                self.repo.upsert_entity(
-                    platform="google",
-                    account_id=customer_id,
-                    entity_type="campaign",
-                    entity_id=cid,
-                    parent_type=None,
-                    parent_id=None,
-                    name=str(getattr(row.campaign, "name", "") or "") or None,
-                    status=str(getattr(row.campaign, "status", "") or "") or None,
-                    meta_json={"source": "google_ads_api"},
-                )
-                upsert_metric(
-                    day=day,
-                    entity_type="campaign",
-                    entity_id=cid,
-                    spend=_cost_micros_to_currency(getattr(row.metrics, "cost_micros", 0)),
-                    impressions=int(getattr(row.metrics, "impressions", 0) or 0),
-                    clicks=int(getattr(row.metrics, "clicks", 0) or 0),
-                    conversions=_to_float(getattr(row.metrics, "conversions", 0)),
-                    conversion_value=_to_float(getattr(row.metrics, "conversions_value", 0)),
-                    conversions_all=_to_float(getattr(row.metrics, "all_conversions", 0)),
-                    conversion_value_all=_to_float(getattr(row.metrics, "all_conversions_value", 0)),
-                    extra={},
-                )
+        # Rows are per (entity, day); upsert each entity once per fetch so parents
+        # aren't rewritten for every child row (and don't clobber status with None).
+        upserted: set[tuple[str, str]] = set()
 
-        if "adgroup" in levels:
-            q = f"""
-            SELECT
-              segments.date,
-              campaign.id,
-              campaign.name,
-              ad_group.id,
-              ad_group.name,
-              ad_group.status,
-              metrics.impressions,
-              metrics.clicks,
-              metrics.cost_micros,
-              metrics.conversions,
-              metrics.conversions_value,
-              metrics.all_conversions,
-              metrics.all_conversions_value
-            FROM ad_group
-            WHERE segments.date BETWEEN '{date_from_s}' AND '{date_to_s}'
-              AND ad_group.status != 'REMOVED'
-            """
-            for row in stream(q):
-                day = str(getattr(row.segments, "date", "") or "")
-                gid = str(getattr(row.ad_group, "id", "") or "").strip()
-                parent = str(getattr(row.campaign, "id", "") or "").strip() or None
-                if not day or not gid:
-                    continue
-                if parent:
-                    self.repo.upsert_entity(
-                        platform="google",
-                        account_id=customer_id,
-                        entity_type="campaign",
-                        entity_id=parent,
-                        parent_type=None,
-                        parent_id=None,
-                        name=str(getattr(row.campaign, "name", "") or "") or None,
-                        status=None,
-                        meta_json={"source": "google_ads_api"},
-                    )
-                self.repo.upsert_entity(
-                    platform="google",
-                    account_id=customer_id,
-                    entity_type="adgroup",
-                    entity_id=gid,
-                    parent_type="campaign" if parent else None,
-                    parent_id=parent,
-                    name=str(getattr(row.ad_group, "name", "") or "") or None,
-                    status=str(getattr(row.ad_group, "status", "") or "") or None,
-                    meta_json={"source": "google_ads_api"},
-                )
-                upsert_metric(
-                    day=day,
-                    entity_type="adgroup",
-                    entity_id=gid,
-                    spend=_cost_micros_to_currency(getattr(row.metrics, "cost_micros", 0)),
-                    impressions=int(getattr(row.metrics, "impressions", 0) or 0),
-                    clicks=int(getattr(row.metrics, "clicks", 0) or 0),
-                    conversions=_to_float(getattr(row.metrics, "conversions", 0)),
-                    conversion_value=_to_float(getattr(row.metrics, "conversions_value", 0)),
-                    conversions_all=_to_float(getattr(row.metrics, "all_conversions", 0)),
-                    conversion_value_all=_to_float(getattr(row.metrics, "all_conversions_value", 0)),
-                    extra={"parent_campaign_id": parent},
-                )
-
-        if "keyword" in levels:
-            # Keyword_view is keyword-only and provides criterion id + keyword text.
-            q = f"""
-            SELECT
-              segments.date,
-              campaign.id,
-              campaign.name,
-              ad_group.id,
-              ad_group.name,
-              ad_group_criterion.criterion_id,
-              ad_group_criterion.keyword.text,
-              ad_group_criterion.status,
-              metrics.impressions,
-              metrics.clicks,
-              metrics.cost_micros,
-              metrics.conversions,
-              metrics.conversions_value,
-              metrics.all_conversions,
-              metrics.all_conversions_value
-            FROM keyword_view
-            WHERE segments.date BETWEEN '{date_from_s}' AND '{date_to_s}'
-              AND ad_group_criterion.status != 'REMOVED'
-            """
+        def run(level: str, tmpl: str, extract: Any) -> None:
+            q = tmpl.format(metrics=_METRIC_FIELDS, date_from=date_from_s, date_to=date_to_s)
             for row in stream(q):
-                day = str(getattr(row.segments, "date", "") or "")
-                kid = str(getattr(row.ad_group_criterion, "criterion_id", "") or "").strip()
-                gid = str(getattr(row.ad_group, "id", "") or "").strip() or None
-                cid = str(getattr(row.campaign, "id", "") or "").strip() or None
-                if not day or not kid:
+                item = extract(row)
+                if item is None:
                     continue
-                if cid:
+                day, entity_id, entities, extra = item
+                for entity_type, eid, parent_type, parent_id, name, status in entities:
+                    if (entity_type, eid) in upserted:
+                        continue
                     self.repo.upsert_entity(
                         platform="google",
                         account_id=customer_id,
-                        entity_type="campaign",
-                        entity_id=cid,
-                        parent_type=None,
-                        parent_id=None,
-                        name=str(getattr(row.campaign, "name", "") or "") or None,
-                        status=None,
-                        meta_json={"source": "google_ads_api"},
-                    )
-                if gid:
-                    self.repo.upsert_entity(
-                        platform="google",
-                        account_id=customer_id,
-                        entity_type="adgroup",
-                        entity_id=gid,
-                        parent_type="campaign" if cid else None,
-                        parent_id=cid,
-                        name=str(getattr(row.ad_group, "name", "") or "") or None,
-                        status=None,
+                        entity_type=entity_type,
+                        entity_id=eid,
+                        parent_type=parent_type,
+                        parent_id=parent_id,
+                        name=name,
+                        status=status,
                         meta_json={"source": "google_ads_api"},
                     )
+                    upserted.add((entity_type, eid))
+                add_metric(day, level, entity_id, row.metrics, extra)
+            flush_metrics()
 
-                kw_text = None
-                try:
-                    kw_text = str(getattr(getattr(row.ad_group_criterion, "keyword", None), "text", "") or "") or None
-                except Exception:
-                    kw_text = None
-
-                self.repo.upsert_entity(
-                    platform="google",
-                    account_id=customer_id,
-                    entity_type="keyword",
-                    entity_id=kid,
-                    parent_type="adgroup" if gid else ("campaign" if cid else None),
-                    parent_id=gid or cid,
-                    name=kw_text,
-                    status=str(getattr(row.ad_group_criterion, "status", "") or "") or None,
-                    meta_json={"source": "google_ads_api"},
-                )
-                upsert_metric(
-                    day=day,
-                    entity_type="keyword",
-                    entity_id=kid,
-                    spend=_cost_micros_to_currency(getattr(row.metrics, "cost_micros", 0)),
-                    impressions=int(getattr(row.metrics, "impressions", 0) or 0),
-                    clicks=int(getattr(row.metrics, "clicks", 0) or 0),
-                    conversions=_to_float(getattr(row.metrics, "conversions", 0)),
-                    conversion_value=_to_float(getattr(row.metrics, "conversions_value", 0)),
-                    conversions_all=_to_float(getattr(row.metrics, "all_conversions", 0)),
-                    conversion_value_all=_to_float(getattr(row.metrics, "all_conversions_value", 0)),
-                    extra={"parent_adgroup_id": gid, "parent_campaign_id": cid, "keyword_text": kw_text},
-                )
+        for level, tmpl, extract in _LEVEL_SPECS:
+            if level in levels:
+                run(level, tmpl, extract)
 
         self.repo.set_meta(key, datetime.now().astimezone().replace(microsecond=0).isoformat())
 
@@ -526,23 +604,14 @@ class GoogleAdsConnector:
         if mode != "fixture":
             return
         d = fixture_dir(self.ctx.platform, self.ctx.config)
+        rows: list[dict[str, Any]] = []
         for row in load_metrics_intraday_rows(d):
-            hour_ts = str(row.get("hour_ts") or "")
-            if not hour_ts.startswith(day):
+            hour_ts = row["hour_ts"]
+            if hour_ts[:10] != day:
                 continue
-            self.repo.upsert_metric_intraday(
-                platform=row.get("platform") or self.ctx.platform,
-                account_id=row.get("account_id"),
-                entity_type=row.get("entity_type") or "",
-                entity_id=row.get("entity_id") or "",
-                hour_ts=hour_ts,
-                spend=row.get("spend"),
-                impressions=row.get("impressions"),
-                clicks=row.get("clicks"),
-                conversions=row.get("conversions"),
-                conversion_value=row.get("conversion_value"),
-                metrics_json=row.get("metrics_json") or {},
-            )
+            row["platform"] = row["platform"] or self.ctx.platform
+            rows.append(row)
+        self.repo.upsert_metrics_intraday_bulk(rows)
 
     # ------------------------------------------------------------------ #
     # Write helpers                                                        #
@@ -550,13 +619,7 @@ class GoogleAdsConnector:
 
     def _payload(self, proposal: dict) -> dict:
         """Extract and parse payload_json from a proposal dict."""
-        raw = proposal.get("payload_json") or "{}"
-        if isinstance(raw, dict):
-            return raw
-        try:
-            return json.loads(raw)
-        except Exception:
-            return {}
+        return proposal_payload(proposal)
 
     def _query_single(self, client: Any, cid: str, gaql: str) -> Any:
         """Run a GAQL query and return the first result row, or None."""
@@ -849,7 +912,7 @@ class GoogleAdsConnector:
         }
 
     def _apply_action_api(self, proposal: dict) -> dict:
-        """Synchronous dispatcher for API write actions. Called from asyncio.to_thread."""
+        """Synchronous dispatcher for API write actions. Runs on the Google Ads executor."""
         client = self._google_client()
         cid = self._google_customer_id()
         if not cid:
@@ -872,13 +935,6 @@ class GoogleAdsConnector:
     async def apply_action(self, proposal: dict) -> dict:
         mode = str(self.ctx.config.get("mode", "import")).strip().lower()
         if mode in {"import", "fixture"}:
-            return {
-                "simulated": True,
-                "mode": mode,
-                "platform": self.ctx.platform,
-                "action_type": proposal.get("action_type"),
-                "entity_type": proposal.get("entity_type"),
-                "entity_id": proposal.get("entity_id"),
-            }
+            return simulated_result(mode, self.ctx.platform, proposal)
         # API mode
-        return await asyncio.to_thread(self._apply_action_api, proposal)
+        return await _run_blocking(self._apply_action_api, proposal)
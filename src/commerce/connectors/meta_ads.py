@@ -1,18 +1,75 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import json
 import os
 import re
 from datetime import date, datetime, timedelta
-from typing import Any
+from functools import cached_property, lru_cache
+from typing import Any, AsyncIterator
 from zoneinfo import ZoneInfo
 
 import httpx
 
-from commerce.connectors.base import ConnectorCapabilities, ConnectorContext
+from commerce.connectors.base import ConnectorCapabilities, ConnectorContext, simulated_result
 from commerce.fixtures import fixture_dir, load_entities, load_metrics_daily_rows, load_metrics_intraday_rows
+from commerce.util import now_utc_iso
+
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+# Identical meta_json for every insights-derived entity; serialize it once.
+_META_SOURCE_JSON = json.dumps({"source": "meta_graph_api"}, ensure_ascii=True)
+
+_ALLOWED_LEVELS = frozenset(("campaign", "adset", "ad"))
+_DEFAULT_LEVELS = ("campaign", "adset")
+
+# Reasonable defaults for ecommerce. Users can override per account.
+_DEFAULT_PURCHASE_ACTION_TYPES = (
+    "purchase",
+    "omni_purchase",
+    "offsite_conversion.fb_pixel_purchase",
+)
+
+
+_INSIGHTS_BASE_FIELDS = "date_start,date_stop,account_id,spend,impressions,clicks,actions,action_values"
+_FIELDS_CAMPAIGN = _INSIGHTS_BASE_FIELDS + ",campaign_id,campaign_name"
+_FIELDS_ADSET = _INSIGHTS_BASE_FIELDS + ",campaign_id,adset_id,adset_name"
+_FIELDS_AD = _INSIGHTS_BASE_FIELDS + ",campaign_id,adset_id,ad_id,ad_name"
+_FIELDS_BY_LEVEL = {"campaign": _FIELDS_CAMPAIGN, "adset": _FIELDS_ADSET, "ad": _FIELDS_AD}
+
+
+# Action-type classification bits for the insights action walk.
+_KIND_OFFSITE_AGG = 1
+_KIND_OFFSITE_GRANULAR = 2
+_KIND_PURCHASE = 4
+
+# level -> (entity id key, name key, parent id key, parent type)
+_LEVEL_KEYS: dict[str, tuple[str, str, str | None, str | None]] = {
+    "campaign": ("campaign_id", "campaign_name", None, None),
+    "adset": ("adset_id", "adset_name", "campaign_id", "campaign"),
+    "ad": ("ad_id", "ad_name", "adset_id", "adset"),
+}
+
+
+def _without_credentials(url: httpx.URL) -> httpx.URL:
+    return url.copy_remove_param("access_token").copy_remove_param("appsecret_proof")
+
+
+@lru_cache(maxsize=32)
+def _safe_levels_cached(raw_key: tuple[str, ...] | str) -> tuple[str, ...]:
+    if isinstance(raw_key, tuple):
+        levels = [x.strip().lower() for x in raw_key]
+    elif raw_key.strip():
+        levels = [s.strip().lower() for s in raw_key.split(",")]
+    else:
+        return _DEFAULT_LEVELS
+    ok: list[str] = []
+    for lv in levels:
+        if lv in _ALLOWED_LEVELS and lv not in ok:
+            ok.append(lv)
+    return tuple(ok) or ("campaign",)
 
 
 class MetaAdsConnector:
@@ -33,6 +90,25 @@ class MetaAdsConnector:
     def __init__(self, ctx: ConnectorContext, repo):
         self.ctx = ctx
         self.repo = repo
+        self._client: httpx.AsyncClient | None = None
+        self._proof_cache: tuple[str, str, str] | None = None
+        self._action_kinds: dict[str, int] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # One pooled client per connector instance so paging and the per-level
+        # insights calls reuse the same TLS connection.
+        if self._client is None or self._client.is_closed:
+            timeout = float(self.ctx.config.get("http_timeout_sec", 30.0))
+            self._client = httpx.AsyncClient(
+                timeout=timeout,
+                limits=httpx.Limits(max_keepalive_connections=8),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _account_id(self) -> str:
         # Prefer env for single-operator simplicity; allow per-connector override.
@@ -41,11 +117,15 @@ class MetaAdsConnector:
             raw = str(self.ctx.config.get("ad_account_id") or "").strip()
         raw = raw.removeprefix("act_").strip()
         # keep digits only (UI sometimes includes separators)
-        return re.sub(r"\D+", "", raw)
+        return _NON_DIGIT_RE.sub("", raw)
 
+    # Env/config-derived values below are read once per connector instance
+    # (the worker builds a fresh connector every tick).
+    @cached_property
     def _graph_base_url(self) -> str:
         return (os.getenv("META_GRAPH_BASE_URL") or "https://graph.facebook.com").strip().rstrip("/")
 
+    @cached_property
     def _graph_version(self) -> str:
         v = (os.getenv("META_GRAPH_API_VERSION") or "").strip()
         return v if v else "v21.0"
@@ -60,51 +140,110 @@ class MetaAdsConnector:
         token = self._access_token()
         if not app_secret or not token:
             return None
+        cached = self._proof_cache
+        if cached is not None and cached[0] == app_secret and cached[1] == token:
+            return cached[2]
         digest = hmac.new(
             app_secret.encode("utf-8", errors="strict"),
             token.encode("utf-8", errors="strict"),
             hashlib.sha256,
         ).hexdigest()
+        self._proof_cache = (app_secret, token, digest)
         return digest
 
-    def _safe_levels(self, raw: Any) -> list[str]:
+    def _safe_levels(self, raw: Any) -> tuple[str, ...]:
+        # Same connector config is sanitized on every sync; memoize on a hashable key.
         if isinstance(raw, list):
-            levels = [str(x).strip().lower() for x in raw]
-        elif isinstance(raw, str) and raw.strip():
-            levels = [s.strip().lower() for s in raw.split(",")]
-        else:
-            levels = ["campaign", "adset"]
-        ok: list[str] = []
-        for lv in levels:
-            if lv in {"campaign", "adset", "ad"} and lv not in ok:
-                ok.append(lv)
-        return ok or ["campaign"]
+            return _safe_levels_cached(tuple(str(x) for x in raw))
+        if isinstance(raw, str):
+            return _safe_levels_cached(raw)
+        return _DEFAULT_LEVELS
 
     def _to_float(self, v: Any) -> float:
+        # Graph returns numerics as strings ("1,234.5"); take native numbers as-is.
+        if v is None:
+            return 0.0
+        tv = type(v)
+        if tv is float:
+            return v
+        if tv is int:
+            return float(v)
         try:
-            return float(str(v).replace(",", "")) if v is not None else 0.0
+            return float(v.replace(",", "")) if tv is str else float(str(v).replace(",", ""))
         except Exception:
             return 0.0
 
     def _to_int(self, v: Any) -> int:
+        if v is None:
+            return 0
+        tv = type(v)
+        if tv is int:
+            return v
         try:
-            return int(float(str(v).replace(",", ""))) if v is not None else 0
+            if tv is str:
+                return int(v) if v.isdigit() else int(float(v.replace(",", "")))
+            return int(float(str(v).replace(",", "")))
         except Exception:
             return 0
 
-    def _action_map(self, items: Any) -> dict[str, float]:
+    @cached_property
+    def _purchase_action_set(self) -> frozenset[str]:
+        return frozenset(self._purchase_action_types)
+
+    def _classify_action(self, t: str) -> int:
+        # Classified once per connector and cached in _action_kinds; types repeat on every row.
+        kind = 0
+        if t == "offsite_conversion":
+            kind |= _KIND_OFFSITE_AGG
+        elif t[:19] == "offsite_conversion.":
+            kind |= _KIND_OFFSITE_GRANULAR
+        if t in self._purchase_action_set:
+            kind |= _KIND_PURCHASE
+        self._action_kinds[t] = kind
+        return kind
+
+    def _action_totals(
+        self, items: Any, keep_map: bool = True
+    ) -> tuple[dict[str, float], float, float, float]:
+        """
+        Walk an actions/action_values list once.
+
+        Returns (per-type map, "offsite_conversion" aggregate, sum of granular
+        "offsite_conversion.*" types, sum of purchase types). The per-type map is
+        left empty when `keep_map` is false.
+        """
         out: dict[str, float] = {}
+        offsite_agg = 0.0
+        offsite_sum = 0.0
+        purchase = 0.0
         if not isinstance(items, list):
-            return out
+            return out, offsite_agg, offsite_sum, purchase
+        to_float = self._to_float
+        get = out.get
+        kinds = self._action_kinds
         for it in items:
             if not isinstance(it, dict):
                 continue
             t = str(it.get("action_type") or "").strip()
             if not t:
                 continue
-            out[t] = out.get(t, 0.0) + self._to_float(it.get("value"))
-        return out
-
+            v = to_float(it.get("value"))
+            if keep_map:
+                out[t] = get(t, 0.0) + v
+            kind = kinds.get(t)
+            if kind is None:
+                kind = self._classify_action(t)
+            if not kind:
+                continue
+            if kind & _KIND_OFFSITE_AGG:
+                offsite_agg += v
+            elif kind & _KIND_OFFSITE_GRANULAR:
+                offsite_sum += v
+            if kind & _KIND_PURCHASE:
+                purchase += v
+        return out, offsite_agg, offsite_sum, purchase
+
+    @cached_property
     def _purchase_action_types(self) -> list[str]:
         raw = self.ctx.config.get("conversion_action_types")
         if isinstance(raw, list):
@@ -112,12 +251,7 @@ class MetaAdsConnector:
         elif isinstance(raw, str) and raw.strip():
             lst = [s.strip() for s in raw.split(",") if s.strip()]
         else:
-            # Reasonable defaults for ecommerce. Users can override per account.
-            lst = [
-                "purchase",
-                "omni_purchase",
-                "offsite_conversion.fb_pixel_purchase",
-            ]
+            return list(_DEFAULT_PURCHASE_ACTION_TYPES)
         # keep stable order + uniqueness
         out: list[str] = []
         for x in lst:
@@ -125,49 +259,132 @@ class MetaAdsConnector:
                 out.append(x)
         return out
 
-    async def _iter_graph_data(self, *, path: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+    def _etag_key(self, url: httpx.URL) -> str:
+        # Key on the request minus credentials so token rotation doesn't bust the cache.
+        bare = _without_credentials(url)
+        digest = hashlib.blake2b(f"{self.ctx.connector_id}|{bare}".encode("utf-8"), digest_size=8).hexdigest()
+        return f"meta:etag:{digest}"
+
+    async def _iter_graph_pages(
+        self,
+        *,
+        path: str,
+        params: dict[str, Any],
+        conditional: bool = False,
+        etags: dict[str, str | None] | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
         """
-        Return full data list for a Graph API collection endpoint with cursor pagination.
-
-        We keep it simple (one call site per connector tick) and avoid adding extra deps.
+        Yield each page's data list for a Graph API collection endpoint with cursor pagination.
+
+        Only one page is held at a time, so callers can write as they go.
+        With conditional=True each page is fetched with If-None-Match; a 304 page
+        contributes no rows (it is unchanged since the last sync) and paging continues
+        from the cursor remembered alongside its ETag. New ETags are only collected
+        into `etags` (None marks an unchanged 304 page); the caller persists them with
+        `_commit_etags` once its writes for the pages have succeeded.
         """
-        base = self._graph_base_url()
-        ver = self._graph_version()
+        if conditional and etags is None:
+            raise ValueError("conditional paging needs an etags collector")
+        base = self._graph_base_url
+        ver = self._graph_version
         token = self._access_token()
         if not token:
-            return []
+            return
 
-        p = dict(params)
-        p["access_token"] = token
         proof = self._appsecret_proof()
-        if proof:
-            p["appsecret_proof"] = proof
+        creds = {"access_token": token, "appsecret_proof": proof} if proof else {"access_token": token}
+        p = {**params, **creds}
 
         url: str | None = f"{base}/{ver}/{path.lstrip('/')}"
+        client = self._get_client()
+        next_params: dict[str, Any] | None = p
+        while url:
+            headers: dict[str, str] = {}
+            cached: dict[str, Any] = {}
+            etag_key = ""
+            if conditional:
+                etag_key = self._etag_key(httpx.URL(url, params=next_params))
+                raw = self.repo.get_meta(etag_key)
+                if raw:
+                    try:
+                        cached = json.loads(raw)
+                    except ValueError:
+                        cached = {}
+                if cached.get("etag"):
+                    headers["If-None-Match"] = str(cached["etag"])
+            r = await client.get(url, params=next_params, headers=headers or None)
+            if r.status_code == 304 and cached:
+                etags[etag_key] = None
+                # The remembered cursor is stored without credentials; re-attach current ones.
+                next_url = cached.get("next")
+                url = str(httpx.URL(next_url).copy_merge_params(creds)) if next_url else None
+                next_params = None
+                continue
+            try:
+                # Parse the raw body; json.loads detects UTF-8 itself, so the
+                # str decode that r.json()/r.text would do is skipped.
+                obj = json.loads(r.content)
+            except Exception as e:  # noqa: BLE001
+                raise RuntimeError(f"Meta Graph API non-JSON response: {r.status_code}") from e
+            if isinstance(obj, dict) and obj.get("error"):
+                err = obj.get("error") or {}
+                msg = str(err.get("message") or "unknown error")
+                code = err.get("code")
+                raise RuntimeError(f"Meta Graph API error: {msg} (code={code})")
+            data = obj.get("data") if isinstance(obj, dict) else None
+            page = [it for it in data if isinstance(it, dict)] if isinstance(data, list) else []
+            paging = obj.get("paging") if isinstance(obj, dict) else None
+            next_url = paging.get("next") if isinstance(paging, dict) else None
+            url = str(next_url) if next_url else None
+            next_params = None  # next URL already includes query params.
+            if conditional:
+                etag = r.headers.get("etag")
+                bare_next = str(_without_credentials(httpx.URL(url))) if url else None
+                # "" marks a changed page that came back without an ETag (forget it).
+                etags[etag_key] = json.dumps({"etag": etag, "next": bare_next}, ensure_ascii=True) if etag else ""
+            if page:
+                yield page
+
+    def _commit_etags(self, path: str, etags: dict[str, str | None]) -> None:
+        """
+        Persist the ETags collected for one full pass over `path` and drop the ones
+        from earlier passes that this pass no longer reached (cursors change as the
+        collection changes), so meta:etag:* rows stay bounded by the live pages.
+        """
+        index_key = f"meta:etag-index:{self.ctx.connector_id}:{path}"
+        try:
+            previous = json.loads(self.repo.get_meta(index_key) or "[]")
+        except ValueError:
+            previous = []
+        live = {k for k, v in etags.items() if v != ""}
+        values = {k: v for k, v in etags.items() if v}
+        values[index_key] = json.dumps(sorted(live), ensure_ascii=True)
+        stale = {k for k in previous if k not in live} | (etags.keys() - live)
+        self.repo.update_meta_bulk(values, delete=stale)
+
+    async def _iter_graph_data(
+        self,
+        *,
+        path: str,
+        params: dict[str, Any],
+        conditional: bool = False,
+        etags: dict[str, str | None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Return full data list for a Graph API collection endpoint with cursor pagination.
+
+        We keep it simple (one call site per connector tick) and avoid adding extra deps.
+        For conditional fetches, pass `etags` and call `_commit_etags` after writing the
+        rows; without it the ETags are committed once every page has been fetched.
+        """
+        own_etags = conditional and etags is None
+        if own_etags:
+            etags = {}
         out: list[dict[str, Any]] = []
-        timeout = float(self.ctx.config.get("http_timeout_sec", 30.0))
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            next_params: dict[str, Any] | None = p
-            while url:
-                r = await client.get(url, params=next_params)
-                try:
-                    obj = r.json()
-                except Exception as e:  # noqa: BLE001
-                    raise RuntimeError(f"Meta Graph API non-JSON response: {r.status_code}") from e
-                if isinstance(obj, dict) and obj.get("error"):
-                    err = obj.get("error") or {}
-                    msg = str(err.get("message") or "unknown error")
-                    code = err.get("code")
-                    raise RuntimeError(f"Meta Graph API error: {msg} (code={code})")
-                data = obj.get("data") if isinstance(obj, dict) else None
-                if isinstance(data, list):
-                    for it in data:
-                        if isinstance(it, dict):
-                            out.append(it)
-                paging = obj.get("paging") if isinstance(obj, dict) else None
-                next_url = paging.get("next") if isinstance(paging, dict) else None
-                url = str(next_url) if next_url else None
-                next_params = None  # next URL already includes query params.
+        async for page in self._iter_graph_pages(path=path, params=params, conditional=conditional, etags=etags):
+            out.extend(page)
+        if own_etags:
+            self._commit_etags(path, etags)
         return out
 
     async def health_check(self) -> tuple[bool, str | None]:
@@ -198,12 +415,16 @@ class MetaAdsConnector:
             want_ads = "ad" in levels
 
             if want_campaigns:
+                path = f"act_{account_id}/campaigns"
+                etags: dict[str, str | None] = {}
                 camps = await self._iter_graph_data(
-                    path=f"act_{account_id}/campaigns",
+                    path=path,
                     params={
                         "fields": "id,name,status,effective_status,objective",
                         "limit": 200,
                     },
+                    conditional=True,
+                    etags=etags,
                 )
                 for c in camps:
                     cid = str(c.get("id") or "").strip()
@@ -221,14 +442,21 @@ class MetaAdsConnector:
                         status=status,
                         meta_json={"source": "meta_graph_api", "objective": c.get("objective")},
                     )
+                # Commit ETags only after the rows are written: a 304 page is skipped on
+                # later syncs, so its ETag must not outlive a failed write.
+                self._commit_etags(path, etags)
 
             if want_adsets:
+                path = f"act_{account_id}/adsets"
+                etags = {}
                 adsets = await self._iter_graph_data(
-                    path=f"act_{account_id}/adsets",
+                    path=path,
                     params={
                         "fields": "id,name,status,effective_status,campaign_id",
                         "limit": 200,
                     },
+                    conditional=True,
+                    etags=etags,
                 )
                 for s in adsets:
                     sid = str(s.get("id") or "").strip()
@@ -247,14 +475,19 @@ class MetaAdsConnector:
                         status=status,
                         meta_json={"source": "meta_graph_api"},
                     )
+                self._commit_etags(path, etags)
 
             if want_ads:
+                path = f"act_{account_id}/ads"
+                etags = {}
                 ads = await self._iter_graph_data(
-                    path=f"act_{account_id}/ads",
+                    path=path,
                     params={
                         "fields": "id,name,status,effective_status,campaign_id,adset_id",
                         "limit": 200,
                     },
+                    conditional=True,
+                    etags=etags,
                 )
                 for a in ads:
                     aid = str(a.get("id") or "").strip()
@@ -273,20 +506,23 @@ class MetaAdsConnector:
                         status=status,
                         meta_json={"source": "meta_graph_api", "campaign_id": a.get("campaign_id")},
                     )
+                self._commit_etags(path, etags)
             return
         d = fixture_dir(self.ctx.platform, self.ctx.config)
-        for e in load_entities(d):
-            self.repo.upsert_entity(
-                platform=e.get("platform") or self.ctx.platform,
-                account_id=e.get("account_id"),
-                entity_type=e.get("entity_type") or "",
-                entity_id=e.get("entity_id") or "",
-                parent_type=e.get("parent_type"),
-                parent_id=e.get("parent_id"),
-                name=e.get("name"),
-                status=e.get("status"),
-                meta_json=e.get("meta_json") or {},
-            )
+        self.repo.upsert_entities_bulk(
+            {
+                "platform": e.get("platform") or self.ctx.platform,
+                "account_id": e.get("account_id"),
+                "entity_type": e.get("entity_type") or "",
+                "entity_id": e.get("entity_id") or "",
+                "parent_type": e.get("parent_type"),
+                "parent_id": e.get("parent_id"),
+                "name": e.get("name"),
+                "status": e.get("status"),
+                "meta_json": e.get("meta_json") or {},
+            }
+            for e in load_entities(d)
+        )
 
     async def fetch_metrics_daily(self, date_from: str, date_to: str) -> None:
         mode = str(self.ctx.config.get("mode", "import")).strip().lower()
@@ -295,27 +531,21 @@ class MetaAdsConnector:
         d0 = date.fromisoformat(date_from)
         d1 = date.fromisoformat(date_to)
         if mode == "fixture":
+            # ISO-8601 dates order lexicographically, so compare strings instead of parsing per row.
+            date_from_s = d0.isoformat()
+            date_to_s = d1.isoformat()
             d = fixture_dir(self.ctx.platform, self.ctx.config)
+            rows: list[dict[str, Any]] = []
             for row in load_metrics_daily_rows(d):
-                day = str(row.get("date") or "")
+                day = row.pop("date")
                 if not day:
                     continue
-                dd = date.fromisoformat(day)
-                if dd < d0 or dd > d1:
+                if not (date_from_s <= day <= date_to_s):
                     continue
-                self.repo.upsert_metric_daily(
-                    platform=row.get("platform") or self.ctx.platform,
-                    account_id=row.get("account_id"),
-                    entity_type=row.get("entity_type") or "",
-                    entity_id=row.get("entity_id") or "",
-                    day=day,
-                    spend=row.get("spend"),
-                    impressions=row.get("impressions"),
-                    clicks=row.get("clicks"),
-                    conversions=row.get("conversions"),
-                    conversion_value=row.get("conversion_value"),
-                    metrics_json=row.get("metrics_json") or {},
-                )
+                row["day"] = day
+                row["platform"] = row["platform"] or self.ctx.platform
+                rows.append(row)
+            self.repo.upsert_metrics_daily_bulk(rows)
             return
 
         if mode != "api":
@@ -348,152 +578,137 @@ class MetaAdsConnector:
             return
 
         levels = self._safe_levels(self.ctx.config.get("ingest_levels"))
-        purchase_types = self._purchase_action_types()
+        purchase_types = self._purchase_action_types
+        store_raw_actions = bool(self.ctx.config.get("store_raw_actions", False))
+
+        # Levels hit independent insights cursors, so page them concurrently.
+        # DB writes are synchronous and happen between awaits, so they never interleave.
+        sem = asyncio.Semaphore(max(1, int(self.ctx.config.get("api_level_concurrency", 3))))
 
         async def ingest_level(lv: str) -> None:
-            fields = [
-                "date_start",
-                "date_stop",
-                "account_id",
-                "spend",
-                "impressions",
-                "clicks",
-                "actions",
-                "action_values",
-            ]
-            if lv == "campaign":
-                fields.extend(["campaign_id", "campaign_name"])
-            elif lv == "adset":
-                fields.extend(["campaign_id", "adset_id", "adset_name"])
-            else:
-                fields.extend(["campaign_id", "adset_id", "ad_id", "ad_name"])
-
-            rows = await self._iter_graph_data(
+            async with sem:
+                await _ingest_level(lv)
+
+        async def _ingest_level(lv: str) -> None:
+            pages = self._iter_graph_pages(
                 path=f"act_{account_id}/insights",
                 params={
                     "level": lv,
                     "time_increment": 1,
-                    "fields": ",".join(fields),
+                    "fields": _FIELDS_BY_LEVEL[lv],
                     "time_range[since]": d0.isoformat(),
                     "time_range[until]": d1.isoformat(),
                     "limit": 5000,
                 },
             )
 
-            for r in rows:
-                day = str(r.get("date_start") or "").strip()
-                if not day:
-                    continue
-                # ID/name columns depend on level
-                if lv == "campaign":
-                    entity_id = str(r.get("campaign_id") or "").strip()
-                    name = str(r.get("campaign_name") or "").strip() or None
-                    parent_type = None
-                    parent_id = None
-                elif lv == "adset":
-                    entity_id = str(r.get("adset_id") or "").strip()
-                    name = str(r.get("adset_name") or "").strip() or None
-                    parent_id = str(r.get("campaign_id") or "").strip() or None
-                    parent_type = "campaign" if parent_id else None
-                else:
-                    entity_id = str(r.get("ad_id") or "").strip()
-                    name = str(r.get("ad_name") or "").strip() or None
-                    parent_id = str(r.get("adset_id") or "").strip() or None
-                    parent_type = "adset" if parent_id else None
-                if not entity_id:
-                    continue
+            action_totals = self._action_totals
+            # ID/name columns depend on level; resolve them once per level.
+            eid_key, name_key, pid_key, level_parent_type = _LEVEL_KEYS[lv]
+            written: set[str] = set()
+            async for rows in pages:
+                entity_rows: dict[str, dict[str, Any]] = {}
+                metric_rows: list[dict[str, Any]] = []
+                for r in rows:
+                    day = str(r.get("date_start") or "").strip()
+                    if not day:
+                        continue
+                    entity_id = str(r.get(eid_key) or "").strip()
+                    if not entity_id:
+                        continue
+                    name = str(r.get(name_key) or "").strip() or None
+                    parent_id = (str(r.get(pid_key) or "").strip() or None) if pid_key else None
+                    parent_type = level_parent_type if parent_id else None
+
+                    spend = self._to_float(r.get("spend"))
+                    impressions = self._to_int(r.get("impressions"))
+                    clicks = self._to_int(r.get("clicks"))
+                    actions, conv_all, conv_offsite, conv_purchase = action_totals(
+                        r.get("actions"), store_raw_actions
+                    )
+                    action_values, value_all, value_offsite, value_purchase = action_totals(
+                        r.get("action_values"), store_raw_actions
+                    )
 
-                spend = self._to_float(r.get("spend"))
-                impressions = self._to_int(r.get("impressions"))
-                clicks = self._to_int(r.get("clicks"))
-                actions = self._action_map(r.get("actions"))
-                action_values = self._action_map(r.get("action_values"))
-
-                # "All" conversions: if Meta provides an aggregate, use it.
-                conv_all = float(actions.get("offsite_conversion") or 0.0)
-                value_all = float(action_values.get("offsite_conversion") or 0.0)
-                if conv_all <= 0:
-                    # fallback: sum any granular offsite conversion actions.
-                    conv_all = sum(v for k, v in actions.items() if k.startswith("offsite_conversion."))
-                if value_all <= 0:
-                    value_all = sum(v for k, v in action_values.items() if k.startswith("offsite_conversion."))
-
-                conv_purchase = sum(actions.get(t, 0.0) for t in purchase_types)
-                value_purchase = sum(action_values.get(t, 0.0) for t in purchase_types)
-
-                self.repo.upsert_entity(
-                    platform=self.ctx.platform,
-                    account_id=account_id,
-                    entity_type=lv,
-                    entity_id=entity_id,
-                    parent_type=parent_type,
-                    parent_id=parent_id,
-                    name=name,
-                    status=None,
-                    meta_json={"source": "meta_graph_api"},
-                )
+                    # "All" conversions: if Meta provides an aggregate, use it;
+                    # otherwise fall back to the granular offsite conversion actions.
+                    if conv_all <= 0:
+                        conv_all = conv_offsite
+                    if value_all <= 0:
+                        value_all = value_offsite
 
-                self.repo.upsert_metric_daily(
-                    platform=self.ctx.platform,
-                    account_id=account_id,
-                    entity_type=lv,
-                    entity_id=entity_id,
-                    day=day,
-                    spend=spend,
-                    impressions=impressions,
-                    clicks=clicks,
-                    conversions=conv_purchase,
-                    conversion_value=value_purchase,
-                    metrics_json={
+                    metrics_json: dict[str, Any] = {
                         "source": "meta_graph_api",
                         "conversions_all": conv_all,
                         "conversion_value_all": value_all,
                         "conversions_purchase": conv_purchase,
                         "conversion_value_purchase": value_purchase,
-                        # Keep raw maps for later tuning without re-pulling.
-                        "actions": actions,
-                        "action_values": action_values,
                         "purchase_action_types": purchase_types,
-                    },
-                )
+                    }
+                    if store_raw_actions:
+                        # Raw maps allow re-tuning purchase types without re-pulling, at the
+                        # cost of much larger rows at ad level.
+                        metrics_json["actions"] = actions
+                        metrics_json["action_values"] = action_values
+
+                    # One entity row per id; within a page the last row wins, and ids
+                    # already written from an earlier page are not rewritten.
+                    if entity_id not in written:
+                        entity_rows[entity_id] = {
+                            "platform": self.ctx.platform,
+                            "account_id": account_id,
+                            "entity_type": lv,
+                            "entity_id": entity_id,
+                            "parent_type": parent_type,
+                            "parent_id": parent_id,
+                            "name": name,
+                            "status": None,
+                            "meta_json": _META_SOURCE_JSON,
+                        }
+                    metric_rows.append(
+                        {
+                            "platform": self.ctx.platform,
+                            "account_id": account_id,
+                            "entity_type": lv,
+                            "entity_id": entity_id,
+                            "day": day,
+                            "spend": spend,
+                            "impressions": impressions,
+                            "clicks": clicks,
+                            "conversions": conv_purchase,
+                            "conversion_value": value_purchase,
+                            "metrics_json": metrics_json,
+                        }
+                    )
 
-        for lv in levels:
-            await ingest_level(lv)
+                # Flush per page so only one page of rows is buffered per level.
+                self.repo.upsert_entities_bulk(entity_rows.values())
+                self.repo.upsert_metrics_daily_bulk(metric_rows)
+                written.update(entity_rows)
 
-        self.repo.set_meta(key, datetime.now().astimezone().replace(microsecond=0).isoformat())
+        # TaskGroup cancels the other levels when one fails, so a failed tick stops writing.
+        async with asyncio.TaskGroup() as tg:
+            for lv in levels:
+                tg.create_task(ingest_level(lv))
+
+        self.repo.set_meta(key, now_utc_iso())
 
     async def fetch_metrics_intraday(self, day: str) -> None:
         mode = str(self.ctx.config.get("mode", "import")).strip().lower()
         if mode != "fixture":
             return
         d = fixture_dir(self.ctx.platform, self.ctx.config)
+        rows: list[dict[str, Any]] = []
         for row in load_metrics_intraday_rows(d):
-            hour_ts = str(row.get("hour_ts") or "")
+            hour_ts = row["hour_ts"]
             if not hour_ts.startswith(day):
                 continue
-            self.repo.upsert_metric_intraday(
-                platform=row.get("platform") or self.ctx.platform,
-                account_id=row.get("account_id"),
-                entity_type=row.get("entity_type") or "",
-                entity_id=row.get("entity_id") or "",
-                hour_ts=hour_ts,
-                spend=row.get("spend"),
-                impressions=row.get("impressions"),
-                clicks=row.get("clicks"),
-                conversions=row.get("conversions"),
-                conversion_value=row.get("conversion_value"),
-                metrics_json=row.get("metrics_json") or {},
-            )
+            row["platform"] = row["platform"] or self.ctx.platform
+            rows.append(row)
+        self.repo.upsert_metrics_intraday_bulk(rows)
 
     async def apply_action(self, proposal: dict) -> dict:
         mode = str(self.ctx.config.get("mode", "import")).strip().lower()
         if mode in {"import", "fixture"}:
-            return {
-                "simulated": True,
-                "mode": mode,
-                "platform": self.ctx.platform,
-                "action_type": proposal.get("action_type"),
-                "entity_type": proposal.get("entity_type"),
-                "entity_id": proposal.get("entity_id"),
-            }
+            return simulated_result(mode, self.ctx.platform, proposal)
         raise NotImplementedError
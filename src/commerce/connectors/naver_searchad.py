@@ -1,19 +1,23 @@
 from __future__ import annotations
 
-import base64
+import asyncio
+import binascii
 import csv
 import hashlib
 import hmac
+import itertools
 import json
 import os
 import time
-from datetime import date, datetime, timedelta
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Any
 from zoneinfo import ZoneInfo
 
 import httpx
 
-from commerce.connectors.base import ConnectorCapabilities, ConnectorContext
+from commerce.connectors.base import ConnectorCapabilities, ConnectorContext, proposal_payload, simulated_result
 from commerce.fixtures import (
     fixture_dir,
     load_entities,
@@ -35,9 +39,44 @@ _AD_DETAIL_COLUMNS = [
 
 _KNOWN_HEADER_NAMES = {"nccCampaignId", "impCnt", "clkCnt", "ccnt", "salesAmt"}
 
+# Report column candidates per field (header names vary by reportTp; keep heuristics broad).
+_CAMP_ID_KEYS = ("nccCampaignId", "Campaign ID", "캠페인ID", "캠페인 ID")
+_CAMP_NAME_KEYS = ("campaignName", "Campaign", "Campaign name", "캠페인", "캠페인명")
+_GRP_ID_KEYS = ("nccAdgroupId", "Adgroup ID", "Ad group ID", "광고그룹ID", "광고그룹 ID", "그룹ID")
+_GRP_NAME_KEYS = ("adgroupName", "Adgroup", "Ad group", "광고그룹", "광고그룹명")
+_KW_ID_KEYS = ("nccKeywordId", "Keyword ID", "키워드ID", "키워드 ID")
+_KW_NAME_KEYS = ("keyword", "Keyword", "키워드", "키워드명")
+_AD_ID_KEYS = ("nccAdId", "Ad ID", "광고ID", "광고 ID")
+_AD_NAME_KEYS = ("adName", "Ad", "Ad name", "광고", "광고명")
+
+_IMPR_KEYS = ("impCnt", "Impressions", "노출수", "노출 수")
+_CLICK_KEYS = ("clkCnt", "Clicks", "클릭수", "클릭 수")
+_SPEND_KEYS = ("salesAmt", "cost", "Cost", "총비용", "총 비용", "비용", "광고비", "spend")
+_CPC_KEYS = ("cpc", "CPC", "평균CPC", "평균 CPC")
+
+_CONV_ALL_KEYS = ("ccnt", "Conversions", "전환수", "전환 수", "전체전환수", "전체 전환수")
+_CONV_PURCHASE_KEYS = ("구매전환수", "구매 전환수", "구매수", "구매 수")
+_VALUE_ALL_KEYS = ("drtConvValue", "Conv. value", "전환매출", "전환 매출", "전환가치", "전환 가치", "매출")
+_VALUE_PURCHASE_KEYS = ("구매전환매출", "구매 전환매출", "구매금액", "구매 금액", "구매매출", "구매 매출")
+
+# Positions in the per-entity rollup list built by _ingest_report_rows.
+_AGG_SPEND = 0
+_AGG_IMPRESSIONS = 1
+_AGG_CLICKS = 2
+_AGG_CONVERSIONS = 3
+_AGG_CONVERSION_VALUE = 4
+_AGG_CONV_ALL = 5
+_AGG_VALUE_ALL = 6
+_AGG_CONV_PURCHASE = 7
+_AGG_VALUE_PURCHASE = 8
+
 
 def _read_text_best_effort(data: bytes) -> str:
-    for enc in ("utf-8-sig", "utf-8", "cp949"):
+    # Decode at most twice: ASCII (the common case for AD_DETAIL) needs no
+    # guessing, and "utf-8-sig" already covers BOM-less UTF-8.
+    if data.isascii():
+        return data.decode("ascii")
+    for enc in ("utf-8-sig", "cp949"):
         try:
             return data.decode(enc)
         except UnicodeDecodeError:
@@ -48,10 +87,21 @@ def _read_text_best_effort(data: bytes) -> str:
 def _parse_float(v: Any) -> float | None:
     if v is None:
         return None
-    s = str(v).strip()
+    if type(v) is str:
+        if not v:
+            return None
+        # Fast path: plain digit runs (float() tolerates surrounding whitespace).
+        try:
+            return float(v)
+        except ValueError:
+            pass
+        s = v.strip()
+    else:
+        s = str(v).strip()
     if s == "":
         return None
-    s = s.replace(",", "")
+    if "," in s:
+        s = s.replace(",", "")
     try:
         return float(s)
     except ValueError:
@@ -65,36 +115,79 @@ def _parse_int(v: Any) -> int | None:
     return int(f)
 
 
-def _first(row: dict[str, Any], keys: list[str]) -> str | None:
-    for k in keys:
-        if k in row and str(row.get(k) or "").strip() != "":
-            return str(row.get(k)).strip()
-    return None
+def _make_first(idx: list[int]) -> Callable[[list[str]], str | None]:
+    """Build a reader returning the first non-blank cell among column positions `idx` (stripped)."""
+    ix = tuple(idx)
+
+    if not ix:
+        return lambda row: None
+
+    if len(ix) == 1:
+        (i,) = ix
+
+        def first_one(row: list[str]) -> str | None:
+            try:
+                s = row[i].strip()
+            except IndexError:
+                return None
+            return s or None
+
+        return first_one
+
+    def first(row: list[str]) -> str | None:
+        for i in ix:
+            try:
+                s = row[i].strip()
+            except IndexError:
+                continue
+            if s:
+                return s
+        return None
+
+    return first
 
 
 def _daterange_inclusive(date_from: str, date_to: str) -> list[str]:
-    d0 = date.fromisoformat(date_from)
-    d1 = date.fromisoformat(date_to)
-    if d1 < d0:
-        d0, d1 = d1, d0
-    out: list[str] = []
-    cur = d0
-    while cur <= d1:
-        out.append(cur.isoformat())
-        cur = cur + timedelta(days=1)
-    return out
+    o0 = date.fromisoformat(date_from).toordinal()
+    o1 = date.fromisoformat(date_to).toordinal()
+    if o1 < o0:
+        o0, o1 = o1, o0
+    return [date.fromordinal(o).isoformat() for o in range(o0, o1 + 1)]
 
 
 def _to_stat_dt(day_iso: str) -> str:
     return day_iso.replace("-", "")
 
 
+# pause_entity target per entity_type: (resource path, id key in the PUT body).
+_PAUSE_TARGETS: dict[str, tuple[str, str]] = {
+    "campaign": ("/ncc/campaigns", "nccCampaignId"),
+    "adgroup": ("/ncc/adgroups", "nccAdgroupId"),
+    "keyword": ("/ncc/keywords", "nccKeywordId"),
+}
+_USER_LOCK_FIELDS = {"fields": "userLock"}
+
+
+def _sid(d: dict, key: str) -> str:
+    v = d.get(key)
+    if type(v) is str:
+        return v.strip()
+    return str(v).strip() if v else ""
+
+
 def _to_day_iso(stat_dt: str) -> str:
     if len(stat_dt) == 8 and stat_dt.isdigit():
         return f"{stat_dt[0:4]}-{stat_dt[4:6]}-{stat_dt[6:8]}"
     return stat_dt
 
 
+_LEVEL_CAMPAIGN = 1
+_LEVEL_ADGROUP = 2
+_LEVEL_KEYWORD = 4
+_LEVEL_AD = 8
+_LEVEL_BITS = {"campaign": _LEVEL_CAMPAIGN, "adgroup": _LEVEL_ADGROUP, "keyword": _LEVEL_KEYWORD, "ad": _LEVEL_AD}
+
+
 def _safe_levels(raw: Any) -> list[str]:
     if isinstance(raw, list):
         levels = [str(x).strip().lower() for x in raw]
@@ -104,29 +197,59 @@ def _safe_levels(raw: Any) -> list[str]:
         levels = ["campaign"]
     ok: list[str] = []
     for lv in levels:
-        if lv in {"campaign", "adgroup", "keyword", "ad"} and lv not in ok:
+        if lv in _LEVEL_BITS and lv not in ok:
             ok.append(lv)
     return ok or ["campaign"]
 
 
+def _level_mask(levels: list[str]) -> int:
+    mask = 0
+    for lv in levels:
+        mask |= _LEVEL_BITS[lv]
+    return mask
+
+
+@lru_cache(maxsize=256)
+def _sign(secret: bytes, timestamp_ms: str, method: str, uri: str) -> str:
+    msg = f"{timestamp_ms}.{method}.{uri}"
+    digest = hmac.new(secret, msg.encode("utf-8", errors="strict"), hashlib.sha256).digest()
+    return binascii.b2a_base64(digest, newline=False).decode("ascii")
+
+
 class _NaverSearchAdClient:
     def __init__(self, *, base_url: str, api_key: str, secret_key: str, customer_id: str):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.secret_key = secret_key
         self.customer_id = customer_id
+        self._secret_bytes = secret_key.encode("utf-8", errors="strict")
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> _NaverSearchAdClient:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # One pooled client per run: report create/poll/download hit the same
+        # hosts repeatedly, so keep-alive avoids a TCP+TLS handshake per call.
+        if self._client is None:
+            self._client = httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=8))
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
 
     def _signature(self, timestamp_ms: str, method: str, uri: str) -> str:
-        msg = f"{timestamp_ms}.{method}.{uri}"
-        digest = hmac.new(
-            self.secret_key.encode("utf-8", errors="strict"),
-            msg.encode("utf-8", errors="strict"),
-            hashlib.sha256,
-        ).digest()
-        return base64.b64encode(digest).decode("ascii", errors="strict")
+        return _sign(self._secret_bytes, timestamp_ms, method, uri)
 
     def _headers(self, method: str, uri: str) -> dict[str, str]:
-        ts = str(int(time.time() * 1000))
+        # Second granularity is well inside Naver's timestamp skew window and lets
+        # requests within the same second (e.g. report polls) reuse one signature.
+        ts = str(int(time.time()) * 1000)
         return {
             "Content-Type": "application/json; charset=UTF-8",
             "X-Timestamp": ts,
@@ -146,15 +269,14 @@ class _NaverSearchAdClient:
     ) -> Any:
         url = f"{self.base_url}{uri}"
         headers = self._headers(method, uri)
-        async with httpx.AsyncClient() as client:
-            r = await client.request(
-                method,
-                url,
-                params=params,
-                json=json_body,
-                headers=headers,
-                timeout=timeout,
-            )
+        r = await self._get_client().request(
+            method,
+            url,
+            params=params,
+            json=json_body,
+            headers=headers,
+            timeout=timeout,
+        )
         if r.status_code // 100 != 2:
             body = (r.text or "").strip()
             body = body[:4000]
@@ -162,25 +284,28 @@ class _NaverSearchAdClient:
         if not r.content:
             return None
         try:
-            return r.json()
-        except Exception:
+            # json.loads detects UTF-8/16/32 from bytes; skips httpx's text decode.
+            return json.loads(r.content)
+        except ValueError:
             return r.text
 
+    async def request_dict(self, **kwargs: Any) -> dict[str, Any]:
+        """`request_json` for endpoints that answer with one object; anything else reads as {}."""
+        data = await self.request_json(**kwargs)
+        return data if isinstance(data, dict) else {}
+
     async def download_report(self, download_url: str) -> bytes:
         # Per official samples, report download signatures use a fixed uri.
         headers = self._headers("GET", "/report-download")
-        async with httpx.AsyncClient() as client:
-            r = await client.get(download_url, headers=headers, timeout=120)
+        r = await self._get_client().get(download_url, headers=headers, timeout=120)
         if r.status_code // 100 != 2:
             body = (r.text or "").strip()
             body = body[:4000]
             raise RuntimeError(f"Naver report download failed: {r.status_code} {body}")
-        return bytes(r.content)
+        return r.content
 
 
 async def _sleep(seconds: float) -> None:
-    import asyncio
-
     await asyncio.sleep(seconds)
 
 
@@ -218,13 +343,18 @@ async def _build_and_download_stat_report(
     if job_id is None:
         raise RuntimeError(f"Unexpected /stat-reports response: {created}")
 
+    # Poll with exponential backoff: small reports finish within a few seconds,
+    # long ones settle at `poll_interval_sec * 3` between polls.
     started = time.time()
+    delay = min(1.0, poll_interval_sec)
+    max_delay = poll_interval_sec * 3
     last = created
     status = str(created.get("status") or "").upper()
     while status in {"REGIST", "RUNNING", "WAITING"}:
         if time.time() - started > timeout_sec:
             raise RuntimeError(f"Stat report timeout (job_id={job_id}, status={status})")
-        await _sleep(poll_interval_sec)
+        await _sleep(delay)
+        delay = min(delay * 1.6, max_delay)
         last = await client.request_json(method="GET", uri=f"/stat-reports/{job_id}", timeout=30)
         if not isinstance(last, dict):
             raise RuntimeError("Unexpected /stat-reports/{id} response (not json object)")
@@ -242,25 +372,130 @@ async def _build_and_download_stat_report(
     return None
 
 
+def _iter_nonempty_lines(text: str) -> Iterator[str]:
+    """Yield non-blank lines lazily; a trailing "\r" is left for csv.reader to drop."""
+    find = text.find
+    start = 0
+    n = len(text)
+    while start < n:
+        end = find("\n", start)
+        if end < 0:
+            end = n
+        ln = text[start:end]
+        start = end + 1
+        if ln and not ln.isspace():
+            yield ln
+
+
 def _parse_tsv(
     data: bytes,
     *,
     fieldnames: list[str] | None = None,
-) -> list[dict[str, Any]]:
+) -> tuple[list[str], Iterator[list[str]]]:
+    """Split a report into column names and a lazy iterator of positional rows."""
     text = _read_text_best_effort(data)
-    lines = [ln for ln in text.splitlines() if ln.strip() != ""]
-    if not lines:
-        return []
-    # Auto-detect: if the first line contains known column headers, let
-    # DictReader use it; otherwise the file is header-less (v2 format) and
-    # we must supply explicit fieldnames.
-    first_cols = set(lines[0].split("\t"))
-    has_header = bool(first_cols & _KNOWN_HEADER_NAMES)
-    if has_header:
-        reader = csv.DictReader(lines, delimiter="\t")
-    else:
-        reader = csv.DictReader(lines, fieldnames=fieldnames, delimiter="\t")
-    return list(reader)
+    reader = csv.reader(_iter_nonempty_lines(text), delimiter="\t")
+    first = next(reader, None)
+    if first is None:
+        return [], iter(())
+    # Auto-detect: if the first row contains known column headers, use it as
+    # the header; otherwise the file is header-less (v2 format) and we must
+    # supply explicit fieldnames.
+    has_header = not _KNOWN_HEADER_NAMES.isdisjoint(first)
+    if has_header or not fieldnames:
+        return first, reader
+    return list(fieldnames), itertools.chain((first,), reader)
+
+
+# Decoded report row: the eight id/name cells, then impressions, clicks, spend
+# (all floats) and the raw conversion/value cells (None when absent).
+_ReportRow = tuple[Any, ...]
+
+
+def _decode_report_rows(columns: list[str], rows: Iterable[list[str]]) -> Iterator[_ReportRow]:
+    # Header names vary by reportTp, but every row of one report shares the
+    # same columns: resolve each candidate list to column positions once and
+    # build a reader per field that only indexes real columns per row.
+    col_idx = {name: i for i, name in enumerate(columns)}
+
+    def reader(keys: tuple[str, ...]) -> Callable[[list[str]], str | None]:
+        return _make_first([col_idx[k] for k in keys if k in col_idx])
+
+    camp_id_of = reader(_CAMP_ID_KEYS)
+    camp_name_of = reader(_CAMP_NAME_KEYS)
+    grp_id_of = reader(_GRP_ID_KEYS)
+    grp_name_of = reader(_GRP_NAME_KEYS)
+    kw_id_of = reader(_KW_ID_KEYS)
+    kw_name_of = reader(_KW_NAME_KEYS)
+    ad_id_of = reader(_AD_ID_KEYS)
+    ad_name_of = reader(_AD_NAME_KEYS)
+
+    impr_of = reader(_IMPR_KEYS)
+    click_of = reader(_CLICK_KEYS)
+    spend_of = reader(_SPEND_KEYS)
+    cpc_of = reader(_CPC_KEYS)
+
+    conv_all_of = reader(_CONV_ALL_KEYS)
+    conv_purchase_of = reader(_CONV_PURCHASE_KEYS)
+    value_all_of = reader(_VALUE_ALL_KEYS)
+    value_purchase_of = reader(_VALUE_PURCHASE_KEYS)
+
+    # Hot loop: bind module globals to locals once per report.
+    parse_float = _parse_float
+    parse_int = _parse_int
+
+    for r in rows:
+        impr = float(parse_int(impr_of(r)) or 0)
+        clk = float(parse_int(click_of(r)) or 0)
+        spend = parse_float(spend_of(r))
+        if spend is None:
+            cpc = parse_float(cpc_of(r))
+            spend = (cpc * clk) if cpc is not None else 0.0
+        yield (
+            camp_id_of(r),
+            camp_name_of(r),
+            grp_id_of(r),
+            grp_name_of(r),
+            kw_id_of(r),
+            kw_name_of(r),
+            ad_id_of(r),
+            ad_name_of(r),
+            impr,
+            clk,
+            spend,
+            parse_float(conv_all_of(r)),
+            parse_float(conv_purchase_of(r)),
+            parse_float(value_all_of(r)),
+            parse_float(value_purchase_of(r)),
+        )
+
+
+def _decode_ad_detail_rows(rows: Iterable[list[str]]) -> Iterator[_ReportRow]:
+    """Fixed-position decoder for header-less AD_DETAIL reports (see _AD_DETAIL_COLUMNS)."""
+    parse_float = _parse_float
+    parse_int = _parse_int
+    width = len(_AD_DETAIL_COLUMNS)
+    pad = [""] * width
+    for r in rows:
+        if len(r) < width:
+            r = r + pad[len(r):]
+        yield (
+            r[2].strip() or None,
+            None,
+            r[3].strip() or None,
+            None,
+            r[4].strip() or None,
+            None,
+            r[5].strip() or None,
+            None,
+            float(parse_int(r[11]) or 0),
+            float(parse_int(r[12]) or 0),
+            parse_float(r[13]) or 0.0,
+            parse_float(r[15]),
+            None,
+            None,
+            None,
+        )
 
 
 class NaverSearchAdConnector:
@@ -285,6 +520,19 @@ class NaverSearchAdConnector:
     def __init__(self, ctx: ConnectorContext, repo):
         self.ctx = ctx
         self.repo = repo
+        self._apply_client: _NaverSearchAdClient | None = None
+
+    def _get_apply_client(self) -> _NaverSearchAdClient:
+        # A connector instance serves one customer account, so consecutive
+        # apply_action calls can share the signed client and its keep-alive pool.
+        if self._apply_client is None:
+            self._apply_client = self._build_client()
+        return self._apply_client
+
+    async def aclose(self) -> None:
+        client, self._apply_client = self._apply_client, None
+        if client is not None:
+            await client.aclose()
 
     def _build_client(self) -> _NaverSearchAdClient:
         base_url = os.getenv("NAVER_SEARCHAD_BASE_URL", _DEFAULT_BASE_URL).strip() or _DEFAULT_BASE_URL
@@ -296,25 +544,15 @@ class NaverSearchAdConnector:
         )
 
     def _payload(self, proposal: dict) -> dict:
-        raw = proposal.get("payload_json") or "{}"
-        if isinstance(raw, dict):
-            return raw
-        try:
-            return json.loads(raw)
-        except Exception:
-            return {}
+        return proposal_payload(proposal)
 
     async def _resolve_parent_id(self, proposal: dict, payload: dict, entity_id: str) -> str:
-        parent_id = str(payload.get("parent_id") or "").strip()
+        parent_id = _sid(payload, "parent_id")
         if parent_id:
             return parent_id
-        with self.repo.connect() as conn:
-            row = conn.execute(
-                "SELECT parent_id FROM entities WHERE platform='naver' AND entity_type='keyword' AND entity_id=?",
-                (entity_id,),
-            ).fetchone()
-        if row and row[0]:
-            return str(row[0]).strip()
+        parents = self.repo.get_parent_ids(platform="naver", entity_type="keyword", entity_ids=[entity_id])
+        if entity_id in parents:
+            return parents[entity_id]
         raise ValueError(
             f"Cannot resolve parent adgroup for keyword {entity_id!r}: not in payload or DB"
         )
@@ -346,64 +584,66 @@ class NaverSearchAdConnector:
             return
         if mode == "fixture":
             d = fixture_dir(self.ctx.platform, self.ctx.config)
-            for e in load_entities(d):
-                self.repo.upsert_entity(
-                    platform=e.get("platform") or self.ctx.platform,
-                    account_id=e.get("account_id"),
-                    entity_type=e.get("entity_type") or "",
-                    entity_id=e.get("entity_id") or "",
-                    parent_type=e.get("parent_type"),
-                    parent_id=e.get("parent_id"),
-                    name=e.get("name"),
-                    status=e.get("status"),
-                    meta_json=e.get("meta_json") or {},
-                )
+            self.repo.upsert_entities_bulk(
+                {
+                    "platform": e.get("platform") or self.ctx.platform,
+                    "account_id": e.get("account_id"),
+                    "entity_type": e.get("entity_type") or "",
+                    "entity_id": e.get("entity_id") or "",
+                    "parent_type": e.get("parent_type"),
+                    "parent_id": e.get("parent_id"),
+                    "name": e.get("name"),
+                    "status": e.get("status"),
+                    "meta_json": e.get("meta_json") or {},
+                }
+                for e in load_entities(d)
+            )
             return
 
         # API mode (best-effort: campaigns + adgroups)
-        client = self._build_client()
-        customer_id = (os.getenv("NAVER_SEARCHAD_CUSTOMER_ID") or "").strip()
-
-        camps = await client.request_json(method="GET", uri="/ncc/campaigns", timeout=30)
-        if isinstance(camps, list):
-            for c in camps:
-                if not isinstance(c, dict):
-                    continue
-                cid = str(c.get("nccCampaignId") or c.get("campaignId") or "").strip()
-                if not cid:
-                    continue
-                self.repo.upsert_entity(
-                    platform="naver",
-                    account_id=customer_id,
-                    entity_type="campaign",
-                    entity_id=cid,
-                    parent_type=None,
-                    parent_id=None,
-                    name=c.get("name"),
-                    status=c.get("status"),
-                    meta_json={"source": "naver_api"},
-                )
-
-        adgs = await client.request_json(method="GET", uri="/ncc/adgroups", timeout=30)
-        if isinstance(adgs, list):
-            for g in adgs:
-                if not isinstance(g, dict):
-                    continue
-                gid = str(g.get("nccAdgroupId") or g.get("adgroupId") or "").strip()
-                if not gid:
-                    continue
-                parent = str(g.get("nccCampaignId") or "").strip() or None
-                self.repo.upsert_entity(
-                    platform="naver",
-                    account_id=customer_id,
-                    entity_type="adgroup",
-                    entity_id=gid,
-                    parent_type="campaign" if parent else None,
-                    parent_id=parent,
-                    name=g.get("name"),
-                    status=g.get("status"),
-                    meta_json={"source": "naver_api"},
-                )
+        async with self._build_client() as client:
+            customer_id = (os.getenv("NAVER_SEARCHAD_CUSTOMER_ID") or "").strip()
+
+            camps = await client.request_json(method="GET", uri="/ncc/campaigns", timeout=30)
+            if isinstance(camps, list):
+                for c in camps:
+                    if not isinstance(c, dict):
+                        continue
+                    cid = str(c.get("nccCampaignId") or c.get("campaignId") or "").strip()
+                    if not cid:
+                        continue
+                    self.repo.upsert_entity(
+                        platform="naver",
+                        account_id=customer_id,
+                        entity_type="campaign",
+                        entity_id=cid,
+                        parent_type=None,
+                        parent_id=None,
+                        name=c.get("name"),
+                        status=c.get("status"),
+                        meta_json={"source": "naver_api"},
+                    )
+
+            adgs = await client.request_json(method="GET", uri="/ncc/adgroups", timeout=30)
+            if isinstance(adgs, list):
+                for g in adgs:
+                    if not isinstance(g, dict):
+                        continue
+                    gid = str(g.get("nccAdgroupId") or g.get("adgroupId") or "").strip()
+                    if not gid:
+                        continue
+                    parent = str(g.get("nccCampaignId") or "").strip() or None
+                    self.repo.upsert_entity(
+                        platform="naver",
+                        account_id=customer_id,
+                        entity_type="adgroup",
+                        entity_id=gid,
+                        parent_type="campaign" if parent else None,
+                        parent_id=parent,
+                        name=g.get("name"),
+                        status=g.get("status"),
+                        meta_json={"source": "naver_api"},
+                    )
 
     async def fetch_metrics_daily(self, date_from: str, date_to: str) -> None:
         mode = str(self.ctx.config.get("mode", "import")).strip().lower()
@@ -413,34 +653,25 @@ class NaverSearchAdConnector:
             d0 = date.fromisoformat(date_from)
             d1 = date.fromisoformat(date_to)
             d = fixture_dir(self.ctx.platform, self.ctx.config)
+            rows: list[dict[str, Any]] = []
             for row in load_metrics_daily_rows(d):
-                day = str(row.get("date") or "")
+                day = row.pop("date")
                 if not day:
                     continue
                 dd = date.fromisoformat(day)
                 if dd < d0 or dd > d1:
                     continue
-                self.repo.upsert_metric_daily(
-                    platform=row.get("platform") or self.ctx.platform,
-                    account_id=row.get("account_id"),
-                    entity_type=row.get("entity_type") or "",
-                    entity_id=row.get("entity_id") or "",
-                    day=day,
-                    spend=row.get("spend"),
-                    impressions=row.get("impressions"),
-                    clicks=row.get("clicks"),
-                    conversions=row.get("conversions"),
-                    conversion_value=row.get("conversion_value"),
-                    metrics_json=row.get("metrics_json") or {},
-                )
+                row["day"] = day
+                row["platform"] = row["platform"] or self.ctx.platform
+                rows.append(row)
+            self.repo.upsert_metrics_daily_bulk(rows)
             return
 
         # API mode: Stat Report -> TSV -> rollup
-        client = self._build_client()
         customer_id = (os.getenv("NAVER_SEARCHAD_CUSTOMER_ID") or "").strip()
 
         report_tp = str(self.ctx.config.get("report_tp") or "AD_DETAIL").strip().upper()
-        levels = _safe_levels(self.ctx.config.get("ingest_levels"))
+        level_mask = _level_mask(_safe_levels(self.ctx.config.get("ingest_levels")))
         poll_interval = float(self.ctx.config.get("report_poll_interval_sec", 5.0))
         timeout_sec = float(self.ctx.config.get("report_timeout_sec", 120.0))
         include_today = bool(self.ctx.config.get("include_today", False))
@@ -462,296 +693,228 @@ class NaverSearchAdConnector:
         if not include_today:
             tz = ZoneInfo(os.getenv("ADS_TIMEZONE", "Asia/Seoul"))
             today_kst = datetime.now(tz=tz).date().isoformat()
-            days = [d for d in days if d != today_kst]
+            if today_kst in days:
+                days.remove(today_kst)
 
-        for day_iso in days:
+        col_map = {"AD_DETAIL": _AD_DETAIL_COLUMNS}
+        fieldnames = col_map.get(report_tp)
+
+        # Report builds are server-side and mostly idle polling, so overlap days.
+        # Ingestion is synchronous and runs between awaits, so writes never interleave.
+        sem = asyncio.Semaphore(max(1, int(self.ctx.config.get("report_concurrency", 4))))
+
+        async def ingest_day(client: _NaverSearchAdClient, day_iso: str) -> None:
             stat_dt = _to_stat_dt(day_iso)
-            blob = await _build_and_download_stat_report(
-                client,
-                report_tp=report_tp,
-                stat_dt=stat_dt,
-                poll_interval_sec=poll_interval,
-                timeout_sec=timeout_sec,
-            )
+            async with sem:
+                blob = await _build_and_download_stat_report(
+                    client,
+                    report_tp=report_tp,
+                    stat_dt=stat_dt,
+                    poll_interval_sec=poll_interval,
+                    timeout_sec=timeout_sec,
+                )
             if not blob:
-                continue
-            col_map = {"AD_DETAIL": _AD_DETAIL_COLUMNS}
-            rows = _parse_tsv(blob, fieldnames=col_map.get(report_tp))
-            if not rows:
-                continue
+                return
+            columns, rows = _parse_tsv(blob, fieldnames=fieldnames)
+            if not columns:
+                return
             self._ingest_report_rows(
+                columns,
                 rows,
                 day_iso=_to_day_iso(stat_dt),
                 customer_id=customer_id,
                 report_tp=report_tp,
-                levels=levels,
+                level_mask=level_mask,
             )
 
+        # TaskGroup cancels the remaining days when one fails, before the client closes.
+        async with self._build_client() as client, asyncio.TaskGroup() as tg:
+            for d in days:
+                tg.create_task(ingest_day(client, d))
+
         self.repo.set_meta(key, datetime.now().astimezone().replace(microsecond=0).isoformat())
 
     def _ingest_report_rows(
         self,
-        rows: list[dict[str, Any]],
+        columns: list[str],
+        rows: Iterable[list[str]],
         *,
         day_iso: str,
         customer_id: str,
         report_tp: str,
-        levels: list[str],
+        level_mask: int,
     ) -> None:
-        # Entity fields (header names vary by reportTp; keep heuristics broad)
-        camp_id_keys = ["nccCampaignId", "Campaign ID", "캠페인ID", "캠페인 ID"]
-        camp_name_keys = ["campaignName", "Campaign", "Campaign name", "캠페인", "캠페인명"]
-        grp_id_keys = ["nccAdgroupId", "Adgroup ID", "Ad group ID", "광고그룹ID", "광고그룹 ID", "그룹ID"]
-        grp_name_keys = ["adgroupName", "Adgroup", "Ad group", "광고그룹", "광고그룹명"]
-        kw_id_keys = ["nccKeywordId", "Keyword ID", "키워드ID", "키워드 ID"]
-        kw_name_keys = ["keyword", "Keyword", "키워드", "키워드명"]
-        ad_id_keys = ["nccAdId", "Ad ID", "광고ID", "광고 ID"]
-        ad_name_keys = ["adName", "Ad", "Ad name", "광고", "광고명"]
-
-        # Metrics fields
-        impr_keys = ["impCnt", "Impressions", "노출수", "노출 수"]
-        click_keys = ["clkCnt", "Clicks", "클릭수", "클릭 수"]
-        spend_keys = ["salesAmt", "cost", "Cost", "총비용", "총 비용", "비용", "광고비", "spend"]
-        cpc_keys = ["cpc", "CPC", "평균CPC", "평균 CPC"]
-
-        conv_all_keys = ["ccnt", "Conversions", "전환수", "전환 수", "전체전환수", "전체 전환수"]
-        conv_purchase_keys = ["구매전환수", "구매 전환수", "구매수", "구매 수"]
-        value_all_keys = ["drtConvValue", "Conv. value", "전환매출", "전환 매출", "전환가치", "전환 가치", "매출"]
-        value_purchase_keys = ["구매전환매출", "구매 전환매출", "구매금액", "구매 금액", "구매매출", "구매 매출"]
-
-        agg: dict[tuple[str, str], dict[str, float]] = {}
-
-        def bump(
-            entity_type: str,
-            entity_id: str,
-            *,
-            spend: float,
-            impr: float,
-            clk: float,
-            conv: float,
-            val: float,
-            conv_all: float | None,
-            val_all: float | None,
-            conv_purchase: float | None,
-            val_purchase: float | None,
-        ) -> None:
-            k = (entity_type, entity_id)
-            cur = agg.get(k)
-            if not cur:
-                cur = {
-                    "spend": 0.0,
-                    "impressions": 0.0,
-                    "clicks": 0.0,
-                    "conversions": 0.0,
-                    "conversion_value": 0.0,
-                    "conversions_all": 0.0,
-                    "conversion_value_all": 0.0,
-                    "conversions_purchase": 0.0,
-                    "conversion_value_purchase": 0.0,
-                }
-                agg[k] = cur
-            cur["spend"] += spend
-            cur["impressions"] += impr
-            cur["clicks"] += clk
-            cur["conversions"] += conv
-            cur["conversion_value"] += val
-            if conv_all is not None:
-                cur["conversions_all"] += float(conv_all or 0)
-            if val_all is not None:
-                cur["conversion_value_all"] += float(val_all or 0)
-            if conv_purchase is not None:
-                cur["conversions_purchase"] += float(conv_purchase or 0)
-            if val_purchase is not None:
-                cur["conversion_value_purchase"] += float(val_purchase or 0)
-
-        for r in rows:
-            camp_id = _first(r, camp_id_keys)
-            camp_name = _first(r, camp_name_keys)
-            grp_id = _first(r, grp_id_keys)
-            grp_name = _first(r, grp_name_keys)
-            kw_id = _first(r, kw_id_keys)
-            kw_name = _first(r, kw_name_keys)
-            ad_id = _first(r, ad_id_keys)
-            ad_name = _first(r, ad_name_keys)
-
-            impr = float(_parse_int(_first(r, impr_keys)) or 0)
-            clk = float(_parse_int(_first(r, click_keys)) or 0)
-            spend_v = _parse_float(_first(r, spend_keys))
-            if spend_v is None:
-                cpc = _parse_float(_first(r, cpc_keys))
-                spend_v = (float(cpc or 0) * clk) if cpc is not None else 0.0
-            spend = float(spend_v or 0)
-
-            conv_all = _parse_float(_first(r, conv_all_keys))
-            conv_purchase = _parse_float(_first(r, conv_purchase_keys))
+        if columns == _AD_DETAIL_COLUMNS:
+            decoded = _decode_ad_detail_rows(rows)
+        else:
+            decoded = _decode_report_rows(columns, rows)
+
+        meta_json = json.dumps({"source": "naver_report", "report_tp": report_tp}, ensure_ascii=True)
+        camps: dict[str, str | None] = {}
+        grps: dict[str, tuple[str | None, str | None]] = {}
+        kws: dict[str, tuple[str | None, str | None, str | None]] = {}
+        ads: dict[str, tuple[str | None, str | None, str | None]] = {}
+        # (entity_type, entity_id) -> running sums, indexed by the _AGG_* positions.
+        agg: dict[tuple[str, str], list[float]] = {}
+        agg_get = agg.get
+        want_campaign = level_mask & _LEVEL_CAMPAIGN
+        want_adgroup = level_mask & _LEVEL_ADGROUP
+        want_keyword = level_mask & _LEVEL_KEYWORD
+        want_ad = level_mask & _LEVEL_AD
+
+        for (
+            camp_id,
+            camp_name,
+            grp_id,
+            grp_name,
+            kw_id,
+            kw_name,
+            ad_id,
+            ad_name,
+            impr,
+            clk,
+            spend,
+            conv_all,
+            conv_purchase,
+            val_all,
+            val_purchase,
+        ) in decoded:
             conv_primary = conv_purchase if conv_purchase is not None else conv_all
             conv = float(conv_primary or 0)
-
-            val_all = _parse_float(_first(r, value_all_keys))
-            val_purchase = _parse_float(_first(r, value_purchase_keys))
             val_primary = val_purchase if val_purchase is not None else val_all
             val = float(val_primary or 0)
 
-            # Upsert entities discovered in report (names help debugging).
-            if camp_id:
-                self.repo.upsert_entity(
-                    platform="naver",
-                    account_id=customer_id,
-                    entity_type="campaign",
-                    entity_id=camp_id,
-                    parent_type=None,
-                    parent_id=None,
-                    name=camp_name,
-                    status=None,
-                    meta_json={"source": "naver_report", "report_tp": report_tp},
-                )
+            # Entities discovered in report (names help debugging): the id set is
+            # nearly constant across rows, so remember each id once, filling in a
+            # name or parent that an earlier row left blank.
+            if camp_id and not camps.get(camp_id):
+                camps[camp_id] = camp_name
             if grp_id:
-                self.repo.upsert_entity(
-                    platform="naver",
-                    account_id=customer_id,
-                    entity_type="adgroup",
-                    entity_id=grp_id,
-                    parent_type="campaign" if camp_id else None,
-                    parent_id=camp_id,
-                    name=grp_name,
-                    status=None,
-                    meta_json={"source": "naver_report", "report_tp": report_tp},
-                )
+                pg = grps.get(grp_id)
+                if pg is None or not all(pg):
+                    grps[grp_id] = (
+                        (camp_id, grp_name) if pg is None else (pg[0] or camp_id, pg[1] or grp_name)
+                    )
             if kw_id:
-                self.repo.upsert_entity(
-                    platform="naver",
-                    account_id=customer_id,
-                    entity_type="keyword",
-                    entity_id=kw_id,
-                    parent_type="adgroup" if grp_id else ("campaign" if camp_id else None),
-                    parent_id=grp_id or camp_id,
-                    name=kw_name,
-                    status=None,
-                    meta_json={"source": "naver_report", "report_tp": report_tp},
-                )
+                pk = kws.get(kw_id)
+                if pk is None or not all(pk):
+                    kws[kw_id] = (
+                        (grp_id, camp_id, kw_name)
+                        if pk is None
+                        else (pk[0] or grp_id, pk[1] or camp_id, pk[2] or kw_name)
+                    )
             if ad_id:
-                self.repo.upsert_entity(
-                    platform="naver",
-                    account_id=customer_id,
-                    entity_type="ad",
-                    entity_id=ad_id,
-                    parent_type="adgroup" if grp_id else ("campaign" if camp_id else None),
-                    parent_id=grp_id or camp_id,
-                    name=ad_name,
-                    status=None,
-                    meta_json={"source": "naver_report", "report_tp": report_tp},
-                )
-
-            # Rollup
-            if "campaign" in levels and camp_id:
-                bump(
-                    "campaign",
-                    camp_id,
-                    spend=spend,
-                    impr=impr,
-                    clk=clk,
-                    conv=conv,
-                    val=val,
-                    conv_all=conv_all,
-                    val_all=val_all,
-                    conv_purchase=conv_purchase,
-                    val_purchase=val_purchase,
-                )
-            if "adgroup" in levels and grp_id:
-                bump(
-                    "adgroup",
-                    grp_id,
-                    spend=spend,
-                    impr=impr,
-                    clk=clk,
-                    conv=conv,
-                    val=val,
-                    conv_all=conv_all,
-                    val_all=val_all,
-                    conv_purchase=conv_purchase,
-                    val_purchase=val_purchase,
-                )
-            if "keyword" in levels and kw_id:
-                bump(
-                    "keyword",
-                    kw_id,
-                    spend=spend,
-                    impr=impr,
-                    clk=clk,
-                    conv=conv,
-                    val=val,
-                    conv_all=conv_all,
-                    val_all=val_all,
-                    conv_purchase=conv_purchase,
-                    val_purchase=val_purchase,
-                )
-            if "ad" in levels and ad_id:
-                bump(
-                    "ad",
-                    ad_id,
-                    spend=spend,
-                    impr=impr,
-                    clk=clk,
-                    conv=conv,
-                    val=val,
-                    conv_all=conv_all,
-                    val_all=val_all,
-                    conv_purchase=conv_purchase,
-                    val_purchase=val_purchase,
-                )
-
+                pa = ads.get(ad_id)
+                if pa is None or not all(pa):
+                    ads[ad_id] = (
+                        (grp_id, camp_id, ad_name)
+                        if pa is None
+                        else (pa[0] or grp_id, pa[1] or camp_id, pa[2] or ad_name)
+                    )
+
+            # Rollup: one set of adds per level key instead of a kwargs call per level.
+            targets: list[tuple[str, str]] = []
+            if want_campaign and camp_id:
+                targets.append(("campaign", camp_id))
+            if want_adgroup and grp_id:
+                targets.append(("adgroup", grp_id))
+            if want_keyword and kw_id:
+                targets.append(("keyword", kw_id))
+            if want_ad and ad_id:
+                targets.append(("ad", ad_id))
+            if not targets:
+                continue
+            ca = float(conv_all or 0)
+            va = float(val_all or 0)
+            cp = float(conv_purchase or 0)
+            vp = float(val_purchase or 0)
+            for k in targets:
+                cur = agg_get(k)
+                if cur is None:
+                    agg[k] = [spend, impr, clk, conv, val, ca, va, cp, vp]
+                    continue
+                cur[0] += spend
+                cur[1] += impr
+                cur[2] += clk
+                cur[3] += conv
+                cur[4] += val
+                cur[5] += ca
+                cur[6] += va
+                cur[7] += cp
+                cur[8] += vp
+
+        metric_rows: list[dict[str, Any]] = []
         for (entity_type, entity_id), s in agg.items():
-            conv_all_sum = float(s.get("conversions_all", 0.0))
-            conv_purchase_sum = float(s.get("conversions_purchase", 0.0))
-            val_all_sum = float(s.get("conversion_value_all", 0.0))
-            val_purchase_sum = float(s.get("conversion_value_purchase", 0.0))
+            conv_all_sum = s[_AGG_CONV_ALL]
+            conv_purchase_sum = s[_AGG_CONV_PURCHASE]
+            val_all_sum = s[_AGG_VALUE_ALL]
+            val_purchase_sum = s[_AGG_VALUE_PURCHASE]
 
             conv_primary_sum = conv_purchase_sum if conv_purchase_sum > 0 else conv_all_sum
             val_primary_sum = val_purchase_sum if val_purchase_sum > 0 else val_all_sum
 
-            self.repo.upsert_metric_daily(
-                platform="naver",
-                account_id=customer_id,
-                entity_type=entity_type,
-                entity_id=entity_id,
-                day=day_iso,
-                spend=float(s.get("spend", 0.0)),
-                impressions=int(s.get("impressions", 0.0)),
-                clicks=int(s.get("clicks", 0.0)),
-                conversions=float(conv_primary_sum),
-                conversion_value=float(val_primary_sum),
-                metrics_json={
-                    "source": "naver_api",
-                    "report_tp": report_tp,
-                    "conversions_all": conv_all_sum,
-                    "conversions_purchase": conv_purchase_sum,
-                    "conversion_value_all": val_all_sum,
-                    "conversion_value_purchase": val_purchase_sum,
-                },
+            metric_rows.append(
+                {
+                    "platform": "naver",
+                    "account_id": customer_id,
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "day": day_iso,
+                    "spend": s[_AGG_SPEND],
+                    "impressions": int(s[_AGG_IMPRESSIONS]),
+                    "clicks": int(s[_AGG_CLICKS]),
+                    "conversions": float(conv_primary_sum),
+                    "conversion_value": float(val_primary_sum),
+                    "metrics_json": {
+                        "source": "naver_api",
+                        "report_tp": report_tp,
+                        "conversions_all": conv_all_sum,
+                        "conversions_purchase": conv_purchase_sum,
+                        "conversion_value_all": val_all_sum,
+                        "conversion_value_purchase": val_purchase_sum,
+                    },
+                }
             )
 
+        def entity(
+            entity_type: str, entity_id: str, parent_type: str | None, parent_id: str | None, name: str | None
+        ) -> dict[str, Any]:
+            return {
+                "platform": "naver",
+                "account_id": customer_id,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "parent_type": parent_type,
+                "parent_id": parent_id,
+                "name": name,
+                "status": None,
+                "meta_json": meta_json,
+            }
+
+        entity_rows = [entity("campaign", cid, None, None, name) for cid, name in camps.items()]
+        for gid, (cid, name) in grps.items():
+            entity_rows.append(entity("adgroup", gid, "campaign" if cid else None, cid, name))
+        for entity_type, seen in (("keyword", kws), ("ad", ads)):
+            for eid, (gid, cid, name) in seen.items():
+                parent_type = "adgroup" if gid else ("campaign" if cid else None)
+                entity_rows.append(entity(entity_type, eid, parent_type, gid or cid, name))
+
+        self.repo.upsert_entities_bulk(entity_rows)
+        self.repo.upsert_metrics_daily_bulk(metric_rows)
+
     async def fetch_metrics_intraday(self, day: str) -> None:
         mode = str(self.ctx.config.get("mode", "import")).strip().lower()
         if mode != "fixture":
             return
         d = fixture_dir(self.ctx.platform, self.ctx.config)
+        rows: list[dict[str, Any]] = []
         for row in load_metrics_intraday_rows(d):
-            hour_ts = str(row.get("hour_ts") or "")
+            hour_ts = row["hour_ts"]
             if not hour_ts.startswith(day):
                 continue
-            self.repo.upsert_metric_intraday(
-                platform=row.get("platform") or self.ctx.platform,
-                account_id=row.get("account_id"),
-                entity_type=row.get("entity_type") or "",
-                entity_id=row.get("entity_id") or "",
-                hour_ts=hour_ts,
-                spend=row.get("spend"),
-                impressions=row.get("impressions"),
-                clicks=row.get("clicks"),
-                conversions=row.get("conversions"),
-                conversion_value=row.get("conversion_value"),
-                metrics_json=row.get("metrics_json") or {},
-            )
+            row["platform"] = row["platform"] or self.ctx.platform
+            rows.append(row)
+        self.repo.upsert_metrics_intraday_bulk(rows)
 
     # ------------------------------------------------------------------ #
     # Write helpers                                                        #
@@ -760,56 +923,25 @@ class NaverSearchAdConnector:
     async def _apply_pause(
         self, client: _NaverSearchAdClient, proposal: dict, payload: dict
     ) -> dict:
-        entity_type = str(proposal.get("entity_type") or "").lower().strip()
-        entity_id = str(proposal.get("entity_id") or "").strip()
+        entity_type = _sid(proposal, "entity_type").lower()
+        entity_id = _sid(proposal, "entity_id")
         op_str = str(payload.get("op") or "pause").lower()
         user_lock = op_str == "pause"
 
-        if entity_type == "campaign":
-            before_data = await client.request_json(
-                method="GET", uri=f"/ncc/campaigns/{entity_id}", timeout=30
-            )
-            before_data = before_data if isinstance(before_data, dict) else {}
-            after_data = await client.request_json(
-                method="PUT",
-                uri=f"/ncc/campaigns/{entity_id}",
-                params={"fields": "userLock"},
-                json_body={"nccCampaignId": entity_id, "userLock": user_lock},
-                timeout=30,
-            )
-        elif entity_type == "adgroup":
-            before_data = await client.request_json(
-                method="GET", uri=f"/ncc/adgroups/{entity_id}", timeout=30
-            )
-            before_data = before_data if isinstance(before_data, dict) else {}
-            after_data = await client.request_json(
-                method="PUT",
-                uri=f"/ncc/adgroups/{entity_id}",
-                params={"fields": "userLock"},
-                json_body={"nccAdgroupId": entity_id, "userLock": user_lock},
-                timeout=30,
-            )
-        elif entity_type == "keyword":
-            parent_id = await self._resolve_parent_id(proposal, payload, entity_id)
-            before_data = await client.request_json(
-                method="GET", uri=f"/ncc/keywords/{entity_id}", timeout=30
-            )
-            before_data = before_data if isinstance(before_data, dict) else {}
-            after_data = await client.request_json(
-                method="PUT",
-                uri=f"/ncc/keywords/{entity_id}",
-                params={"fields": "userLock"},
-                json_body={
-                    "nccKeywordId": entity_id,
-                    "nccAdgroupId": parent_id,
-                    "userLock": user_lock,
-                },
-                timeout=30,
-            )
-        else:
+        target = _PAUSE_TARGETS.get(entity_type)
+        if target is None:
             raise RuntimeError(f"Unsupported entity_type for pause_entity: {entity_type!r}")
+        path, id_key = target
+        body: dict[str, Any] = {id_key: entity_id, "userLock": user_lock}
+        if entity_type == "keyword":
+            # Keyword updates must name their adgroup.
+            body["nccAdgroupId"] = await self._resolve_parent_id(proposal, payload, entity_id)
+        uri = f"{path}/{entity_id}"
+        before_data = await client.request_dict(method="GET", uri=uri, timeout=30)
+        after_data = await client.request_dict(
+            method="PUT", uri=uri, params=_USER_LOCK_FIELDS, json_body=body, timeout=30
+        )
 
-        after_data = after_data if isinstance(after_data, dict) else {}
         return {
             "action": "pause_entity",
             "entity_type": entity_type,
@@ -827,16 +959,15 @@ class NaverSearchAdConnector:
     async def _apply_set_budget(
         self, client: _NaverSearchAdClient, proposal: dict, payload: dict
     ) -> dict:
-        entity_id = str(proposal.get("entity_id") or "").strip()
+        entity_id = _sid(proposal, "entity_id")
         new_budget = int(payload.get("budget") or 0)
 
-        before_data = await client.request_json(
+        before_data = await client.request_dict(
             method="GET", uri=f"/ncc/campaigns/{entity_id}", timeout=30
         )
-        before_data = before_data if isinstance(before_data, dict) else {}
         before_budget = before_data.get("dailyBudget")
 
-        after_data = await client.request_json(
+        after_data = await client.request_dict(
             method="PUT",
             uri=f"/ncc/campaigns/{entity_id}",
             params={"fields": "budget"},
@@ -847,7 +978,6 @@ class NaverSearchAdConnector:
             },
             timeout=30,
         )
-        after_data = after_data if isinstance(after_data, dict) else {}
         return {
             "action": "set_budget",
             "entity_type": "campaign",
@@ -859,17 +989,16 @@ class NaverSearchAdConnector:
     async def _apply_set_bid(
         self, client: _NaverSearchAdClient, proposal: dict, payload: dict
     ) -> dict:
-        entity_type = str(proposal.get("entity_type") or "").lower().strip()
-        entity_id = str(proposal.get("entity_id") or "").strip()
+        entity_type = _sid(proposal, "entity_type").lower()
+        entity_id = _sid(proposal, "entity_id")
         new_bid = int(payload.get("bid") or 0)
 
         if entity_type == "keyword":
             parent_id = await self._resolve_parent_id(proposal, payload, entity_id)
-            before_data = await client.request_json(
+            before_data = await client.request_dict(
                 method="GET", uri=f"/ncc/keywords/{entity_id}", timeout=30
             )
-            before_data = before_data if isinstance(before_data, dict) else {}
-            after_data = await client.request_json(
+            after_data = await client.request_dict(
                 method="PUT",
                 uri=f"/ncc/keywords/{entity_id}",
                 params={"fields": "bidAmt"},
@@ -882,11 +1011,10 @@ class NaverSearchAdConnector:
                 timeout=30,
             )
         elif entity_type == "adgroup":
-            before_data = await client.request_json(
+            before_data = await client.request_dict(
                 method="GET", uri=f"/ncc/adgroups/{entity_id}", timeout=30
             )
-            before_data = before_data if isinstance(before_data, dict) else {}
-            after_data = await client.request_json(
+            after_data = await client.request_dict(
                 method="PUT",
                 uri=f"/ncc/adgroups/{entity_id}",
                 params={"fields": "bidAmt"},
@@ -896,7 +1024,6 @@ class NaverSearchAdConnector:
         else:
             raise RuntimeError(f"Unsupported entity_type for set_bid: {entity_type!r}")
 
-        after_data = after_data if isinstance(after_data, dict) else {}
         return {
             "action": "set_bid",
             "entity_type": entity_type,
@@ -908,15 +1035,11 @@ class NaverSearchAdConnector:
     async def _apply_add_negatives(
         self, client: _NaverSearchAdClient, proposal: dict, payload: dict
     ) -> dict:
-        entity_id = str(proposal.get("entity_id") or "").strip()
+        entity_id = _sid(proposal, "entity_id")
         keywords = list(payload.get("keywords") or [])
 
         # Naver restricted-keywords are adgroup-scoped only.
-        body = [
-            {"keyword": str(kw.get("text") or "").strip()}
-            for kw in keywords
-            if str(kw.get("text") or "").strip()
-        ]
+        body = [{"keyword": text} for kw in keywords if (text := _sid(kw, "text"))]
         if not body:
             return {
                 "action": "add_negatives",
@@ -941,29 +1064,20 @@ class NaverSearchAdConnector:
             "after": {"count": len(added), "added": added},
         }
 
+    _APPLY_DISPATCH = {
+        "pause_entity": _apply_pause,
+        "set_budget": _apply_set_budget,
+        "set_bid": _apply_set_bid,
+        "add_negatives": _apply_add_negatives,
+    }
+
     async def apply_action(self, proposal: dict) -> dict:
         mode = str(self.ctx.config.get("mode", "import")).strip().lower()
         if mode in {"import", "fixture"}:
-            return {
-                "simulated": True,
-                "mode": mode,
-                "platform": self.ctx.platform,
-                "action_type": proposal.get("action_type"),
-                "entity_type": proposal.get("entity_type"),
-                "entity_id": proposal.get("entity_id"),
-            }
+            return simulated_result(mode, self.ctx.platform, proposal)
 
-        client = self._build_client()
-        action_type = str(proposal.get("action_type") or "").strip()
-        payload = self._payload(proposal)
-
-        if action_type == "pause_entity":
-            return await self._apply_pause(client, proposal, payload)
-        elif action_type == "set_budget":
-            return await self._apply_set_budget(client, proposal, payload)
-        elif action_type == "set_bid":
-            return await self._apply_set_bid(client, proposal, payload)
-        elif action_type == "add_negatives":
-            return await self._apply_add_negatives(client, proposal, payload)
-        else:
+        action_type = _sid(proposal, "action_type")
+        handler = self._APPLY_DISPATCH.get(action_type)
+        if handler is None:
             raise ValueError(f"Unsupported action_type for Naver: {action_type!r}")
+        return await handler(self, self._get_apply_client(), proposal, self._payload(proposal))
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import importlib.util
 import json
 import os
 import time
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -17,6 +19,14 @@ from commerce.connectors.base import ConnectorCapabilities, ConnectorContext
 from commerce.fixtures import fixture_dir
 
 _BASE_URL = "https://api.commerce.naver.com"
+_MAX_ATTEMPTS = 4
+_KST_SUFFIX = ".000+09:00"
+_KST = ZoneInfo("Asia/Seoul")
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_DETAIL_BATCH = 300
+# Request starts are spaced at least this far apart; the old sequential loop
+# paused 0.2-0.3s between calls.
+_MIN_REQUEST_INTERVAL = 0.2
 
 
 def _parse_float(v: Any) -> float | None:
@@ -54,70 +64,150 @@ def _pick_ordered_at(payload: dict[str, Any]) -> str | None:
     return None
 
 
+def _kst_iso(dt: datetime) -> str:
+    """Format a KST datetime as the API's `YYYY-MM-DDTHH:MM:SS.000+09:00` (no strftime)."""
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}{_KST_SUFFIX}"
+    )
+
+
 def _parse_last_changed_at(raw: str | Any) -> datetime:
     """Normalize SmartStore cursor timestamps to timezone-aware KST datetime."""
     value = ("" if raw is None else str(raw)).strip()
     if not value:
         raise ValueError("empty last_changed value")
+    if len(value) == 29 and value.endswith(_KST_SUFFIX):
+        # The cursor this module writes (_kst_iso): only the wall-clock part needs parsing.
+        return datetime.fromisoformat(value[:19]).replace(tzinfo=_KST)
 
     parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
     if parsed.tzinfo is None:
-        return parsed.replace(tzinfo=ZoneInfo("Asia/Seoul"))
-    return parsed.astimezone(ZoneInfo("Asia/Seoul"))
+        return parsed.replace(tzinfo=_KST)
+    return parsed.astimezone(_KST)
+
+
+def _retry_after(resp: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a 429: Retry-After if given, else 0.5s doubling."""
+    try:
+        return max(0.0, float(resp.headers.get("Retry-After", "")))
+    except ValueError:
+        return 0.5 * (2**attempt)
 
 
 def _load_orders_json(path: Path) -> list[dict[str, Any]]:
     p = path / "orders.json"
     if not p.exists():
         return []
-    data = json.loads(p.read_text(encoding="utf-8"))
+    data = json.loads(p.read_bytes())
     if isinstance(data, list):
         return data
     return []
 
 
+def _iter_fixture_orders(orders: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    # Rows are produced lazily so the bulk upsert never holds a second list of order dicts.
+    for o in orders:
+        order_id = str(o.get("productOrderId") or o.get("order_id") or "").strip()
+        if not order_id:
+            continue
+        ordered_at = _pick_ordered_at(o) or o.get("ordered_at")
+        date_kst = _to_date_kst(ordered_at or o.get("date_kst", ""))
+        if not date_kst:
+            continue
+        yield {
+            "store": "smartstore",
+            "order_id": order_id,
+            "ordered_at": ordered_at,
+            "date_kst": date_kst,
+            "status": o.get("productOrderStatus") or o.get("status"),
+            "amount": _parse_float(o.get("totalPaymentAmount") or o.get("amount")),
+            "currency": o.get("currency", "KRW"),
+            "order_place_id": o.get("orderPlaceId") or o.get("order_place_id"),
+            "order_place_name": o.get("orderPlaceName") or o.get("order_place_name"),
+            "meta_json": o,
+        }
+
+
 class _SmartStoreClient:
     """Thin wrapper around Naver Commerce API with bcrypt-based auth."""
 
-    def __init__(self) -> None:
+    def __init__(self, min_interval: float = _MIN_REQUEST_INTERVAL) -> None:
         self.client_id = (os.getenv("SMARTSTORE_CLIENT_ID") or "").strip()
         self.client_secret = (os.getenv("SMARTSTORE_CLIENT_SECRET") or "").strip()
+        self._cid_bytes = self.client_id.encode("utf-8")
+        self._secret_bytes = self.client_secret.encode("utf-8")
         self._token: str | None = None
         self._token_expires: float = 0.0
+        self._client: httpx.AsyncClient | None = None
+        self._token_lock = asyncio.Lock()
+        self._min_interval = max(0.0, min_interval)
+        self._next_slot = 0.0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # One keep-alive client per sync: the window/batch loops hit the same host.
+        # Concurrent requests multiplex over one connection when HTTP/2 support
+        # (the optional `h2` package) is installed; otherwise they share the pool.
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=30,
+                http2=_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
 
     async def _get_token(self) -> str:
         """Obtain (or reuse cached) OAuth access token via bcrypt signature."""
-        now = time.time()
-        if self._token and now < self._token_expires - 60:
+        if self._token and time.time() < self._token_expires - 60:
             return self._token
-
+        # Concurrent requests share one refresh instead of each signing a new token.
+        async with self._token_lock:
+            now = time.time()
+            if self._token and now < self._token_expires - 60:
+                return self._token
+            return await self._refresh_token(now)
+
+    async def _refresh_token(self, now: float) -> str:
         timestamp_ms = str(int(now * 1000))
-        password = f"{self.client_id}_{timestamp_ms}"
-        hashed = bcrypt.hashpw(
-            password.encode("utf-8"),
-            self.client_secret.encode("utf-8"),
-        )
+        password = self._cid_bytes + b"_" + timestamp_ms.encode("ascii")
+        # bcrypt is deliberately slow; hash in a worker thread so the event loop
+        # keeps serving in-flight requests during a refresh.
+        hashed = await asyncio.to_thread(bcrypt.hashpw, password, self._secret_bytes)
         client_secret_sign = base64.urlsafe_b64encode(hashed).decode("utf-8")
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                f"{_BASE_URL}/external/v1/oauth2/token",
-                data={
-                    "client_id": self.client_id,
-                    "timestamp": timestamp_ms,
-                    "client_secret_sign": client_secret_sign,
-                    "grant_type": "client_credentials",
-                    "type": "SELF",
-                },
-            )
-            resp.raise_for_status()
-            body = resp.json()
+        resp = await self._get_client().post(
+            f"{_BASE_URL}/external/v1/oauth2/token",
+            data={
+                "client_id": self.client_id,
+                "timestamp": timestamp_ms,
+                "client_secret_sign": client_secret_sign,
+                "grant_type": "client_credentials",
+                "type": "SELF",
+            },
+        )
+        resp.raise_for_status()
+        body = json.loads(resp.content)
 
         self._token = body["access_token"]
         expires_in = int(body.get("expires_in", 10800))
         self._token_expires = now + expires_in
         return self._token
 
+    async def _pace(self) -> None:
+        # Shared by every task on this client: each request reserves the next free
+        # slot, so concurrent windows/batches still respect the API's rate limit.
+        # No await between reading and advancing _next_slot, so no lock is needed.
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
     async def request_json(
         self, method: str, uri: str, params: dict | None = None, body: Any = None
     ) -> Any:
@@ -128,16 +218,20 @@ class _SmartStoreClient:
         }
         url = _BASE_URL + uri
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.request(
+        for attempt in range(_MAX_ATTEMPTS):
+            await self._pace()
+            resp = await self._get_client().request(
                 method,
                 url,
                 headers=headers,
                 params=params,
                 json=body,
             )
-            resp.raise_for_status()
-            return resp.json()
+            if resp.status_code != 429 or attempt == _MAX_ATTEMPTS - 1:
+                break
+            await asyncio.sleep(_retry_after(resp, attempt))
+        resp.raise_for_status()
+        return json.loads(resp.content)
 
 
 class SmartStoreConnector:
@@ -178,40 +272,24 @@ class SmartStoreConnector:
             return
         if mode == "fixture":
             d = fixture_dir(self.ctx.platform, self.ctx.config)
-            orders = _load_orders_json(d)
-            for o in orders:
-                order_id = str(o.get("productOrderId") or o.get("order_id") or "").strip()
-                if not order_id:
-                    continue
-                ordered_at = _pick_ordered_at(o) or o.get("ordered_at")
-                date_kst = _to_date_kst(ordered_at or o.get("date_kst", ""))
-                if not date_kst:
-                    continue
-                self.repo.upsert_store_order(
-                    store="smartstore",
-                    order_id=order_id,
-                    ordered_at=ordered_at,
-                    date_kst=date_kst,
-                    status=o.get("productOrderStatus") or o.get("status"),
-                    amount=_parse_float(o.get("totalPaymentAmount") or o.get("amount")),
-                    currency=o.get("currency", "KRW"),
-                    order_place_id=o.get("orderPlaceId") or o.get("order_place_id"),
-                    order_place_name=o.get("orderPlaceName") or o.get("order_place_name"),
-                    inflow_path=None,
-                    inflow_path_detail=None,
-                    referer=None,
-                    source_raw=None,
-                    meta_json=o,
-                )
+            self.repo.upsert_store_orders_bulk(_iter_fixture_orders(_load_orders_json(d)))
             return
 
+        client = _SmartStoreClient(
+            min_interval=float(self.ctx.config.get("api_min_interval_sec", _MIN_REQUEST_INTERVAL))
+        )
+        try:
+            await self._sync_orders_api(client)
+        finally:
+            await client.aclose()
+
+    async def _sync_orders_api(self, client: _SmartStoreClient) -> None:
         # API mode — incremental polling via lastChangedFrom
         # Naver Commerce API limits each query window to max 24 hours.
-        client = _SmartStoreClient()
         cursor_key = f"smartstore:{self.ctx.connector_id}:last_changed_from"
         raw_last_changed = self.repo.get_meta(cursor_key)
 
-        now_kst = datetime.now(tz=ZoneInfo("Asia/Seoul"))
+        now_kst = datetime.now(tz=_KST)
         if raw_last_changed:
             try:
                 window_start = _parse_last_changed_at(raw_last_changed)
@@ -220,51 +298,91 @@ class SmartStoreConnector:
         else:
             window_start = now_kst - timedelta(days=30)
 
-        all_po_ids: list[str] = []
+        # Windows and detail batches are independent requests: fan them out under
+        # a semaphore; request_json paces their starts and backs off on 429.
+        concurrency = max(1, int(self.ctx.config.get("api_concurrency", 4)))
+        sem = asyncio.Semaphore(concurrency)
 
-        # Step 1: collect changed product order IDs in 24h windows
+        windows: list[tuple[str, str]] = []
         while window_start < now_kst:
             window_end = min(window_start + timedelta(hours=23, minutes=59), now_kst)
-            cf = window_start.strftime("%Y-%m-%dT%H:%M:%S.000+09:00")
-            ct = window_end.strftime("%Y-%m-%dT%H:%M:%S.000+09:00")
-
-            data = await client.request_json(
-                "GET",
-                "/external/v1/pay-order/seller/product-orders/last-changed-statuses",
-                params={"lastChangedFrom": cf, "lastChangedTo": ct},
+            windows.append(
+                (
+                    _kst_iso(window_start),
+                    _kst_iso(window_end),
+                )
             )
-            changed_items = data.get("data", {}).get("lastChangeStatuses", [])
-            for item in changed_items:
-                pid = item.get("productOrderId")
-                if pid:
-                    all_po_ids.append(str(pid))
-
             window_start = window_end
-            if window_start < now_kst:
-                await asyncio.sleep(0.3)
-
-        if not all_po_ids:
-            self.repo.set_meta(cursor_key, now_kst.strftime("%Y-%m-%dT%H:%M:%S.000+09:00"))
-            return
 
-        # Deduplicate while preserving order
-        seen: set[str] = set()
-        po_ids: list[str] = []
-        for pid in all_po_ids:
-            if pid not in seen:
-                seen.add(pid)
-                po_ids.append(pid)
-
-        # Step 2: batch query product order details (max 300 per request)
-        for i in range(0, len(po_ids), 300):
-            batch = po_ids[i : i + 300]
-            detail_data = await client.request_json(
-                "POST",
-                "/external/v1/pay-order/seller/product-orders/query",
-                body={"productOrderIds": batch},
-            )
-            orders = detail_data.get("data", [])
-            for o in orders:
+        # Step 1 feeds Step 2 through a queue: a detail batch is queried as soon
+        # as 300 new ids have been seen, while remaining windows are still scanning.
+        batches: asyncio.Queue[list[str] | None] = asyncio.Queue(maxsize=8)
+        seen_ids: dict[str, None] = {}
+        pending: list[str] = []
+        upsert_orders = self.repo.upsert_store_orders_bulk
+
+        async def scan_window(cf: str, ct: str) -> None:
+            params = {"lastChangedFrom": cf, "lastChangedTo": ct}
+            while True:
+                async with sem:
+                    data = await client.request_json(
+                        "GET",
+                        "/external/v1/pay-order/seller/product-orders/last-changed-statuses",
+                        params=params,
+                    )
+                page = data.get("data") or {}
+                for item in page.get("lastChangeStatuses", []):
+                    pid = item.get("productOrderId")
+                    if not pid:
+                        continue
+                    pid = str(pid)
+                    if pid in seen_ids:
+                        continue
+                    seen_ids[pid] = None
+                    pending.append(pid)
+                    if len(pending) >= _DETAIL_BATCH:
+                        # Cut the batch before awaiting so other windows start a fresh one.
+                        batch = pending[:]
+                        pending.clear()
+                        await batches.put(batch)
+                # A saturated window reports where to resume ("more"); keep paging it
+                # instead of dropping the changes past the per-response cap.
+                more = page.get("more") or {}
+                more_from = more.get("moreFrom")
+                if not more_from:
+                    return
+                next_params = {"lastChangedFrom": str(more_from), "lastChangedTo": ct}
+                if more.get("moreSequence") is not None:
+                    next_params["moreSequence"] = str(more["moreSequence"])
+                if next_params == params:
+                    return
+                params = next_params
+
+        async def produce() -> None:
+            # Step 1: collect changed product order IDs in 24h windows
+            async with asyncio.TaskGroup() as tg:
+                for cf, ct in windows:
+                    tg.create_task(scan_window(cf, ct))
+            if pending:
+                await batches.put(pending[:])
+            for _ in range(concurrency):
+                await batches.put(None)
+
+        async def consume() -> None:
+            while (batch := await batches.get()) is not None:
+                await ingest_batch(batch)
+
+        async def ingest_batch(batch: list[str]) -> None:
+            # Step 2: batch query product order details (max 300 per request)
+            async with sem:
+                detail_data = await client.request_json(
+                    "POST",
+                    "/external/v1/pay-order/seller/product-orders/query",
+                    body={"productOrderIds": batch},
+                )
+            rows: list[dict[str, Any]] = []
+            append = rows.append
+            for o in detail_data.get("data", []):
                 po = o.get("productOrder", o)
                 po_id = str(po.get("productOrderId", ""))
                 if not po_id:
@@ -273,26 +391,29 @@ class SmartStoreConnector:
                 date_kst = _to_date_kst(ordered_at or "")
                 if not date_kst:
                     continue
-                self.repo.upsert_store_order(
-                    store="smartstore",
-                    order_id=po_id,
-                    ordered_at=ordered_at,
-                    date_kst=date_kst,
-                    status=po.get("productOrderStatus"),
-                    amount=_parse_float(po.get("totalPaymentAmount")),
-                    currency="KRW",
-                    order_place_id=po.get("orderPlaceId"),
-                    order_place_name=po.get("orderPlaceName"),
-                    inflow_path=None,
-                    inflow_path_detail=None,
-                    referer=None,
-                    source_raw=None,
-                    meta_json=po,
+                append(
+                    {
+                        "store": "smartstore",
+                        "order_id": po_id,
+                        "ordered_at": ordered_at,
+                        "date_kst": date_kst,
+                        "status": po.get("productOrderStatus"),
+                        "amount": _parse_float(po.get("totalPaymentAmount")),
+                        "currency": "KRW",
+                        "order_place_id": po.get("orderPlaceId"),
+                        "order_place_name": po.get("orderPlaceName"),
+                        "meta_json": po,
+                    }
                 )
-            if i + 300 < len(po_ids):
-                await asyncio.sleep(0.2)
+            # One executemany per batch; it is synchronous, so batches never interleave writes.
+            upsert_orders(rows)
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce())
+            for _ in range(concurrency):
+                tg.create_task(consume())
 
-        self.repo.set_meta(cursor_key, now_kst.strftime("%Y-%m-%dT%H:%M:%S.000+09:00"))
+        self.repo.set_meta(cursor_key, _kst_iso(now_kst))
 
     async def fetch_metrics_daily(self, date_from: str, date_to: str) -> None:
         return
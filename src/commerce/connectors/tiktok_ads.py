@@ -1,11 +1,30 @@
 from __future__ import annotations
 
+import bisect
 from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
 
-from commerce.connectors.base import ConnectorCapabilities, ConnectorContext
+from commerce.connectors.base import ConnectorCapabilities, ConnectorContext, simulated_result
 from commerce.fixtures import fixture_dir, load_entities, load_metrics_daily_rows, load_metrics_intraday_rows
 
 
+@lru_cache(maxsize=8)
+def _sorted_fixture(loader, d: str, key: str, _stamp: tuple[int, int]) -> tuple[list[dict[str, Any]], list[str]]:
+    # `_stamp` (mtime_ns, size) is only part of the cache key, so an edited fixture is re-read.
+    rows = sorted((r for r in loader(Path(d)) if r.get(key)), key=lambda r: r[key])
+    return rows, [r[key] for r in rows]
+
+
+def _fixture_stamp(p: Path) -> tuple[int, int]:
+    try:
+        st = p.stat()
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
 class TikTokAdsConnector:
     """
     TikTok Ads connector (Marketing API).
@@ -35,79 +54,84 @@ class TikTokAdsConnector:
         if mode != "fixture":
             return
         d = fixture_dir(self.ctx.platform, self.ctx.config)
-        for e in load_entities(d):
-            self.repo.upsert_entity(
-                platform=e.get("platform") or self.ctx.platform,
-                account_id=e.get("account_id"),
-                entity_type=e.get("entity_type") or "",
-                entity_id=e.get("entity_id") or "",
-                parent_type=e.get("parent_type"),
-                parent_id=e.get("parent_id"),
-                name=e.get("name"),
-                status=e.get("status"),
-                meta_json=e.get("meta_json") or {},
-            )
+        self.repo.upsert_entities_bulk(
+            {
+                "platform": e.get("platform") or self.ctx.platform,
+                "account_id": e.get("account_id"),
+                "entity_type": e.get("entity_type") or "",
+                "entity_id": e.get("entity_id") or "",
+                "parent_type": e.get("parent_type"),
+                "parent_id": e.get("parent_id"),
+                "name": e.get("name"),
+                "status": e.get("status"),
+                "meta_json": e.get("meta_json") or {},
+            }
+            for e in load_entities(d)
+        )
 
     async def fetch_metrics_daily(self, date_from: str, date_to: str) -> None:
         mode = str(self.ctx.config.get("mode", "import")).strip().lower()
         if mode != "fixture":
             return
-        d0 = date.fromisoformat(date_from)
-        d1 = date.fromisoformat(date_to)
+        # ISO dates sort lexicographically, so the window is a bisect slice of the sorted fixture.
+        d0 = date.fromisoformat(date_from).isoformat()
+        d1 = date.fromisoformat(date_to).isoformat()
         d = fixture_dir(self.ctx.platform, self.ctx.config)
-        for row in load_metrics_daily_rows(d):
-            day = str(row.get("date") or "")
-            if not day:
-                continue
-            dd = date.fromisoformat(day)
-            if dd < d0 or dd > d1:
-                continue
-            self.repo.upsert_metric_daily(
-                platform=row.get("platform") or self.ctx.platform,
-                account_id=row.get("account_id"),
-                entity_type=row.get("entity_type") or "",
-                entity_id=row.get("entity_id") or "",
-                day=day,
-                spend=row.get("spend"),
-                impressions=row.get("impressions"),
-                clicks=row.get("clicks"),
-                conversions=row.get("conversions"),
-                conversion_value=row.get("conversion_value"),
-                metrics_json=row.get("metrics_json") or {},
+        sorted_rows, days = _sorted_fixture(
+            load_metrics_daily_rows, str(d), "date", _fixture_stamp(d / "metrics_daily.csv")
+        )
+        lo = bisect.bisect_left(days, d0)
+        hi = bisect.bisect_right(days, d1)
+        rows: list[dict[str, Any]] = []
+        for row in sorted_rows[lo:hi]:
+            day = row["date"]
+            rows.append(
+                {
+                    "platform": row.get("platform") or self.ctx.platform,
+                    "account_id": row.get("account_id"),
+                    "entity_type": row.get("entity_type") or "",
+                    "entity_id": row.get("entity_id") or "",
+                    "day": day,
+                    "spend": row.get("spend"),
+                    "impressions": row.get("impressions"),
+                    "clicks": row.get("clicks"),
+                    "conversions": row.get("conversions"),
+                    "conversion_value": row.get("conversion_value"),
+                    "metrics_json": row.get("metrics_json") or {},
+                }
             )
+        self.repo.upsert_metrics_daily_bulk(rows)
 
     async def fetch_metrics_intraday(self, day: str) -> None:
         mode = str(self.ctx.config.get("mode", "import")).strip().lower()
         if mode != "fixture":
             return
         d = fixture_dir(self.ctx.platform, self.ctx.config)
-        for row in load_metrics_intraday_rows(d):
-            hour_ts = str(row.get("hour_ts") or "")
-            if not hour_ts.startswith(day):
-                continue
-            self.repo.upsert_metric_intraday(
-                platform=row.get("platform") or self.ctx.platform,
-                account_id=row.get("account_id"),
-                entity_type=row.get("entity_type") or "",
-                entity_id=row.get("entity_id") or "",
-                hour_ts=hour_ts,
-                spend=row.get("spend"),
-                impressions=row.get("impressions"),
-                clicks=row.get("clicks"),
-                conversions=row.get("conversions"),
-                conversion_value=row.get("conversion_value"),
-                metrics_json=row.get("metrics_json") or {},
-            )
+        sorted_rows, hours = _sorted_fixture(
+            load_metrics_intraday_rows, str(d), "hour_ts", _fixture_stamp(d / "metrics_intraday.csv")
+        )
+        # Every hour_ts starting with `day` sorts inside [day, day + U+FFFF).
+        lo = bisect.bisect_left(hours, day)
+        hi = bisect.bisect_left(hours, day + "\uffff")
+        self.repo.upsert_metrics_intraday_bulk(
+            {
+                "platform": row.get("platform") or self.ctx.platform,
+                "account_id": row.get("account_id"),
+                "entity_type": row.get("entity_type") or "",
+                "entity_id": row.get("entity_id") or "",
+                "hour_ts": row["hour_ts"],
+                "spend": row.get("spend"),
+                "impressions": row.get("impressions"),
+                "clicks": row.get("clicks"),
+                "conversions": row.get("conversions"),
+                "conversion_value": row.get("conversion_value"),
+                "metrics_json": row.get("metrics_json") or {},
+            }
+            for row in sorted_rows[lo:hi]
+        )
 
     async def apply_action(self, proposal: dict) -> dict:
         mode = str(self.ctx.config.get("mode", "import")).strip().lower()
         if mode in {"import", "fixture"}:
-            return {
-                "simulated": True,
-                "mode": mode,
-                "platform": self.ctx.platform,
-                "action_type": proposal.get("action_type"),
-                "entity_type": proposal.get("entity_type"),
-                "entity_id": proposal.get("entity_id"),
-            }
+            return simulated_result(mode, self.ctx.platform, proposal)
         raise NotImplementedError
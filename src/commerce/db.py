@@ -1,30 +1,263 @@
 from __future__ import annotations
 
 import json
+import os
+import queue
 import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from commerce.util import now_utc_iso, new_id
 
 
-SCHEMA_VERSION = 5
+SCHEMA_VERSION = 8
+
+_SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+# Each reader holds up to 64 MB of page cache plus a 256 MB mmap, so their
+# number is capped rather than growing with every thread that reads.
+_READER_POOL_SIZE = 4
+
+_METRIC_V5_COLUMNS = (
+    "platform", "connector_id", "account_id", "entity_type", "entity_id", "{time}",
+    "spend", "impressions", "clicks", "conversions", "conversion_value", "metrics_json",
+)
+
+
+def _metric_v5_ddl(table: str, time_col: str) -> tuple[str, tuple[str, ...]]:
+    ddl = f"""
+    CREATE TABLE {table} (
+      platform TEXT NOT NULL,
+      connector_id TEXT NOT NULL DEFAULT '',
+      account_id TEXT,
+      entity_type TEXT NOT NULL,
+      entity_id TEXT NOT NULL,
+      {time_col} TEXT NOT NULL,
+      spend REAL,
+      impressions INTEGER,
+      clicks INTEGER,
+      conversions REAL,
+      conversion_value REAL,
+      metrics_json TEXT NOT NULL DEFAULT '{{}}',
+      PRIMARY KEY (platform, connector_id, entity_type, entity_id, {time_col})
+    ) WITHOUT ROWID
+    """
+    return ddl, tuple(c.format(time=time_col) for c in _METRIC_V5_COLUMNS)
+
+
+# v5 layouts of the tables that gained connector_id: (CREATE TABLE, column order).
+# The metric tables are WITHOUT ROWID since v7: they are only ever addressed by
+# their composite key, so the rows live in the primary-key B-tree itself.
+_V5_TABLE_DDL: dict[str, tuple[str, tuple[str, ...]]] = {
+    "entities": (
+        """
+        CREATE TABLE entities (
+          platform TEXT NOT NULL,
+          connector_id TEXT NOT NULL DEFAULT '',
+          account_id TEXT,
+          entity_type TEXT NOT NULL,
+          entity_id TEXT NOT NULL,
+          parent_type TEXT,
+          parent_id TEXT,
+          name TEXT,
+          status TEXT,
+          meta_json TEXT NOT NULL DEFAULT '{}',
+          updated_at TEXT NOT NULL,
+          PRIMARY KEY (platform, connector_id, entity_type, entity_id)
+        )
+        """,
+        (
+            "platform", "connector_id", "account_id", "entity_type", "entity_id",
+            "parent_type", "parent_id", "name", "status", "meta_json", "updated_at",
+        ),
+    ),
+    "metrics_daily": _metric_v5_ddl("metrics_daily", "date"),
+    "metrics_intraday": _metric_v5_ddl("metrics_intraday", "hour_ts"),
+}
+
+# Fixed SQL text, so the long-lived connections hit sqlite3's statement cache.
+_SQL_GET_PROPOSAL = "SELECT * FROM action_proposals WHERE id=?"
+# Seed configs never change, so they are serialized once at import.
+_DEFAULT_CONFIG_JSON = json.dumps({"mode": "import"}, ensure_ascii=True)
+_NAVER_DEFAULT_CONFIG_JSON = json.dumps(
+    {"mode": "import", "product_types": ["powerlink", "powercontent", "shoppingsearch"]},
+    ensure_ascii=True,
+)
+
+# Existing connectors keep their config unless it is empty.
+_SQL_SEED_CONNECTOR = """
+INSERT INTO connectors(
+  id, platform, name, enabled, config_json, capabilities_json, created_at, updated_at
+) VALUES(?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(platform, name) DO UPDATE SET
+  enabled=excluded.enabled,
+  updated_at=excluded.updated_at,
+  config_json=CASE
+    WHEN TRIM(COALESCE(connectors.config_json, ''), char(32, 9, 10, 13)) IN ('', '{}', 'null')
+    THEN excluded.config_json
+    ELSE connectors.config_json
+  END
+"""
+
+_DEFAULT_KPI_PROFILE_NAME = "Default: Spend Guardrail"
+_DEFAULT_KPI_DEFINITION_JSON = json.dumps(
+    {
+        "description": "Default guardrail profile for early MVP",
+        "primary_metrics": ["spend", "conversions", "conversion_value"],
+    }
+)
+_DEFAULT_RULE_NAME = "Kill Switch: Spend > 50000 and conversions == 0"
+_DEFAULT_RULE_PARAMS_JSON = json.dumps(
+    {
+        "entity_type": "campaign",
+        "spend_threshold": 50000,
+        "clicks_threshold": 10,
+        "conversion_threshold": 0,
+        "auto_execute": False,
+    }
+)
+
+# kpi_profiles.name is user-editable and not unique, so the default profile is
+# guarded with NOT EXISTS; rules are only seeded here and carry a unique name.
+_SQL_ENSURE_KPI_PROFILE = """
+INSERT INTO kpi_profiles(id, name, platform, objective, definition_json, created_at, updated_at)
+SELECT ?1, ?2, NULL, 'guardrail', ?3, ?4, ?4
+WHERE NOT EXISTS (SELECT 1 FROM kpi_profiles WHERE name=?2)
+RETURNING id
+"""
+
+_SQL_ENSURE_DEFAULT_RULE = """
+INSERT INTO rules(
+  id, name, enabled, platform, kpi_profile_id, rule_type, params_json, created_at, updated_at
+) VALUES(?1, ?2, 0, NULL, ?3, 'kill_switch_spend_no_conv', ?4, ?5, ?5)
+ON CONFLICT(name) DO NOTHING
+"""
+
+_PROPOSAL_COLUMNS = frozenset(
+    {
+        "id", "created_at", "updated_at", "status", "platform", "connector_id",
+        "action_type", "account_id", "entity_type", "entity_id", "payload_json",
+        "reason", "risk", "requires_approval", "approved_by", "approved_at",
+        "executed_at", "result_json", "error", "telegram_chat_id", "telegram_message_id",
+    }
+)
+
+
+# Listing SQL is built once per (fields, status filter), keeping its text stable too.
+@lru_cache(maxsize=32)
+def _list_proposals_sql(fields: tuple[str, ...] | None, by_status: bool) -> str:
+    if fields is None:
+        cols = "*"
+    else:
+        unknown = [f for f in fields if f not in _PROPOSAL_COLUMNS]
+        if unknown:
+            raise ValueError(f"unknown action_proposals columns: {unknown}")
+        if not fields:
+            raise ValueError("fields must name at least one column")
+        cols = ", ".join(fields)
+    where = " WHERE status=?" if by_status else ""
+    return f"SELECT {cols} FROM action_proposals{where} ORDER BY created_at DESC LIMIT ?"
+
+
+def _synchronous_level() -> str:
+    # NORMAL is crash-safe under WAL (only the last commits can roll back on power
+    # loss); operators who need every commit fsynced can set FULL.
+    raw = (os.getenv("ADS_SQLITE_SYNCHRONOUS") or "NORMAL").strip().upper()
+    return raw if raw in _SYNCHRONOUS_LEVELS else "NORMAL"
+
+
+def configure_connection(conn: sqlite3.Connection) -> None:
+    """Apply the per-connection PRAGMAs shared by AdsDB and Repo."""
+    conn.execute("PRAGMA foreign_keys = ON;")
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute(f"PRAGMA synchronous = {_synchronous_level()};")
+    conn.execute("PRAGMA busy_timeout = 5000;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -65536;")
+    conn.execute("PRAGMA mmap_size = 268435456;")
 
 
 class AdsDB:
+    """
+    Schema owner plus a few direct queries.
+    Connections are long-lived: one writer shared behind a lock and a small pool of
+    readers (WAL lets readers run alongside the writer), so PRAGMAs run once per
+    connection and SQLite's page/statement caches stay warm. Call close() when done.
+    """
+
     def __init__(self, db_path: Path):
         self.db_path = db_path
-
-    def _connect(self) -> sqlite3.Connection:
+        self._writer: sqlite3.Connection | None = None
+        self._write_lock = threading.Lock()
+        # Idle readers are reused most-recent-first; _readers tracks every open one.
+        self._idle_readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+    def _connect(self, *, check_same_thread: bool = True) -> sqlite3.Connection:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, check_same_thread=check_same_thread, cached_statements=256)
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
-        conn.execute("PRAGMA journal_mode = WAL;")
+        configure_connection(conn)
         return conn
 
+    def _get_writer(self) -> sqlite3.Connection:
+        # Only used under _write_lock, so sharing it across threads is safe.
+        if self._writer is None:
+            self._writer = self._connect(check_same_thread=False)
+        return self._writer
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock:
+            conn = self._get_writer()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    @contextmanager
+    def _get_reader(self) -> Iterator[sqlite3.Connection]:
+        try:
+            conn = self._idle_readers.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._readers_lock:
+                if len(self._readers) < _READER_POOL_SIZE:
+                    # Readers move between threads, but only one uses a connection at a time.
+                    conn = self._connect(check_same_thread=False)
+                    self._readers.append(conn)
+            if conn is None:
+                conn = self._idle_readers.get()
+        try:
+            yield conn
+        finally:
+            with self._readers_lock:
+                # A reader closed by close() while in use is not handed out again.
+                if conn in self._readers:
+                    self._idle_readers.put(conn)
+
+    def close(self) -> None:
+        with self._write_lock:
+            writer, self._writer = self._writer, None
+            if writer is not None:
+                writer.close()
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+            while not self._idle_readers.empty():
+                self._idle_readers.get_nowait()
+        for reader in readers:
+            reader.close()
+
     def init(self) -> None:
-        with self._connect() as conn:
+        # executescript commits on its own, so DDL runs on the writer without BEGIN IMMEDIATE.
+        with self._write_lock, self._get_writer() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS meta (
@@ -34,6 +267,10 @@ class AdsDB:
                 """
             )
             current_version = self._get_schema_version(conn)
+            if current_version == SCHEMA_VERSION:
+                # Every statement below is an IF NOT EXISTS no-op on a current schema;
+                # skip parsing the script. Schema changes must bump SCHEMA_VERSION.
+                return
 
             conn.executescript(
                 """
@@ -79,7 +316,7 @@ class AdsDB:
                   conversion_value REAL,
                   metrics_json TEXT NOT NULL DEFAULT '{}',
                   PRIMARY KEY (platform, connector_id, entity_type, entity_id, date)
-                );
+                ) WITHOUT ROWID;
 
                 CREATE TABLE IF NOT EXISTS metrics_intraday (
                   platform TEXT NOT NULL,
@@ -95,7 +332,7 @@ class AdsDB:
                   conversion_value REAL,
                   metrics_json TEXT NOT NULL DEFAULT '{}',
                   PRIMARY KEY (platform, connector_id, entity_type, entity_id, hour_ts)
-                );
+                ) WITHOUT ROWID;
 
                 CREATE TABLE IF NOT EXISTS kpi_profiles (
                   id TEXT PRIMARY KEY,
@@ -157,8 +394,9 @@ class AdsDB:
                   FOREIGN KEY (connector_id) REFERENCES connectors(id)
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_action_proposals_status_created
-                ON action_proposals(status, created_at);
+                DROP INDEX IF EXISTS idx_action_proposals_status_created;
+                CREATE INDEX IF NOT EXISTS idx_action_proposals_status_created_desc
+                ON action_proposals(status, created_at DESC);
 
                 CREATE TABLE IF NOT EXISTS executions (
                   id TEXT PRIMARY KEY,
@@ -172,6 +410,9 @@ class AdsDB:
                   FOREIGN KEY (proposal_id) REFERENCES action_proposals(id)
                 );
 
+                CREATE INDEX IF NOT EXISTS idx_executions_proposal
+                ON executions(proposal_id);
+
                 CREATE TABLE IF NOT EXISTS tracking_links (
                   code TEXT PRIMARY KEY,
                   destination_url TEXT NOT NULL,
@@ -246,6 +487,10 @@ class AdsDB:
             )
             if current_version < 5:
                 self._migrate_to_v5(conn)
+            if current_version < 7:
+                self._migrate_to_v7(conn)
+            if current_version < 8:
+                self._migrate_to_v8(conn)
             self._ensure_v5_indexes(conn)
             conn.execute(
                 "INSERT OR REPLACE INTO meta(key, value) VALUES(?, ?)",
@@ -263,165 +508,118 @@ class AdsDB:
         except Exception:
             return 0
 
-    def _table_exists(self, conn: sqlite3.Connection, table: str) -> bool:
-        row = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-            (table,),
-        ).fetchone()
-        return row is not None
-
-    def _column_exists(self, conn: sqlite3.Connection, table: str, column: str) -> bool:
-        rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
-        return any(str(r["name"]) == column for r in rows)
+    def _table_columns(self, conn: sqlite3.Connection, tables: Iterable[str]) -> dict[str, set[str]]:
+        # One sqlite_master x pragma_table_info join for every table instead of a
+        # PRAGMA scan per probed column; missing tables are simply absent.
+        tables = tuple(tables)
+        rows = conn.execute(
+            "SELECT m.name, c.name FROM sqlite_master m, pragma_table_info(m.name) c "
+            f"WHERE m.type='table' AND m.name IN ({', '.join('?' * len(tables))})",
+            tables,
+        ).fetchall()
+        schema: dict[str, set[str]] = {}
+        for table, column in rows:
+            schema.setdefault(table, set()).add(column)
+        return schema
 
     def _migrate_to_v5(self, conn: sqlite3.Connection) -> None:
-        if self._table_exists(conn, "entities") and not self._column_exists(conn, "entities", "connector_id"):
-            conn.executescript(
-                """
-                ALTER TABLE entities RENAME TO entities_v4_old;
-                CREATE TABLE entities (
-                  platform TEXT NOT NULL,
-                  connector_id TEXT NOT NULL DEFAULT '',
-                  account_id TEXT,
-                  entity_type TEXT NOT NULL,
-                  entity_id TEXT NOT NULL,
-                  parent_type TEXT,
-                  parent_id TEXT,
-                  name TEXT,
-                  status TEXT,
-                  meta_json TEXT NOT NULL DEFAULT '{}',
-                  updated_at TEXT NOT NULL,
-                  PRIMARY KEY (platform, connector_id, entity_type, entity_id)
-                );
-                """
-            )
+        schema = self._table_columns(conn, _V5_TABLE_DDL)
+        pending = [table for table in _V5_TABLE_DDL if table in schema and "connector_id" not in schema[table]]
+        if not pending:
+            return
+        # One transaction for the whole migration, and the platform -> connector map
+        # is computed once instead of per table.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
             conn.execute(
-                """
-                INSERT INTO entities(
-                  platform, connector_id, account_id, entity_type, entity_id,
-                  parent_type, parent_id, name, status, meta_json, updated_at
-                )
-                SELECT
-                  e.platform,
-                  COALESCE(pc.connector_id, ''),
-                  e.account_id,
-                  e.entity_type,
-                  e.entity_id,
-                  e.parent_type,
-                  e.parent_id,
-                  e.name,
-                  e.status,
-                  e.meta_json,
-                  e.updated_at
-                FROM entities_v4_old e
-                LEFT JOIN (
-                  SELECT platform, MIN(id) AS connector_id
-                  FROM connectors
-                  GROUP BY platform
-                ) pc ON pc.platform = e.platform
-                """
+                "CREATE TEMP TABLE _pc AS "
+                "SELECT platform, MIN(id) AS connector_id FROM connectors GROUP BY platform"
             )
-            conn.execute("DROP TABLE entities_v4_old")
-
-        if self._table_exists(conn, "metrics_daily") and not self._column_exists(conn, "metrics_daily", "connector_id"):
-            conn.executescript(
-                """
-                ALTER TABLE metrics_daily RENAME TO metrics_daily_v4_old;
-                CREATE TABLE metrics_daily (
-                  platform TEXT NOT NULL,
-                  connector_id TEXT NOT NULL DEFAULT '',
-                  account_id TEXT,
-                  entity_type TEXT NOT NULL,
-                  entity_id TEXT NOT NULL,
-                  date TEXT NOT NULL,
-                  spend REAL,
-                  impressions INTEGER,
-                  clicks INTEGER,
-                  conversions REAL,
-                  conversion_value REAL,
-                  metrics_json TEXT NOT NULL DEFAULT '{}',
-                  PRIMARY KEY (platform, connector_id, entity_type, entity_id, date)
-                );
-                """
+            conn.execute("CREATE INDEX temp._pc_platform ON _pc(platform)")
+            for table in pending:
+                self._rebuild_table(conn, table, backfill_connector_id=True)
+            conn.execute("DROP TABLE temp._pc")
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def _migrate_to_v7(self, conn: sqlite3.Connection) -> None:
+        pending = [
+            r[0]
+            for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name IN ('metrics_daily', 'metrics_intraday') "
+                "AND sql NOT LIKE '%WITHOUT ROWID%'"
             )
+        ]
+        if not pending:
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for table in pending:
+                self._rebuild_table(conn, table, backfill_connector_id=False)
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def _migrate_to_v8(self, conn: sqlite3.Connection) -> None:
+        # Seeding used to SELECT then INSERT without a lock, so processes starting
+        # together could duplicate a connector or the default rule. Keep MIN(id) of
+        # each duplicate set, repoint connector references, then make names unique.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
             conn.execute(
-                """
-                INSERT INTO metrics_daily(
-                  platform, connector_id, account_id, entity_type, entity_id, date,
-                  spend, impressions, clicks, conversions, conversion_value, metrics_json
-                )
-                SELECT
-                  m.platform,
-                  COALESCE(pc.connector_id, ''),
-                  m.account_id,
-                  m.entity_type,
-                  m.entity_id,
-                  m.date,
-                  m.spend,
-                  m.impressions,
-                  m.clicks,
-                  m.conversions,
-                  m.conversion_value,
-                  m.metrics_json
-                FROM metrics_daily_v4_old m
-                LEFT JOIN (
-                  SELECT platform, MIN(id) AS connector_id
-                  FROM connectors
-                  GROUP BY platform
-                ) pc ON pc.platform = m.platform
-                """
+                "CREATE TEMP TABLE _dup AS "
+                "SELECT c.id AS old_id, k.keep_id FROM connectors c JOIN ("
+                "  SELECT platform, name, MIN(id) AS keep_id FROM connectors"
+                "  GROUP BY platform, name HAVING COUNT(*) > 1"
+                ") k ON k.platform = c.platform AND k.name = c.name "
+                "WHERE c.id <> k.keep_id"
             )
-            conn.execute("DROP TABLE metrics_daily_v4_old")
-
-        if self._table_exists(conn, "metrics_intraday") and not self._column_exists(conn, "metrics_intraday", "connector_id"):
-            conn.executescript(
-                """
-                ALTER TABLE metrics_intraday RENAME TO metrics_intraday_v4_old;
-                CREATE TABLE metrics_intraday (
-                  platform TEXT NOT NULL,
-                  connector_id TEXT NOT NULL DEFAULT '',
-                  account_id TEXT,
-                  entity_type TEXT NOT NULL,
-                  entity_id TEXT NOT NULL,
-                  hour_ts TEXT NOT NULL,
-                  spend REAL,
-                  impressions INTEGER,
-                  clicks INTEGER,
-                  conversions REAL,
-                  conversion_value REAL,
-                  metrics_json TEXT NOT NULL DEFAULT '{}',
-                  PRIMARY KEY (platform, connector_id, entity_type, entity_id, hour_ts)
-                );
-                """
+            repoint = "connector_id = (SELECT keep_id FROM _dup WHERE old_id = connector_id)"
+            moved = "connector_id IN (SELECT old_id FROM _dup)"
+            for table in ("entities", "metrics_daily", "metrics_intraday"):
+                # Rows the kept connector already has win; the duplicate's copies go.
+                conn.execute(f"UPDATE OR IGNORE {table} SET {repoint} WHERE {moved}")
+                conn.execute(f"DELETE FROM {table} WHERE {moved}")
+            conn.execute(f"UPDATE action_proposals SET {repoint} WHERE {moved}")
+            conn.execute("DELETE FROM connectors WHERE id IN (SELECT old_id FROM _dup)")
+            conn.execute("DROP TABLE temp._dup")
+
+            # A copy of a rule someone enabled keeps the kept row enabled.
+            conn.execute(
+                "UPDATE rules SET enabled = (SELECT MAX(r.enabled) FROM rules r WHERE r.name = rules.name) "
+                "WHERE id IN (SELECT MIN(id) FROM rules GROUP BY name HAVING COUNT(*) > 1)"
             )
+            conn.execute("DELETE FROM rules WHERE id NOT IN (SELECT MIN(id) FROM rules GROUP BY name)")
+
             conn.execute(
-                """
-                INSERT INTO metrics_intraday(
-                  platform, connector_id, account_id, entity_type, entity_id, hour_ts,
-                  spend, impressions, clicks, conversions, conversion_value, metrics_json
-                )
-                SELECT
-                  m.platform,
-                  COALESCE(pc.connector_id, ''),
-                  m.account_id,
-                  m.entity_type,
-                  m.entity_id,
-                  m.hour_ts,
-                  m.spend,
-                  m.impressions,
-                  m.clicks,
-                  m.conversions,
-                  m.conversion_value,
-                  m.metrics_json
-                FROM metrics_intraday_v4_old m
-                LEFT JOIN (
-                  SELECT platform, MIN(id) AS connector_id
-                  FROM connectors
-                  GROUP BY platform
-                ) pc ON pc.platform = m.platform
-                """
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_connectors_platform_name ON connectors(platform, name)"
+            )
+            conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_rules_name ON rules(name)")
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def _rebuild_table(self, conn: sqlite3.Connection, table: str, *, backfill_connector_id: bool) -> None:
+        # Indexes follow the renamed table and are dropped with it;
+        # _ensure_v5_indexes recreates them on the new one.
+        ddl, columns = _V5_TABLE_DDL[table]
+        old = f"{table}_old"
+        conn.execute(f"ALTER TABLE {table} RENAME TO {old}")
+        conn.execute(ddl)
+        if backfill_connector_id:
+            select = ", ".join(
+                "COALESCE(pc.connector_id, '')" if c == "connector_id" else f"o.{c}" for c in columns
             )
-            conn.execute("DROP TABLE metrics_intraday_v4_old")
+            source = f"{old} o LEFT JOIN _pc pc ON pc.platform = o.platform"
+        else:
+            select = ", ".join(f"o.{c}" for c in columns)
+            source = f"{old} o"
+        conn.execute(f"INSERT INTO {table}({', '.join(columns)}) SELECT {select} FROM {source}")
+        conn.execute(f"DROP TABLE {old}")
 
     def _ensure_v5_indexes(self, conn: sqlite3.Connection) -> None:
         conn.executescript(
@@ -446,124 +644,60 @@ class AdsDB:
             ("smartstore", "Naver Smart Store", 0),
             ("cafe24_analytics", "Cafe24 Analytics", 0),
         ]
-        with self._connect() as conn:
-            for platform, name, enabled in defaults:
-                row = conn.execute(
-                    "SELECT id, config_json FROM connectors WHERE platform=? AND name=?",
-                    (platform, name),
-                ).fetchone()
-                default_config = {"mode": "import"}
-                if platform == "naver":
-                    default_config = {
-                        "mode": "import",
-                        "product_types": ["powerlink", "powercontent", "shoppingsearch"],
-                    }
-                if row:
-                    # Preserve existing config unless it's empty.
-                    cfg_raw = (row["config_json"] or "").strip()
-                    if cfg_raw in {"", "{}", "null"}:
-                        conn.execute(
-                            "UPDATE connectors SET enabled=?, config_json=?, updated_at=? WHERE id=?",
-                            (enabled, json.dumps(default_config, ensure_ascii=True), now, row["id"]),
-                        )
-                    else:
-                        conn.execute(
-                            "UPDATE connectors SET enabled=?, updated_at=? WHERE id=?",
-                            (enabled, now, row["id"]),
-                        )
-                    continue
-                conn.execute(
-                    """
-                    INSERT INTO connectors(
-                      id, platform, name, enabled, config_json, capabilities_json,
-                      created_at, updated_at
-                    ) VALUES(?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        new_id("con"),
-                        platform,
-                        name,
-                        enabled,
-                        json.dumps(default_config, ensure_ascii=True),
-                        json.dumps({}),
-                        now,
-                        now,
-                    ),
-                )
+        params = [
+            (
+                new_id("con"),
+                platform,
+                name,
+                enabled,
+                _NAVER_DEFAULT_CONFIG_JSON if platform == "naver" else _DEFAULT_CONFIG_JSON,
+                "{}",
+                now,
+                now,
+            )
+            for platform, name, enabled in defaults
+        ]
+        with self._write() as conn:
+            conn.executemany(_SQL_SEED_CONNECTOR, params)
 
             profile_id = self._ensure_kpi_profile(conn, now)
             self._ensure_default_rule(conn, now, profile_id)
 
     def _ensure_kpi_profile(self, conn: sqlite3.Connection, now: str) -> str:
         row = conn.execute(
-            "SELECT id FROM kpi_profiles WHERE name=?",
-            ("Default: Spend Guardrail",),
+            _SQL_ENSURE_KPI_PROFILE,
+            (new_id("kpi"), _DEFAULT_KPI_PROFILE_NAME, _DEFAULT_KPI_DEFINITION_JSON, now),
         ).fetchone()
-        if row:
-            return str(row["id"])
-        pid = new_id("kpi")
-        definition = {
-            "description": "Default guardrail profile for early MVP",
-            "primary_metrics": ["spend", "conversions", "conversion_value"],
-        }
-        conn.execute(
-            """
-            INSERT INTO kpi_profiles(id, name, platform, objective, definition_json, created_at, updated_at)
-            VALUES(?, ?, ?, ?, ?, ?, ?)
-            """,
-            (pid, "Default: Spend Guardrail", None, "guardrail", json.dumps(definition), now, now),
-        )
-        return pid
+        if row is None:
+            row = conn.execute(
+                "SELECT id FROM kpi_profiles WHERE name=?",
+                (_DEFAULT_KPI_PROFILE_NAME,),
+            ).fetchone()
+        return str(row["id"])
 
     def _ensure_default_rule(self, conn: sqlite3.Connection, now: str, kpi_profile_id: str) -> None:
-        row = conn.execute(
-            "SELECT id FROM rules WHERE name=?",
-            ("Kill Switch: Spend > 50000 and conversions == 0",),
-        ).fetchone()
-        if row:
-            return
-        params = {
-            "entity_type": "campaign",
-            "spend_threshold": 50000,
-            "clicks_threshold": 10,
-            "conversion_threshold": 0,
-            "auto_execute": False,
-        }
         conn.execute(
-            """
-            INSERT INTO rules(
-              id, name, enabled, platform, kpi_profile_id, rule_type, params_json, created_at, updated_at
-            ) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                new_id("rule"),
-                "Kill Switch: Spend > 50000 and conversions == 0",
-                0,
-                None,
-                kpi_profile_id,
-                "kill_switch_spend_no_conv",
-                json.dumps(params),
-                now,
-                now,
-            ),
+            _SQL_ENSURE_DEFAULT_RULE,
+            (new_id("rule"), _DEFAULT_RULE_NAME, kpi_profile_id, _DEFAULT_RULE_PARAMS_JSON, now),
         )
 
-    def list_action_proposals(self, status: str | None = None, limit: int = 50) -> list[dict[str, Any]]:
-        sql = "SELECT * FROM action_proposals"
-        params: list[Any] = []
-        if status:
-            sql += " WHERE status=?"
-            params.append(status)
-        sql += " ORDER BY created_at DESC LIMIT ?"
-        params.append(limit)
-        with self._connect() as conn:
-            rows = conn.execute(sql, params).fetchall()
-            return [dict(r) for r in rows]
+    def list_action_proposals(
+        self,
+        status: str | None = None,
+        limit: int = 50,
+        *,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[sqlite3.Row]:
+        """
+        Newest proposals first, as sqlite3.Row (mapping access, no per-row dict).
+        `fields` narrows the SELECT to the given action_proposals columns.
+        """
+        sql = _list_proposals_sql(fields, bool(status))
+        params = (status, limit) if status else (limit,)
+        with self._get_reader() as conn:
+            return conn.execute(sql, params).fetchall()
 
     def get_action_proposal(self, proposal_id: str) -> dict[str, Any] | None:
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT * FROM action_proposals WHERE id=?",
-                (proposal_id,),
-            ).fetchone()
+        with self._get_reader() as conn:
+            row = conn.execute(_SQL_GET_PROPOSAL, (proposal_id,)).fetchone()
             return dict(row) if row else None
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
 from commerce.config import Settings
+from commerce.connectors.base import BaseConnector, close_connector, proposal_payload  # noqa: F401 - re-exported
 from commerce.registry import build_connector
 from commerce.repo import Repo
 from commerce.util import now_utc_iso
@@ -19,6 +20,7 @@ async def execute_proposal(
     repo: Repo,
     proposal_id: str,
     actor: str,
+    connector: BaseConnector | None = None,
 ) -> dict[str, Any]:
     """
     Execute an action proposal via its connector and write an audit log.
@@ -26,6 +28,10 @@ async def execute_proposal(
     Rules:
     - If requires_approval=1, proposal must be status=approved.
     - If requires_approval=0, proposal can be executed from proposed/approved.
+
+    Callers executing several proposals of one connector may pass that connector
+    (built for the proposal's connector_id) to reuse its HTTP client; they close it.
+    Otherwise one is built for this call and closed afterwards.
     """
     proposal = repo.get_proposal(proposal_id)
     if not proposal:
@@ -39,51 +45,58 @@ async def execute_proposal(
     if not connector_id:
         raise ExecutionError("proposal missing connector_id")
 
-    connector_row = repo.get_connector(str(connector_id))
-    if not connector_row:
-        raise ExecutionError("connector not found for proposal")
+    owns_connector = connector is None
+    if connector is None:
+        connector_row = repo.get_connector(str(connector_id))
+        if not connector_row:
+            raise ExecutionError("connector not found for proposal")
 
-    connector = build_connector(
-        connector_row["platform"],
-        connector_id=connector_row["id"],
-        name=connector_row["name"],
-        config_json=connector_row["config_json"],
-        repo=repo,
-        demo_mode=settings.demo_mode,
-    )
+        connector = build_connector(
+            connector_row["platform"],
+            connector_id=connector_row["id"],
+            name=connector_row["name"],
+            config_json=connector_row["config_json"],
+            repo=repo,
+            demo_mode=settings.demo_mode,
+        )
+    elif connector.ctx.connector_id != str(connector_id):
+        raise ExecutionError("connector does not match proposal")
 
-    exec_id = repo.create_execution(proposal_id)
+    # Audit writes may wait on SQLite's writer lock (busy_timeout), so they run in a
+    # worker thread rather than stalling the event loop shared with web/bot handlers.
+    exec_id = await asyncio.to_thread(repo.create_execution, proposal_id)
     started = now_utc_iso()
     try:
         result = await connector.apply_action(proposal)
-        repo.finish_execution(exec_id, status="success", before_json=proposal, after_json=result, error=None)
-        repo.set_proposal_result(
+        await asyncio.to_thread(
+            repo.complete_execution,
+            exec_id,
             proposal_id,
-            status="executed",
+            status="success",
+            proposal_status="executed",
             executed_at=started,
+            before_json=proposal,
+            after_json=result,
             result_json={"actor": actor, "result": result},
             error=None,
         )
         return result
     except Exception as e:  # noqa: BLE001 - record error, do not crash caller
         err = f"{type(e).__name__}: {e}"
-        repo.finish_execution(exec_id, status="failed", before_json=proposal, after_json=None, error=err)
-        repo.set_proposal_result(
+        await asyncio.to_thread(
+            repo.complete_execution,
+            exec_id,
             proposal_id,
             status="failed",
+            proposal_status="failed",
             executed_at=started,
+            before_json=proposal,
+            after_json=None,
             result_json={"actor": actor},
             error=err,
         )
         raise ExecutionError(err) from e
-
-
-def proposal_payload(proposal: dict[str, Any]) -> dict[str, Any]:
-    raw = proposal.get("payload_json") or "{}"
-    if isinstance(raw, dict):
-        return raw
-    try:
-        return json.loads(raw)
-    except Exception:
-        return {}
+    finally:
+        if owns_connector:
+            await close_connector(connector)
 
@@ -14,48 +14,58 @@ def fixture_dir(platform: str, config: dict[str, Any]) -> Path:
 
 
 def _read_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    # One bulk read; json.loads decodes UTF-8 bytes itself, skipping the text-mode reader.
+    return json.loads(path.read_bytes())
 
 
-def load_entities(path: Path) -> list[dict[str, Any]]:
+def load_entities(path: Path) -> Iterable[dict[str, Any]]:
     p = path / "entities.json"
     if not p.exists():
-        return []
+        return
     data = _read_json(p)
-    if isinstance(data, list):
-        return [dict(x) for x in data]
-    raise ValueError("entities.json must be a JSON list")
+    if not isinstance(data, list):
+        raise ValueError("entities.json must be a JSON list")
+    # json.loads already built fresh dicts, so yield them as-is and let each one go
+    # once consumed (pop from the reversed list) rather than copying every element.
+    data.reverse()
+    while data:
+        x = data.pop()
+        if not isinstance(x, dict):
+            raise ValueError("entities.json items must be JSON objects")
+        yield x
 
 
 def _parse_int(v: str | None) -> int | None:
-    if v is None:
-        return None
-    s = str(v).strip()
-    if s == "":
+    # Empty cells are common (absent conversions etc.); return before int() raises.
+    if not v:
         return None
-    s = s.replace(",", "")
     try:
-        return int(float(s))
+        # Plain integers (the common case) skip the replace/float round-trip.
+        return int(v)
+    except ValueError:
+        pass
+    try:
+        return int(float(str(v).replace(",", "")))
     except ValueError:
         return None
 
 
 def _parse_float(v: str | None) -> float | None:
-    if v is None:
-        return None
-    s = str(v).strip()
-    if s == "":
+    if not v:
         return None
-    s = s.replace(",", "")
     try:
-        return float(s)
+        return float(v)
+    except ValueError:
+        pass
+    # float() already ignores surrounding whitespace, so only the commas need removing.
+    try:
+        return float(str(v).replace(",", ""))
     except ValueError:
         return None
 
 
 def _parse_json(v: str | None) -> dict[str, Any]:
-    if not v:
+    if not v or v == "{}":
         return {}
     try:
         x = json.loads(v)
@@ -64,46 +74,56 @@ def _parse_json(v: str | None) -> dict[str, Any]:
         return {"_raw": str(v)}
 
 
-def load_metrics_daily_rows(path: Path) -> Iterable[dict[str, Any]]:
-    p = path / "metrics_daily.csv"
-    if not p.exists():
-        return []
+_METRIC_COLUMNS = (
+    "platform", "account_id", "entity_type", "entity_id", "spend", "impressions",
+    "clicks", "conversions", "conversion_value", "metrics_json",
+)
+
+
+def _iter_metric_rows(p: Path, time_key: str) -> Iterable[dict[str, Any]]:
+    # csv.reader plus header positions resolved once, instead of a dict per raw row
+    # from DictReader; absent columns read as None like DictReader's restval.
     with p.open("r", encoding="utf-8-sig", newline="") as f:
-        r = csv.DictReader(f)
-        for row in r:
+        r = csv.reader(f)
+        header = next(r, None)
+        if header is None:
+            return
+        pos = {name: i for i, name in enumerate(header)}
+        n = len(header)
+        (
+            i_platform, i_account, i_etype, i_eid, i_spend, i_impr,
+            i_clicks, i_conv, i_value, i_json,
+        ) = (pos.get(c, n) for c in _METRIC_COLUMNS)
+        i_time = pos.get(time_key, n)
+        pad = [None] * (n + 1)
+        for raw in r:
+            if not raw:
+                continue
+            row = raw + pad[len(raw):] if len(raw) <= n else raw[:n] + [None]
             yield {
-                "platform": (row.get("platform") or "").strip(),
-                "account_id": (row.get("account_id") or "").strip() or None,
-                "entity_type": (row.get("entity_type") or "").strip(),
-                "entity_id": (row.get("entity_id") or "").strip(),
-                "date": (row.get("date") or "").strip(),
-                "spend": _parse_float(row.get("spend")),
-                "impressions": _parse_int(row.get("impressions")),
-                "clicks": _parse_int(row.get("clicks")),
-                "conversions": _parse_float(row.get("conversions")),
-                "conversion_value": _parse_float(row.get("conversion_value")),
-                "metrics_json": _parse_json(row.get("metrics_json")),
+                "platform": (row[i_platform] or "").strip(),
+                "account_id": (row[i_account] or "").strip() or None,
+                "entity_type": (row[i_etype] or "").strip(),
+                "entity_id": (row[i_eid] or "").strip(),
+                time_key: (row[i_time] or "").strip(),
+                "spend": _parse_float(row[i_spend]),
+                "impressions": _parse_int(row[i_impr]),
+                "clicks": _parse_int(row[i_clicks]),
+                "conversions": _parse_float(row[i_conv]),
+                "conversion_value": _parse_float(row[i_value]),
+                "metrics_json": _parse_json(row[i_json]),
             }
 
 
+def load_metrics_daily_rows(path: Path) -> Iterable[dict[str, Any]]:
+    p = path / "metrics_daily.csv"
+    if not p.exists():
+        return
+    yield from _iter_metric_rows(p, "date")
+
+
 def load_metrics_intraday_rows(path: Path) -> Iterable[dict[str, Any]]:
     p = path / "metrics_intraday.csv"
     if not p.exists():
-        return []
-    with p.open("r", encoding="utf-8-sig", newline="") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            yield {
-                "platform": (row.get("platform") or "").strip(),
-                "account_id": (row.get("account_id") or "").strip() or None,
-                "entity_type": (row.get("entity_type") or "").strip(),
-                "entity_id": (row.get("entity_id") or "").strip(),
-                "hour_ts": (row.get("hour_ts") or "").strip(),
-                "spend": _parse_float(row.get("spend")),
-                "impressions": _parse_int(row.get("impressions")),
-                "clicks": _parse_int(row.get("clicks")),
-                "conversions": _parse_float(row.get("conversions")),
-                "conversion_value": _parse_float(row.get("conversion_value")),
-                "metrics_json": _parse_json(row.get("metrics_json")),
-            }
-
+        return
+    yield from _iter_metric_rows(p, "hour_ts")
@@ -24,20 +24,21 @@ def _read_text_best_effort(path: Path) -> str:
 
 def _first(row: dict[str, Any], keys: list[str]) -> str | None:
     for k in keys:
-        if k in row and str(row.get(k) or "").strip() != "":
-            return str(row.get(k)).strip()
+        v = row.get(k)
+        if v and (s := str(v).strip()):
+            return s
     return None
 
 
 def _parse_float(v: Any) -> float | None:
-    if v is None:
+    if v is None or v == "":
         return None
-    s = str(v).strip()
-    if s == "":
-        return None
-    s = s.replace(",", "")
     try:
-        return float(s)
+        return float(v)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return float(str(v).replace(",", ""))
     except ValueError:
         return None
 
@@ -104,6 +105,7 @@ def import_cafe24_orders_csv(repo: Repo, *, path: Path, opts: Cafe24OrdersImport
 
     inserted = 0
     skipped = 0
+    order_rows: list[dict[str, Any]] = []
 
     for r in rows:
         order_id = _first(
@@ -191,24 +193,28 @@ def import_cafe24_orders_csv(repo: Repo, *, path: Path, opts: Cafe24OrdersImport
         referer = _first(r, ["referer", "referrer", "유입URL", "유입 URL", "참조URL", "참조 URL"])
         source_raw = inflow_path_detail or inflow_path or referer
 
-        repo.upsert_store_order(
-            store=opts.store,
-            order_id=str(order_id).strip(),
-            ordered_at=ordered_at,
-            date_kst=date_kst,
-            status=status,
-            amount=amount,
-            currency=currency,
-            order_place_id=order_place_id,
-            order_place_name=order_place_name,
-            inflow_path=inflow_path,
-            inflow_path_detail=inflow_path_detail,
-            referer=referer,
-            source_raw=source_raw,
-            meta_json={"row": r},
+        order_rows.append(
+            {
+                "store": opts.store,
+                "order_id": str(order_id).strip(),
+                "ordered_at": ordered_at,
+                "date_kst": date_kst,
+                "status": status,
+                "amount": amount,
+                "currency": currency,
+                "order_place_id": order_place_id,
+                "order_place_name": order_place_name,
+                "inflow_path": inflow_path,
+                "inflow_path_detail": inflow_path_detail,
+                "referer": referer,
+                "source_raw": source_raw,
+                "meta_json": {"row": r},
+            }
         )
         inserted += 1
 
+    repo.upsert_store_orders_bulk(order_rows)
+
     return {
         "ok": True,
         "rows": len(rows),
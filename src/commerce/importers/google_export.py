@@ -20,14 +20,14 @@ def _read_text_best_effort(path: Path) -> str:
 
 
 def _parse_float(v: Any) -> float | None:
-    if v is None:
+    if v is None or v == "":
         return None
-    s = str(v).strip()
-    if s == "":
-        return None
-    s = s.replace(",", "")
     try:
-        return float(s)
+        return float(v)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return float(str(v).replace(",", ""))
     except ValueError:
         return None
 
@@ -41,8 +41,9 @@ def _parse_int(v: Any) -> int | None:
 
 def _first(row: dict[str, Any], keys: list[str]) -> str | None:
     for k in keys:
-        if k in row and str(row.get(k) or "").strip() != "":
-            return str(row.get(k)).strip()
+        v = row.get(k)
+        if v and (s := str(v).strip()):
+            return s
     return None
 
 
@@ -104,6 +105,8 @@ def import_google_ads_csv(repo: Repo, *, path: Path, opts: GoogleImportOptions)
 
     imported = 0
     skipped = 0
+    entities: dict[tuple[str, str], dict[str, Any]] = {}
+    metric_rows: list[dict[str, Any]] = []
 
     for row in rows:
         day = _first(row, date_keys) or opts.day_override
@@ -145,41 +148,41 @@ def import_google_ads_csv(repo: Repo, *, path: Path, opts: GoogleImportOptions)
             parent_id = ag_id or camp_id
             name = kw_text
 
-        repo.upsert_entity(
-            platform="google",
-            account_id=opts.account_id,
-            entity_type="campaign",
-            entity_id=camp_id,
-            parent_type=None,
-            parent_id=None,
-            name=camp_name,
-            status=None,
-            meta_json={"source": "import", "row_level": level},
-        )
+        entities[("campaign", camp_id)] = {
+            "platform": "google",
+            "account_id": opts.account_id,
+            "entity_type": "campaign",
+            "entity_id": camp_id,
+            "parent_type": None,
+            "parent_id": None,
+            "name": camp_name,
+            "status": None,
+            "meta_json": {"source": "import", "row_level": level},
+        }
         if ag_id:
-            repo.upsert_entity(
-                platform="google",
-                account_id=opts.account_id,
-                entity_type="adgroup",
-                entity_id=ag_id,
-                parent_type="campaign",
-                parent_id=camp_id,
-                name=ag_name,
-                status=None,
-                meta_json={"source": "import", "row_level": level},
-            )
+            entities[("adgroup", ag_id)] = {
+                "platform": "google",
+                "account_id": opts.account_id,
+                "entity_type": "adgroup",
+                "entity_id": ag_id,
+                "parent_type": "campaign",
+                "parent_id": camp_id,
+                "name": ag_name,
+                "status": None,
+                "meta_json": {"source": "import", "row_level": level},
+            }
         if kw_id:
-            repo.upsert_entity(
-                platform="google",
-                account_id=opts.account_id,
-                entity_type="keyword",
-                entity_id=kw_id,
-                parent_type="adgroup" if ag_id else "campaign",
-                parent_id=ag_id or camp_id,
-                name=kw_text,
-                status=None,
-                meta_json={"source": "import", "row_level": level},
-            )
+            entities[("keyword", kw_id)] = {
+                "platform": "google",
+                "account_id": opts.account_id,
+                "entity_type": "keyword",
+                "entity_id": kw_id,
+                "parent_type": "adgroup" if ag_id else "campaign",
+                "parent_id": ag_id or camp_id,
+                "name": kw_text,
+                "status": None,
+                "meta_json": {"source": "import", "row_level": level},
+            }
 
         # Prefer currency cost; fallback to micros.
         cost = _parse_float(_first(row, cost_keys))
@@ -195,30 +198,35 @@ def import_google_ads_csv(repo: Repo, *, path: Path, opts: GoogleImportOptions)
         conversions = conv_primary if conv_primary is not None else conv_all
         conversion_value = conv_value_primary if conv_value_primary is not None else conv_value_all
 
-        repo.upsert_metric_daily(
-            platform="google",
-            account_id=opts.account_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            day=str(day),
-            spend=cost,
-            impressions=_parse_int(_first(row, impressions_keys)),
-            clicks=_parse_int(_first(row, clicks_keys)),
-            conversions=conversions,
-            conversion_value=conversion_value,
-            metrics_json={
-                "_raw": row,
-                "parent_type": parent_type,
-                "parent_id": parent_id,
-                "name": name,
-                "conversions_all": conv_all,
-                "conversion_value_all": conv_value_all,
-                "conversions_primary": conv_primary,
-                "conversion_value_primary": conv_value_primary,
-            },
+        metric_rows.append(
+            {
+                "platform": "google",
+                "account_id": opts.account_id,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "day": str(day),
+                "spend": cost,
+                "impressions": _parse_int(_first(row, impressions_keys)),
+                "clicks": _parse_int(_first(row, clicks_keys)),
+                "conversions": conversions,
+                "conversion_value": conversion_value,
+                "metrics_json": {
+                    "_raw": row,
+                    "parent_type": parent_type,
+                    "parent_id": parent_id,
+                    "name": name,
+                    "conversions_all": conv_all,
+                    "conversion_value_all": conv_value_all,
+                    "conversions_primary": conv_primary,
+                    "conversion_value_primary": conv_value_primary,
+                },
+            }
         )
         imported += 1
 
+    repo.upsert_entities_bulk(entities.values())
+    repo.upsert_metrics_daily_bulk(metric_rows)
+
     return {
         "ok": True,
         "rows": len(rows),
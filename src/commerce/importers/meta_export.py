@@ -20,14 +20,14 @@ def _read_text_best_effort(path: Path) -> str:
 
 
 def _parse_float(v: Any) -> float | None:
-    if v is None:
+    if v is None or v == "":
         return None
-    s = str(v).strip()
-    if s == "":
-        return None
-    s = s.replace(",", "")
     try:
-        return float(s)
+        return float(v)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return float(str(v).replace(",", ""))
     except ValueError:
         return None
 
@@ -41,8 +41,9 @@ def _parse_int(v: Any) -> int | None:
 
 def _first(row: dict[str, Any], keys: list[str]) -> str | None:
     for k in keys:
-        if k in row and str(row.get(k) or "").strip() != "":
-            return str(row.get(k)).strip()
+        v = row.get(k)
+        if v and (s := str(v).strip()):
+            return s
     return None
 
 
@@ -116,6 +117,8 @@ def import_meta_ads_csv(repo: Repo, *, path: Path, opts: MetaImportOptions) -> d
 
     imported = 0
     skipped = 0
+    entities: dict[tuple[str, str], dict[str, Any]] = {}
+    metric_rows: list[dict[str, Any]] = []
 
     for row in rows:
         day = _first(row, date_keys) or opts.day_override
@@ -158,41 +161,41 @@ def import_meta_ads_csv(repo: Repo, *, path: Path, opts: MetaImportOptions) -> d
             name = ad_name
 
         # Ensure entities exist (best-effort hierarchy)
-        repo.upsert_entity(
-            platform="meta",
-            account_id=opts.account_id,
-            entity_type="campaign",
-            entity_id=camp_id,
-            parent_type=None,
-            parent_id=None,
-            name=camp_name,
-            status=None,
-            meta_json={"source": "import", "row_level": level},
-        )
+        entities[("campaign", camp_id)] = {
+            "platform": "meta",
+            "account_id": opts.account_id,
+            "entity_type": "campaign",
+            "entity_id": camp_id,
+            "parent_type": None,
+            "parent_id": None,
+            "name": camp_name,
+            "status": None,
+            "meta_json": {"source": "import", "row_level": level},
+        }
         if adset_id:
-            repo.upsert_entity(
-                platform="meta",
-                account_id=opts.account_id,
-                entity_type="adset",
-                entity_id=adset_id,
-                parent_type="campaign",
-                parent_id=camp_id,
-                name=adset_name,
-                status=None,
-                meta_json={"source": "import", "row_level": level},
-            )
+            entities[("adset", adset_id)] = {
+                "platform": "meta",
+                "account_id": opts.account_id,
+                "entity_type": "adset",
+                "entity_id": adset_id,
+                "parent_type": "campaign",
+                "parent_id": camp_id,
+                "name": adset_name,
+                "status": None,
+                "meta_json": {"source": "import", "row_level": level},
+            }
         if ad_id:
-            repo.upsert_entity(
-                platform="meta",
-                account_id=opts.account_id,
-                entity_type="ad",
-                entity_id=ad_id,
-                parent_type="adset" if adset_id else "campaign",
-                parent_id=adset_id or camp_id,
-                name=ad_name,
-                status=None,
-                meta_json={"source": "import", "row_level": level},
-            )
+            entities[("ad", ad_id)] = {
+                "platform": "meta",
+                "account_id": opts.account_id,
+                "entity_type": "ad",
+                "entity_id": ad_id,
+                "parent_type": "adset" if adset_id else "campaign",
+                "parent_id": adset_id or camp_id,
+                "name": ad_name,
+                "status": None,
+                "meta_json": {"source": "import", "row_level": level},
+            }
 
         spend = _parse_float(_first(row, spend_keys))
         impressions = _parse_int(_first(row, impressions_keys))
@@ -208,30 +211,35 @@ def import_meta_ads_csv(repo: Repo, *, path: Path, opts: MetaImportOptions) -> d
         any_value = _parse_float(_first(row, conversion_value_keys))
         conversion_value = purchase_value if purchase_value is not None else any_value
 
-        repo.upsert_metric_daily(
-            platform="meta",
-            account_id=opts.account_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            day=str(day),
-            spend=spend,
-            impressions=impressions,
-            clicks=clicks,
-            conversions=conversions,
-            conversion_value=conversion_value,
-            metrics_json={
-                "_raw": row,
-                "parent_type": parent_type,
-                "parent_id": parent_id,
-                "name": name,
-                "conversions_all": conversions_all,
-                "conversions_purchase": purchases,
-                "conversions_results": results,
-                "conversion_value_purchase": purchase_value,
-            },
+        metric_rows.append(
+            {
+                "platform": "meta",
+                "account_id": opts.account_id,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "day": str(day),
+                "spend": spend,
+                "impressions": impressions,
+                "clicks": clicks,
+                "conversions": conversions,
+                "conversion_value": conversion_value,
+                "metrics_json": {
+                    "_raw": row,
+                    "parent_type": parent_type,
+                    "parent_id": parent_id,
+                    "name": name,
+                    "conversions_all": conversions_all,
+                    "conversions_purchase": purchases,
+                    "conversions_results": results,
+                    "conversion_value_purchase": purchase_value,
+                },
+            }
         )
         imported += 1
 
+    repo.upsert_entities_bulk(entities.values())
+    repo.upsert_metrics_daily_bulk(metric_rows)
+
     return {
         "ok": True,
         "rows": len(rows),
@@ -21,14 +21,14 @@ def _read_text_best_effort(path: Path) -> str:
 
 
 def _parse_float(v: Any) -> float | None:
-    if v is None:
+    if v is None or v == "":
         return None
-    s = str(v).strip()
-    if s == "":
-        return None
-    s = s.replace(",", "")
     try:
-        return float(s)
+        return float(v)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return float(str(v).replace(",", ""))
     except ValueError:
         return None
 
@@ -19,14 +19,16 @@ def _read_text_best_effort(path: Path) -> str:
 
 
 def _parse_float(v: Any) -> float | None:
-    if v is None:
+    if v is None or v == "":
         return None
-    s = str(v).strip()
-    if s == "":
-        return None
-    s = s.replace(",", "")
     try:
-        return float(s)
+        # Clean numeric cells parse in C; only padded or comma-grouped ones fall through.
+        return float(v)
+    except (TypeError, ValueError):
+        pass
+    # float() already ignores surrounding whitespace, so only the commas need removing.
+    try:
+        return float(str(v).replace(",", ""))
     except ValueError:
         return None
 
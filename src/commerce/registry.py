@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, Iterable
 
 from commerce.connectors.base import ConnectorContext
 from commerce.connectors.demo import DemoConnector
@@ -29,16 +29,31 @@ class _ConnectorScopedRepo:
             kwargs["connector_id"] = self._connector_id
         self._repo.upsert_entity(**kwargs)
 
+    def upsert_entities_bulk(self, rows: Iterable[dict[str, Any]]) -> int:
+        return self._repo.upsert_entities_bulk(self._scoped(rows))
+
     def upsert_metric_daily(self, **kwargs: Any) -> None:
         if "connector_id" not in kwargs or kwargs["connector_id"] is None:
             kwargs["connector_id"] = self._connector_id
         self._repo.upsert_metric_daily(**kwargs)
 
+    def upsert_metrics_daily_bulk(self, rows: Iterable[dict[str, Any]]) -> int:
+        return self._repo.upsert_metrics_daily_bulk(self._scoped(rows))
+
     def upsert_metric_intraday(self, **kwargs: Any) -> None:
         if "connector_id" not in kwargs or kwargs["connector_id"] is None:
             kwargs["connector_id"] = self._connector_id
         self._repo.upsert_metric_intraday(**kwargs)
 
+    def upsert_metrics_intraday_bulk(self, rows: Iterable[dict[str, Any]]) -> int:
+        return self._repo.upsert_metrics_intraday_bulk(self._scoped(rows))
+
+    def _scoped(self, rows: Iterable[dict[str, Any]]) -> Iterable[dict[str, Any]]:
+        for r in rows:
+            if r.get("connector_id") is None:
+                r = {**r, "connector_id": self._connector_id}
+            yield r
+
     def __getattr__(self, name: str) -> Any:
         return getattr(self._repo, name)
 
@@ -4,14 +4,94 @@ import json
 import sqlite3
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
+from commerce.db import configure_connection
 from commerce.util import now_utc_iso, new_id
 
 
 DEFAULT_CONNECTOR_ID = ""
 
 
+def _json_text(v: Any) -> str:
+    # Bulk callers may pass JSON columns pre-serialized (e.g. a constant payload).
+    if isinstance(v, str):
+        return v
+    if not v:
+        return "{}"
+    return json.dumps(v, ensure_ascii=True)
+
+
+_UPSERT_ENTITY_SQL = """
+INSERT INTO entities(
+  platform, connector_id, account_id, entity_type, entity_id,
+  parent_type, parent_id, name, status, meta_json, updated_at
+) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(platform, connector_id, entity_type, entity_id) DO UPDATE SET
+  account_id=excluded.account_id,
+  parent_type=excluded.parent_type,
+  parent_id=excluded.parent_id,
+  name=excluded.name,
+  status=excluded.status,
+  meta_json=excluded.meta_json,
+  updated_at=excluded.updated_at
+"""
+
+_UPSERT_METRIC_DAILY_SQL = """
+INSERT INTO metrics_daily(
+  platform, connector_id, account_id, entity_type, entity_id, date,
+  spend, impressions, clicks, conversions, conversion_value, metrics_json
+) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(platform, connector_id, entity_type, entity_id, date) DO UPDATE SET
+  account_id=excluded.account_id,
+  spend=excluded.spend,
+  impressions=excluded.impressions,
+  clicks=excluded.clicks,
+  conversions=excluded.conversions,
+  conversion_value=excluded.conversion_value,
+  metrics_json=excluded.metrics_json
+"""
+
+_UPSERT_METRIC_INTRADAY_SQL = """
+INSERT INTO metrics_intraday(
+  platform, connector_id, account_id, entity_type, entity_id, hour_ts,
+  spend, impressions, clicks, conversions, conversion_value, metrics_json
+) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(platform, connector_id, entity_type, entity_id, hour_ts) DO UPDATE SET
+  account_id=excluded.account_id,
+  spend=excluded.spend,
+  impressions=excluded.impressions,
+  clicks=excluded.clicks,
+  conversions=excluded.conversions,
+  conversion_value=excluded.conversion_value,
+  metrics_json=excluded.metrics_json
+"""
+
+_UPSERT_STORE_ORDER_SQL = """
+INSERT INTO store_orders(
+  store, order_id, ordered_at, date_kst, status, amount, currency,
+  order_place_id, order_place_name,
+  inflow_path, inflow_path_detail,
+  referer, source_raw,
+  meta_json, created_at, updated_at
+) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(store, order_id) DO UPDATE SET
+  ordered_at=excluded.ordered_at,
+  date_kst=excluded.date_kst,
+  status=excluded.status,
+  amount=excluded.amount,
+  currency=excluded.currency,
+  order_place_id=excluded.order_place_id,
+  order_place_name=excluded.order_place_name,
+  inflow_path=excluded.inflow_path,
+  inflow_path_detail=excluded.inflow_path_detail,
+  referer=excluded.referer,
+  source_raw=excluded.source_raw,
+  meta_json=excluded.meta_json,
+  updated_at=excluded.updated_at
+"""
+
+
 class Repo:
     """
     Lightweight repository for worker/web/bot.
@@ -24,8 +104,7 @@ class Repo:
     def connect(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
-        conn.execute("PRAGMA journal_mode = WAL;")
+        configure_connection(conn)
         return conn
 
     @staticmethod
@@ -57,20 +136,7 @@ class Repo:
     ) -> None:
         with self.connect() as conn:
             conn.execute(
-                """
-                INSERT INTO metrics_daily(
-                  platform, connector_id, account_id, entity_type, entity_id, date,
-                  spend, impressions, clicks, conversions, conversion_value, metrics_json
-                ) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(platform, connector_id, entity_type, entity_id, date) DO UPDATE SET
-                  account_id=excluded.account_id,
-                  spend=excluded.spend,
-                  impressions=excluded.impressions,
-                  clicks=excluded.clicks,
-                  conversions=excluded.conversions,
-                  conversion_value=excluded.conversion_value,
-                  metrics_json=excluded.metrics_json
-                """,
+                _UPSERT_METRIC_DAILY_SQL,
                 (
                     platform,
                     connector_id or DEFAULT_CONNECTOR_ID,
@@ -87,6 +153,35 @@ class Repo:
                 ),
             )
 
+    def upsert_metrics_daily_bulk(self, rows: Iterable[dict[str, Any]]) -> int:
+        """
+        Upsert many daily metric rows in one transaction.
+        Each row takes the same keys as `upsert_metric_daily`; metrics_json may
+        be a dict or an already-serialized JSON string.
+        """
+        params = [
+            (
+                r["platform"],
+                r.get("connector_id") or DEFAULT_CONNECTOR_ID,
+                r.get("account_id"),
+                r["entity_type"],
+                r["entity_id"],
+                r["day"],
+                r.get("spend"),
+                r.get("impressions"),
+                r.get("clicks"),
+                r.get("conversions"),
+                r.get("conversion_value"),
+                _json_text(r.get("metrics_json")),
+            )
+            for r in rows
+        ]
+        if not params:
+            return 0
+        with self.connect() as conn:
+            conn.executemany(_UPSERT_METRIC_DAILY_SQL, params)
+        return len(params)
+
     def upsert_metric_intraday(
         self,
         *,
@@ -105,20 +200,7 @@ class Repo:
     ) -> None:
         with self.connect() as conn:
             conn.execute(
-                """
-                INSERT INTO metrics_intraday(
-                  platform, connector_id, account_id, entity_type, entity_id, hour_ts,
-                  spend, impressions, clicks, conversions, conversion_value, metrics_json
-                ) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(platform, connector_id, entity_type, entity_id, hour_ts) DO UPDATE SET
-                  account_id=excluded.account_id,
-                  spend=excluded.spend,
-                  impressions=excluded.impressions,
-                  clicks=excluded.clicks,
-                  conversions=excluded.conversions,
-                  conversion_value=excluded.conversion_value,
-                  metrics_json=excluded.metrics_json
-                """,
+                _UPSERT_METRIC_INTRADAY_SQL,
                 (
                     platform,
                     connector_id or DEFAULT_CONNECTOR_ID,
@@ -135,6 +217,35 @@ class Repo:
                 ),
             )
 
+    def upsert_metrics_intraday_bulk(self, rows: Iterable[dict[str, Any]]) -> int:
+        """
+        Upsert many hourly metric rows in one transaction.
+        Each row takes the same keys as `upsert_metric_intraday`; metrics_json may
+        be a dict or an already-serialized JSON string.
+        """
+        params = [
+            (
+                r["platform"],
+                r.get("connector_id") or DEFAULT_CONNECTOR_ID,
+                r.get("account_id"),
+                r["entity_type"],
+                r["entity_id"],
+                r["hour_ts"],
+                r.get("spend"),
+                r.get("impressions"),
+                r.get("clicks"),
+                r.get("conversions"),
+                r.get("conversion_value"),
+                _json_text(r.get("metrics_json")),
+            )
+            for r in rows
+        ]
+        if not params:
+            return 0
+        with self.connect() as conn:
+            conn.executemany(_UPSERT_METRIC_INTRADAY_SQL, params)
+        return len(params)
+
     def upsert_entity(
         self,
         *,
@@ -152,20 +263,7 @@ class Repo:
         now = now_utc_iso()
         with self.connect() as conn:
             conn.execute(
-                """
-                INSERT INTO entities(
-                  platform, connector_id, account_id, entity_type, entity_id,
-                  parent_type, parent_id, name, status, meta_json, updated_at
-                ) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(platform, connector_id, entity_type, entity_id) DO UPDATE SET
-                  account_id=excluded.account_id,
-                  parent_type=excluded.parent_type,
-                  parent_id=excluded.parent_id,
-                  name=excluded.name,
-                  status=excluded.status,
-                  meta_json=excluded.meta_json,
-                  updated_at=excluded.updated_at
-                """,
+                _UPSERT_ENTITY_SQL,
                 (
                     platform,
                     connector_id or DEFAULT_CONNECTOR_ID,
@@ -181,6 +279,35 @@ class Repo:
                 ),
             )
 
+    def upsert_entities_bulk(self, rows: Iterable[dict[str, Any]]) -> int:
+        """
+        Upsert many entities in one transaction.
+        Each row takes the same keys as `upsert_entity`; meta_json may be a
+        dict or an already-serialized JSON string.
+        """
+        now = now_utc_iso()
+        params = [
+            (
+                r["platform"],
+                r.get("connector_id") or DEFAULT_CONNECTOR_ID,
+                r.get("account_id"),
+                r["entity_type"],
+                r["entity_id"],
+                r.get("parent_type"),
+                r.get("parent_id"),
+                r.get("name"),
+                r.get("status"),
+                _json_text(r.get("meta_json")),
+                now,
+            )
+            for r in rows
+        ]
+        if not params:
+            return 0
+        with self.connect() as conn:
+            conn.executemany(_UPSERT_ENTITY_SQL, params)
+        return len(params)
+
     def list_enabled_connectors(self) -> list[dict[str, Any]]:
         with self.connect() as conn:
             rows = conn.execute(
@@ -313,24 +440,37 @@ class Repo:
         result_json: dict[str, Any] | None,
         error: str | None,
     ) -> None:
-        now = now_utc_iso()
         with self.connect() as conn:
-            conn.execute(
-                """
-                UPDATE action_proposals
-                SET status=?, updated_at=?, executed_at=?, result_json=?, error=?
-                WHERE id=?
-                """,
-                (
-                    status,
-                    now,
-                    executed_at,
-                    json.dumps(result_json, ensure_ascii=True) if result_json is not None else None,
-                    error,
-                    proposal_id,
-                ),
+            self._set_proposal_result(
+                conn, proposal_id, status=status, executed_at=executed_at, result_json=result_json, error=error
             )
 
+    @staticmethod
+    def _set_proposal_result(
+        conn: sqlite3.Connection,
+        proposal_id: str,
+        *,
+        status: str,
+        executed_at: str | None,
+        result_json: dict[str, Any] | None,
+        error: str | None,
+    ) -> None:
+        conn.execute(
+            """
+            UPDATE action_proposals
+            SET status=?, updated_at=?, executed_at=?, result_json=?, error=?
+            WHERE id=?
+            """,
+            (
+                status,
+                now_utc_iso(),
+                executed_at,
+                json.dumps(result_json, ensure_ascii=True) if result_json is not None else None,
+                error,
+                proposal_id,
+            ),
+        )
+
     def attach_telegram_message(self, proposal_id: str, chat_id: int, message_id: int) -> None:
         now = now_utc_iso()
         with self.connect() as conn:
@@ -793,22 +933,63 @@ class Repo:
         after_json: dict[str, Any] | None,
         error: str | None,
     ) -> None:
-        now = now_utc_iso()
         with self.connect() as conn:
-            conn.execute(
-                """
-                UPDATE executions
-                SET finished_at=?, status=?, before_json=?, after_json=?, error=?
-                WHERE id=?
-                """,
-                (
-                    now,
-                    status,
-                    json.dumps(before_json, ensure_ascii=True) if before_json is not None else None,
-                    json.dumps(after_json, ensure_ascii=True) if after_json is not None else None,
-                    error,
-                    execution_id,
-                ),
+            self._finish_execution(
+                conn, execution_id, status=status, before_json=before_json, after_json=after_json, error=error
+            )
+
+    @staticmethod
+    def _finish_execution(
+        conn: sqlite3.Connection,
+        execution_id: str,
+        *,
+        status: str,
+        before_json: dict[str, Any] | None,
+        after_json: dict[str, Any] | None,
+        error: str | None,
+    ) -> None:
+        conn.execute(
+            """
+            UPDATE executions
+            SET finished_at=?, status=?, before_json=?, after_json=?, error=?
+            WHERE id=?
+            """,
+            (
+                now_utc_iso(),
+                status,
+                json.dumps(before_json, ensure_ascii=True) if before_json is not None else None,
+                json.dumps(after_json, ensure_ascii=True) if after_json is not None else None,
+                error,
+                execution_id,
+            ),
+        )
+
+    def complete_execution(
+        self,
+        execution_id: str,
+        proposal_id: str,
+        *,
+        status: str,
+        proposal_status: str,
+        executed_at: str | None,
+        before_json: dict[str, Any] | None,
+        after_json: dict[str, Any] | None,
+        result_json: dict[str, Any] | None,
+        error: str | None,
+    ) -> None:
+        """Finish an execution and record the proposal outcome in one transaction."""
+        with self.connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._finish_execution(
+                conn, execution_id, status=status, before_json=before_json, after_json=after_json, error=error
+            )
+            self._set_proposal_result(
+                conn,
+                proposal_id,
+                status=proposal_status,
+                executed_at=executed_at,
+                result_json=result_json,
+                error=error,
             )
 
     def get_meta(self, key: str) -> str | None:
@@ -823,6 +1004,15 @@ class Repo:
                 (key, value),
             )
 
+    def update_meta_bulk(self, values: dict[str, str], *, delete: Iterable[str] = ()) -> None:
+        """Set and delete several meta keys in one transaction."""
+        with self.connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta(key, value) VALUES(?, ?)",
+                values.items(),
+            )
+            conn.executemany("DELETE FROM meta WHERE key=?", ((k,) for k in delete))
+
     def list_executions(self, limit: int = 100) -> list[dict[str, Any]]:
         with self.connect() as conn:
             rows = conn.execute(
@@ -986,29 +1176,7 @@ class Repo:
         now = now_utc_iso()
         with self.connect() as conn:
             conn.execute(
-                """
-                INSERT INTO store_orders(
-                  store, order_id, ordered_at, date_kst, status, amount, currency,
-                  order_place_id, order_place_name,
-                  inflow_path, inflow_path_detail,
-                  referer, source_raw,
-                  meta_json, created_at, updated_at
-                ) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(store, order_id) DO UPDATE SET
-                  ordered_at=excluded.ordered_at,
-                  date_kst=excluded.date_kst,
-                  status=excluded.status,
-                  amount=excluded.amount,
-                  currency=excluded.currency,
-                  order_place_id=excluded.order_place_id,
-                  order_place_name=excluded.order_place_name,
-                  inflow_path=excluded.inflow_path,
-                  inflow_path_detail=excluded.inflow_path_detail,
-                  referer=excluded.referer,
-                  source_raw=excluded.source_raw,
-                  meta_json=excluded.meta_json,
-                  updated_at=excluded.updated_at
-                """,
+                _UPSERT_STORE_ORDER_SQL,
                 (
                     store,
                     order_id,
@@ -1029,6 +1197,40 @@ class Repo:
                 ),
             )
 
+    def upsert_store_orders_bulk(self, rows: Iterable[dict[str, Any]]) -> int:
+        """
+        Upsert many store orders in one transaction.
+        Each row takes the same keys as `upsert_store_order` (optional ones may be
+        omitted); meta_json may be a dict or an already-serialized JSON string.
+        """
+        now = now_utc_iso()
+        params = [
+            (
+                r["store"],
+                r["order_id"],
+                r.get("ordered_at"),
+                r["date_kst"],
+                r.get("status"),
+                r.get("amount"),
+                r.get("currency"),
+                r.get("order_place_id"),
+                r.get("order_place_name"),
+                r.get("inflow_path"),
+                r.get("inflow_path_detail"),
+                r.get("referer"),
+                r.get("source_raw"),
+                _json_text(r.get("meta_json")),
+                now,
+                now,
+            )
+            for r in rows
+        ]
+        if not params:
+            return 0
+        with self.connect() as conn:
+            conn.executemany(_UPSERT_STORE_ORDER_SQL, params)
+        return len(params)
+
     def list_store_orders(
         self,
         *,
@@ -1127,6 +1329,36 @@ class Repo:
             rows = conn.execute(sql, params).fetchall()
             return [dict(r) for r in rows]
 
+    def get_parent_ids(
+        self,
+        *,
+        platform: str,
+        entity_type: str,
+        entity_ids: Iterable[str],
+        connector_id: str | None = None,
+    ) -> dict[str, str]:
+        """Map entity_id -> parent_id for the given ids in one query (ids without a parent are omitted)."""
+        ids = list(dict.fromkeys(entity_ids))
+        if not ids:
+            return {}
+        where = [
+            "platform=?",
+            "entity_type=?",
+            f"entity_id IN ({','.join('?' * len(ids))})",
+            "parent_id IS NOT NULL",
+        ]
+        params: list[Any] = [platform, entity_type, *ids]
+        self._append_connector_filter(where, params, connector_id)
+        sql = "SELECT entity_id, parent_id FROM entities WHERE " + " AND ".join(where)
+        with self.connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        out: dict[str, str] = {}
+        for entity_id, parent_id in rows:
+            parent = str(parent_id).strip()
+            if parent:
+                out.setdefault(entity_id, parent)
+        return out
+
     def list_kpi_profiles(self, limit: int = 200) -> list[dict[str, Any]]:
         with self.connect() as conn:
             rows = conn.execute(
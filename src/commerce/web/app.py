@@ -159,7 +159,8 @@ def _compute_dashboard_basis_day(
 
 
 def create_app(settings: Settings) -> FastAPI:
-    AdsDB(settings.db_path).init()
+    db = AdsDB(settings.db_path)
+    db.init()
     repo = Repo(settings.db_path)
     ui_platforms = {"naver", "meta", "google", "coupang", "smartstore", "cafe24_analytics"}
     platform_names = {
@@ -621,6 +622,7 @@ def create_app(settings: Settings) -> FastAPI:
         ingest_levels_raw = (form.get("ingest_levels") or "").strip()
         conversion_action_types_raw = (form.get("conversion_action_types") or "").strip()
         include_today_raw = form.get("include_today")
+        store_raw_actions_raw = form.get("store_raw_actions")
         api_min_interval_raw = (form.get("api_min_interval_minutes") or "").strip()
         poll_interval_raw = (form.get("report_poll_interval_sec") or "").strip()
         report_timeout_raw = (form.get("report_timeout_sec") or "").strip()
@@ -708,6 +710,7 @@ def create_app(settings: Settings) -> FastAPI:
                 cfg.pop("conversion_action_types", None)
 
             cfg["include_today"] = bool(include_today_raw)
+            cfg["store_raw_actions"] = bool(store_raw_actions_raw)
 
             def _set_float(key: str, raw: str) -> None:
                 if not raw:
@@ -779,8 +782,11 @@ def create_app(settings: Settings) -> FastAPI:
 
     @app.get("/actions", response_class=HTMLResponse)
     def actions_page(request: Request, status: str = "proposed", error: str | None = None):
-        db = AdsDB(settings.db_path)
-        proposals = db.list_action_proposals(status=status, limit=100)
+        proposals = db.list_action_proposals(
+            status=status,
+            limit=100,
+            fields=("id", "status", "platform", "action_type", "entity_type", "entity_id", "risk", "reason"),
+        )
         return templates.TemplateResponse(
             "actions.html",
             {"request": request, "proposals": proposals, "status": status, "error": error},
@@ -8,6 +8,7 @@ from typing import Any
 from zoneinfo import ZoneInfo
 
 from commerce.config import Settings
+from commerce.connectors.base import close_connector
 from commerce.db import AdsDB
 from commerce.executor import ExecutionError, execute_proposal
 from commerce.notify.telegram_bot import notify_auto_pause, notify_new_proposal
@@ -66,6 +67,56 @@ def _parse_kill_switch_params(params_json: str | None) -> dict[str, Any]:
     }
 
 
+async def _ingest_connector(
+    connector: Any,
+    *,
+    repo: Repo,
+    connector_id: str,
+    settings: Settings,
+    today_kst: str,
+    yesterday_kst: str,
+) -> bool:
+    """Run health check + entity/metric ingestion for one connector. Return True on success."""
+    try:
+        ok, _err = await connector.health_check()
+    except Exception as e:  # noqa: BLE001
+        repo.update_connector_sync_status(connector_id, ok=False, error=f"{type(e).__name__}: {e}")
+        return False
+    if not ok and not settings.demo_mode:
+        repo.update_connector_sync_status(connector_id, ok=False, error=_err)
+        return False
+
+    try:
+        await connector.sync_entities()
+    except NotImplementedError:
+        pass
+    except Exception as e:  # noqa: BLE001
+        repo.update_connector_sync_status(connector_id, ok=False, error=f"{type(e).__name__}: {e}")
+        return False
+
+    try:
+        await connector.fetch_metrics_daily(yesterday_kst, today_kst)
+    except NotImplementedError:
+        # Connector not implemented yet; safe to ignore.
+        pass
+    except Exception as e:  # noqa: BLE001
+        repo.update_connector_sync_status(connector_id, ok=False, error=f"{type(e).__name__}: {e}")
+        return False
+
+    # Optional: intraday ingestion (fixture/api later). Safe to ignore if missing.
+    try:
+        maybe = getattr(connector, "fetch_metrics_intraday", None)
+        if callable(maybe):
+            await maybe(today_kst)
+    except NotImplementedError:
+        pass
+    except Exception as e:  # noqa: BLE001
+        repo.update_connector_sync_status(connector_id, ok=False, error=f"{type(e).__name__}: {e}")
+        return False
+
+    return True
+
+
 async def _tick(settings: Settings) -> None:
     AdsDB(settings.db_path).init()
     repo = Repo(settings.db_path)
@@ -90,154 +141,135 @@ async def _tick(settings: Settings) -> None:
             repo.update_connector_sync_status(c["id"], ok=False, error=f"{type(e).__name__}: {e}")
             continue
 
+        # The connector stays open through the rules below so auto-executed
+        # proposals reuse its HTTP client; it is closed once per tick.
         try:
-            ok, _err = await connector.health_check()
-        except Exception as e:  # noqa: BLE001
-            repo.update_connector_sync_status(c["id"], ok=False, error=f"{type(e).__name__}: {e}")
-            continue
-        if not ok and not settings.demo_mode:
-            repo.update_connector_sync_status(c["id"], ok=False, error=_err)
-            continue
-
-        try:
-            await connector.sync_entities()
-        except NotImplementedError:
-            pass
-        except Exception as e:  # noqa: BLE001
-            repo.update_connector_sync_status(c["id"], ok=False, error=f"{type(e).__name__}: {e}")
-            continue
-
-        try:
-            await connector.fetch_metrics_daily(yesterday_kst, today_kst)
-        except NotImplementedError:
-            # Connector not implemented yet; safe to ignore.
-            pass
-        except Exception as e:  # noqa: BLE001
-            repo.update_connector_sync_status(c["id"], ok=False, error=f"{type(e).__name__}: {e}")
-            continue
-
-        # Optional: intraday ingestion (fixture/api later). Safe to ignore if missing.
-        try:
-            maybe = getattr(connector, "fetch_metrics_intraday", None)
-            if callable(maybe):
-                await maybe(today_kst)
-        except NotImplementedError:
-            pass
-        except Exception as e:  # noqa: BLE001
-            repo.update_connector_sync_status(c["id"], ok=False, error=f"{type(e).__name__}: {e}")
-            continue
-
-        repo.update_connector_sync_status(c["id"], ok=True, error=None)
-
-        for r in rules:
-            if r["rule_type"] != "kill_switch_spend_no_conv":
+            ok = await _ingest_connector(
+                connector,
+                repo=repo,
+                connector_id=c["id"],
+                settings=settings,
+                today_kst=today_kst,
+                yesterday_kst=yesterday_kst,
+            )
+            if not ok:
                 continue
-            try:
-                platform = "demo" if settings.demo_mode else c["platform"]
-                params = _parse_kill_switch_params(r.get("params_json"))
-                spend_thr = float(params["spend_threshold"])
-                conv_thr = float(params["conversion_threshold"])
-                min_clicks = float(params["clicks_threshold"])
-                entity_type = str(params["entity_type"])
-                auto_execute = bool(params["auto_execute"])
-
-                rows = repo.list_metrics_daily_for_date(
-                    platform=platform,
-                    connector_id=c["id"],
-                    entity_type=entity_type,
-                    day=today_kst,
-                )
-                for m in rows:
-                    entity_id = str(m["entity_id"])
-
-                    intr = repo.sum_intraday_for_entity_date(
-                        platform=platform,
-                        connector_id=c["id"],
-                        entity_type=entity_type,
-                        entity_id=entity_id,
-                        day=today_kst,
-                    )
-                    spend = intr["spend"] if intr["spend"] > 0 else float(m.get("spend") or 0)
-                    clicks = intr["clicks"] if intr["clicks"] > 0 else float(m.get("clicks") or 0)
 
-                    cafe24 = repo.sum_cafe24_conversions_for_entity_date(
-                        entity_platform=platform,
-                        entity_type=entity_type,
-                        entity_id=entity_id,
-                        day_kst=today_kst,
-                    )
-                    conv_cafe24 = cafe24["conversions"]
-                    conv_platform = float(m.get("conversions") or 0)
-                    conv = conv_cafe24 if conv_cafe24 > 0 else conv_platform
-
-                    if spend < spend_thr:
-                        continue
-                    if clicks < min_clicks:
-                        continue
-                    if conv > conv_thr:
-                        continue
-
-                    if repo.proposal_exists_recent(
-                        platform=platform,
-                        connector_id=c["id"],
-                        entity_type=entity_type,
-                        entity_id=entity_id,
-                        action_type="pause_entity",
-                        within_hours=24,
-                    ):
-                        continue
-
-                    reason = (
-                        f"AUTO-PAUSE: spend={spend:.0f}>=thr({spend_thr:.0f}) "
-                        f"clicks={clicks:.0f}>=min({min_clicks:.0f}) "
-                        f"conv={conv:.0f}<=thr({conv_thr:.0f}) "
-                        f"date_kst={today_kst}"
-                    )
-                    payload = {"op": "pause", "reason": "kill_switch_spend_no_conv"}
-                    should_execute = (
-                        auto_execute
-                        and settings.execution_mode == "auto_low_risk"
-                    )
-                    pid = repo.create_action_proposal(
-                        status="approved" if should_execute else "proposed",
+            repo.update_connector_sync_status(c["id"], ok=True, error=None)
+
+            for r in rules:
+                if r["rule_type"] != "kill_switch_spend_no_conv":
+                    continue
+                try:
+                    platform = "demo" if settings.demo_mode else c["platform"]
+                    params = _parse_kill_switch_params(r.get("params_json"))
+                    spend_thr = float(params["spend_threshold"])
+                    conv_thr = float(params["conversion_threshold"])
+                    min_clicks = float(params["clicks_threshold"])
+                    entity_type = str(params["entity_type"])
+                    auto_execute = bool(params["auto_execute"])
+
+                    rows = repo.list_metrics_daily_for_date(
                         platform=platform,
                         connector_id=c["id"],
-                        action_type="pause_entity",
-                        account_id=m.get("account_id"),
                         entity_type=entity_type,
-                        entity_id=entity_id,
-                        payload=payload,
-                        reason=reason,
-                        risk="low",
-                        requires_approval=not should_execute,
-                        approved_by="auto" if should_execute else None,
+                        day=today_kst,
                     )
-
-                    proposal = repo.get_proposal(pid)
-                    if proposal and not should_execute:
-                        sent = await notify_new_proposal(settings, proposal)
-                        if sent:
-                            chat_id, msg_id = sent
-                            repo.attach_telegram_message(pid, chat_id, msg_id)
-                        continue
-
-                    # Auto execute only if explicitly enabled.
-                    if should_execute:
-                        try:
-                            await execute_proposal(settings, repo=repo, proposal_id=pid, actor="auto")
-                            proposal2 = repo.get_proposal(pid)
-                            if proposal2:
-                                sent = await notify_auto_pause(settings, proposal2)
-                                if sent:
-                                    chat_id, msg_id = sent
-                                    repo.attach_telegram_message(pid, chat_id, msg_id)
-                        except ExecutionError:
-                            proposal2 = repo.get_proposal(pid)
-                            if proposal2:
-                                await notify_new_proposal(settings, proposal2)
-            except Exception:
-                # Rule failures must not stop other rules/connectors.
-                continue
+                    for m in rows:
+                        entity_id = str(m["entity_id"])
+
+                        intr = repo.sum_intraday_for_entity_date(
+                            platform=platform,
+                            connector_id=c["id"],
+                            entity_type=entity_type,
+                            entity_id=entity_id,
+                            day=today_kst,
+                        )
+                        spend = intr["spend"] if intr["spend"] > 0 else float(m.get("spend") or 0)
+                        clicks = intr["clicks"] if intr["clicks"] > 0 else float(m.get("clicks") or 0)
+
+                        cafe24 = repo.sum_cafe24_conversions_for_entity_date(
+                            entity_platform=platform,
+                            entity_type=entity_type,
+                            entity_id=entity_id,
+                            day_kst=today_kst,
+                        )
+                        conv_cafe24 = cafe24["conversions"]
+                        conv_platform = float(m.get("conversions") or 0)
+                        conv = conv_cafe24 if conv_cafe24 > 0 else conv_platform
+
+                        if spend < spend_thr:
+                            continue
+                        if clicks < min_clicks:
+                            continue
+                        if conv > conv_thr:
+                            continue
+
+                        if repo.proposal_exists_recent(
+                            platform=platform,
+                            connector_id=c["id"],
+                            entity_type=entity_type,
+                            entity_id=entity_id,
+                            action_type="pause_entity",
+                            within_hours=24,
+                        ):
+                            continue
+
+                        reason = (
+                            f"AUTO-PAUSE: spend={spend:.0f}>=thr({spend_thr:.0f}) "
+                            f"clicks={clicks:.0f}>=min({min_clicks:.0f}) "
+                            f"conv={conv:.0f}<=thr({conv_thr:.0f}) "
+                            f"date_kst={today_kst}"
+                        )
+                        payload = {"op": "pause", "reason": "kill_switch_spend_no_conv"}
+                        should_execute = (
+                            auto_execute
+                            and settings.execution_mode == "auto_low_risk"
+                        )
+                        pid = repo.create_action_proposal(
+                            status="approved" if should_execute else "proposed",
+                            platform=platform,
+                            connector_id=c["id"],
+                            action_type="pause_entity",
+                            account_id=m.get("account_id"),
+                            entity_type=entity_type,
+                            entity_id=entity_id,
+                            payload=payload,
+                            reason=reason,
+                            risk="low",
+                            requires_approval=not should_execute,
+                            approved_by="auto" if should_execute else None,
+                        )
+
+                        proposal = repo.get_proposal(pid)
+                        if proposal and not should_execute:
+                            sent = await notify_new_proposal(settings, proposal)
+                            if sent:
+                                chat_id, msg_id = sent
+                                repo.attach_telegram_message(pid, chat_id, msg_id)
+                            continue
+
+                        # Auto execute only if explicitly enabled.
+                        if should_execute:
+                            try:
+                                await execute_proposal(
+                                    settings, repo=repo, proposal_id=pid, actor="auto", connector=connector
+                                )
+                                proposal2 = repo.get_proposal(pid)
+                                if proposal2:
+                                    sent = await notify_auto_pause(settings, proposal2)
+                                    if sent:
+                                        chat_id, msg_id = sent
+                                        repo.attach_telegram_message(pid, chat_id, msg_id)
+                            except ExecutionError:
+                                proposal2 = repo.get_proposal(pid)
+                                if proposal2:
+                                    await notify_new_proposal(settings, proposal2)
+                except Exception:
+                    # Rule failures must not stop other rules/connectors.
+                    continue
+        finally:
+            await close_connector(connector)
 
 
 def run_tick(settings: Settings) -> None:
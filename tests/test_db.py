@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import ExitStack
+from pathlib import Path
+
+import pytest
+
+from commerce.db import AdsDB, _READER_POOL_SIZE, _list_proposals_sql
+from commerce.repo import Repo
+
+
+def test_adsdb_reuses_connections_and_commits_writes(tmp_path: Path) -> None:
+    db = AdsDB(tmp_path / "ads.sqlite3")
+    db.init()
+    writer = db._get_writer()
+    db.seed_default_connectors()
+    assert db._get_writer() is writer
+
+    with db._get_reader() as first:
+        assert first.execute("SELECT COUNT(*) FROM connectors").fetchone()[0] > 0
+    with db._get_reader() as second:
+        assert first is second
+
+    other: list = []
+    t = threading.Thread(target=lambda: other.append(db.list_action_proposals()))
+    t.start()
+    t.join()
+    assert other == [[]]
+
+    with pytest.raises(RuntimeError):
+        with db._write() as conn:
+            conn.execute("INSERT INTO meta(key, value) VALUES('k', 'v')")
+            raise RuntimeError("boom")
+    with db._get_reader() as conn:
+        assert conn.execute("SELECT value FROM meta WHERE key='k'").fetchone() is None
+
+    db.close()
+    assert db._writer is None
+    assert db._readers == []
+
+
+def test_reader_pool_is_bounded_and_closed_from_any_thread(tmp_path: Path) -> None:
+    db = AdsDB(tmp_path / "ads.sqlite3")
+    db.init()
+    got: list = []
+
+    def read() -> None:
+        with db._get_reader() as conn:
+            got.append(conn)
+
+    with ExitStack() as stack:
+        held = [stack.enter_context(db._get_reader()) for _ in range(_READER_POOL_SIZE)]
+        t = threading.Thread(target=read)
+        t.start()
+        t.join(timeout=0.1)
+        # Every slot is taken, so the extra reader waits instead of opening another.
+        assert t.is_alive() and got == []
+    t.join(timeout=5)
+    assert got[0] in held
+    assert len(db._readers) == _READER_POOL_SIZE
+
+    db.close()
+    for conn in held:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_connections_apply_tuned_pragmas(tmp_path: Path, monkeypatch) -> None:
+    db = AdsDB(tmp_path / "ads.sqlite3")
+    db.init()
+    with db._get_reader() as conn:
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    db.close()
+
+    monkeypatch.setenv("ADS_SQLITE_SYNCHRONOUS", "full")
+    conn = Repo(tmp_path / "ads.sqlite3").connect()
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    conn.close()
+
+
+def test_list_action_proposals_selects_requested_fields(tmp_path: Path) -> None:
+    db = AdsDB(tmp_path / "ads.sqlite3")
+    db.init()
+    repo = Repo(tmp_path / "ads.sqlite3")
+    pid = repo.create_action_proposal(
+        status="proposed",
+        platform="naver",
+        connector_id=None,
+        action_type="pause_entity",
+        account_id=None,
+        entity_type="campaign",
+        entity_id="c1",
+        payload={},
+        reason="test",
+        risk="low",
+        requires_approval=True,
+    )
+
+    rows = db.list_action_proposals(status="proposed", fields=("id", "status"))
+    assert [tuple(r) for r in rows] == [(pid, "proposed")]
+    assert rows[0]["id"] == pid and rows[0].keys() == ["id", "status"]
+    assert db.list_action_proposals(status="approved") == []
+    with pytest.raises(ValueError):
+        db.list_action_proposals(fields=("id; DROP TABLE x",))
+    db.close()
+
+
+def test_seed_default_connectors_upserts_and_keeps_custom_config(tmp_path: Path) -> None:
+    db = AdsDB(tmp_path / "ads.sqlite3")
+    db.init()
+    db.seed_default_connectors()
+    repo = Repo(tmp_path / "ads.sqlite3")
+    first = {(c["platform"], c["name"]): c for c in repo.list_connectors()}
+    naver = first[("naver", "Naver SearchAd")]
+    meta = first[("meta", "Meta Ads")]
+    repo.update_connector_config(naver["id"], {"mode": "api"})
+    with db._write() as conn:
+        conn.execute("UPDATE connectors SET config_json=' {} ' WHERE id=?", (meta["id"],))
+
+    db.seed_default_connectors()
+
+    second = {(c["platform"], c["name"]): c for c in repo.list_connectors()}
+    assert len(second) == len(first) == 8
+    assert second[("naver", "Naver SearchAd")]["id"] == naver["id"]
+    assert '"api"' in second[("naver", "Naver SearchAd")]["config_json"]
+    assert second[("meta", "Meta Ads")]["config_json"] == '{"mode": "import"}'
+    db.close()
+
+
+def test_seed_default_kpi_profile_and_rule_are_idempotent(tmp_path: Path) -> None:
+    db = AdsDB(tmp_path / "ads.sqlite3")
+    db.init()
+    db.seed_default_connectors()
+    db.seed_default_connectors()
+
+    with db._get_reader() as conn:
+        profiles = conn.execute("SELECT id FROM kpi_profiles").fetchall()
+        rules = conn.execute("SELECT kpi_profile_id, params_json FROM rules").fetchall()
+    assert len(profiles) == 1 and len(rules) == 1
+    assert rules[0]["kpi_profile_id"] == profiles[0]["id"]
+    assert '"spend_threshold": 50000' in rules[0]["params_json"]
+    db.close()
+
+
+def test_init_skips_ddl_when_schema_is_current(tmp_path: Path) -> None:
+    db = AdsDB(tmp_path / "ads.sqlite3")
+    db.init()
+    with db._write() as conn:
+        conn.execute("DROP INDEX idx_executions_proposal")
+    db.init()
+    with db._get_reader() as conn:
+        names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    assert "idx_executions_proposal" not in names
+
+    with db._write() as conn:
+        conn.execute("UPDATE meta SET value='5' WHERE key='schema_version'")
+    db.init()
+    with db._get_reader() as conn:
+        names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    assert "idx_executions_proposal" in names
+    db.close()
+
+
+def test_init_migrates_v4_tables_in_one_pass(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(
+            """
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            INSERT INTO meta VALUES ('schema_version', '4');
+            CREATE TABLE connectors (
+              id TEXT PRIMARY KEY, platform TEXT NOT NULL, name TEXT NOT NULL,
+              enabled INTEGER NOT NULL DEFAULT 0, config_json TEXT NOT NULL DEFAULT '{}',
+              capabilities_json TEXT NOT NULL DEFAULT '{}', last_sync_at TEXT, last_error TEXT,
+              created_at TEXT NOT NULL, updated_at TEXT NOT NULL
+            );
+            INSERT INTO connectors(id, platform, name, created_at, updated_at)
+            VALUES ('con_b', 'naver', 'B', 'now', 'now'), ('con_a', 'naver', 'A', 'now', 'now');
+            CREATE TABLE entities (
+              platform TEXT NOT NULL, account_id TEXT, entity_type TEXT NOT NULL, entity_id TEXT NOT NULL,
+              parent_type TEXT, parent_id TEXT, name TEXT, status TEXT,
+              meta_json TEXT NOT NULL DEFAULT '{}', updated_at TEXT NOT NULL,
+              PRIMARY KEY (platform, entity_type, entity_id)
+            );
+            INSERT INTO entities(platform, entity_type, entity_id, name, updated_at)
+            VALUES ('naver', 'campaign', 'c1', 'Camp', 'now'), ('meta', 'campaign', 'm1', 'M', 'now');
+            CREATE TABLE metrics_daily (
+              platform TEXT NOT NULL, account_id TEXT, entity_type TEXT NOT NULL, entity_id TEXT NOT NULL,
+              date TEXT NOT NULL, spend REAL, impressions INTEGER, clicks INTEGER, conversions REAL,
+              conversion_value REAL, metrics_json TEXT NOT NULL DEFAULT '{}',
+              PRIMARY KEY (platform, entity_type, entity_id, date)
+            );
+            INSERT INTO metrics_daily(platform, entity_type, entity_id, date, spend)
+            VALUES ('naver', 'campaign', 'c1', '2026-02-15', 12.5);
+            """
+        )
+    conn.close()
+
+    db = AdsDB(db_path)
+    db.init()
+    with db._get_reader() as conn:
+        ents = conn.execute("SELECT entity_id, connector_id, name FROM entities ORDER BY entity_id").fetchall()
+        metrics = conn.execute("SELECT connector_id, date, spend FROM metrics_daily").fetchall()
+        version = conn.execute("SELECT value FROM meta WHERE key='schema_version'").fetchone()[0]
+    assert [tuple(r) for r in ents] == [("c1", "con_a", "Camp"), ("m1", "", "M")]
+    assert [tuple(r) for r in metrics] == [("con_a", "2026-02-15", 12.5)]
+    assert db._get_writer().execute("SELECT name FROM sqlite_temp_master").fetchall() == []
+    assert version == "8"
+    db.close()
+
+
+def test_proposal_listing_uses_status_created_index(tmp_path: Path) -> None:
+    db = AdsDB(tmp_path / "ads.sqlite3")
+    db.init()
+    with db._get_reader() as conn:
+        plan = " ".join(
+            str(r[-1]) for r in conn.execute("EXPLAIN QUERY PLAN " + _list_proposals_sql(None, True), ("proposed", 10))
+        )
+        names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    assert "idx_action_proposals_status_created_desc" in plan
+    assert "TEMP B-TREE" not in plan
+    assert {"idx_executions_proposal", "idx_connectors_platform_name"} <= names
+    assert "idx_action_proposals_status_created" not in names
+    db.close()
+
+
+def test_init_rebuilds_v6_metric_tables_without_rowid(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    db = AdsDB(db_path)
+    db.init()
+    db.close()
+    with sqlite3.connect(db_path) as conn:
+        # Recreate the pre-v7 rowid layout with one row in it.
+        conn.executescript(
+            """
+            DROP TABLE metrics_daily;
+            CREATE TABLE metrics_daily (
+              platform TEXT NOT NULL, connector_id TEXT NOT NULL DEFAULT '', account_id TEXT,
+              entity_type TEXT NOT NULL, entity_id TEXT NOT NULL, date TEXT NOT NULL,
+              spend REAL, impressions INTEGER, clicks INTEGER, conversions REAL, conversion_value REAL,
+              metrics_json TEXT NOT NULL DEFAULT '{}',
+              PRIMARY KEY (platform, connector_id, entity_type, entity_id, date)
+            );
+            INSERT INTO metrics_daily(platform, connector_id, entity_type, entity_id, date, spend)
+            VALUES ('meta', 'con_a', 'campaign', 'c1', '2026-02-15', 3.5);
+            UPDATE meta SET value='6' WHERE key='schema_version';
+            """
+        )
+
+    db = AdsDB(db_path)
+    db.init()
+    with db._get_reader() as conn:
+        sql = {
+            r["name"]: r["sql"]
+            for r in conn.execute("SELECT name, sql FROM sqlite_master WHERE tbl_name LIKE 'metrics_%'")
+        }
+        rows = conn.execute("SELECT connector_id, entity_id, spend FROM metrics_daily").fetchall()
+    assert "WITHOUT ROWID" in sql["metrics_daily"] and "WITHOUT ROWID" in sql["metrics_intraday"]
+    assert "idx_metrics_daily_platform_connector_date" in sql
+    assert [tuple(r) for r in rows] == [("con_a", "c1", 3.5)]
+    db.close()
+
+
+def test_init_removes_duplicate_seed_rows_before_unique_indexes(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    db = AdsDB(db_path)
+    db.init()
+    db.close()
+    with sqlite3.connect(db_path) as conn:
+        # Two processes seeding a pre-v8 DB at once could both insert the same rows.
+        conn.executescript(
+            """
+            DROP INDEX idx_connectors_platform_name;
+            DROP INDEX idx_rules_name;
+            INSERT INTO connectors(id, platform, name, created_at, updated_at)
+            VALUES ('con_a', 'meta', 'Meta Ads', 'now', 'now'), ('con_b', 'meta', 'Meta Ads', 'now', 'now');
+            INSERT INTO entities(platform, connector_id, entity_type, entity_id, name, updated_at)
+            VALUES ('meta', 'con_a', 'campaign', 'c1', 'kept', 'now'),
+                   ('meta', 'con_b', 'campaign', 'c1', 'dropped', 'now'),
+                   ('meta', 'con_b', 'campaign', 'c2', 'moved', 'now');
+            INSERT INTO metrics_daily(platform, connector_id, entity_type, entity_id, date, spend)
+            VALUES ('meta', 'con_b', 'campaign', 'c2', '2026-02-15', 1.5);
+            INSERT INTO action_proposals(id, created_at, updated_at, status, platform, connector_id,
+                                         action_type, entity_type, entity_id)
+            VALUES ('p1', 'now', 'now', 'proposed', 'meta', 'con_b', 'pause', 'campaign', 'c2');
+            INSERT INTO rules(id, name, enabled, rule_type, created_at, updated_at)
+            VALUES ('rule_a', 'Kill', 0, 'kill_switch_spend_no_conv', 'now', 'now'),
+                   ('rule_b', 'Kill', 1, 'kill_switch_spend_no_conv', 'now', 'now');
+            UPDATE meta SET value='5' WHERE key='schema_version';
+            """
+        )
+    conn.close()
+
+    db = AdsDB(db_path)
+    db.init()
+    with db._get_reader() as conn:
+        connectors = conn.execute("SELECT id FROM connectors WHERE name='Meta Ads'").fetchall()
+        ents = conn.execute("SELECT connector_id, entity_id, name FROM entities ORDER BY entity_id").fetchall()
+        metrics = conn.execute("SELECT connector_id FROM metrics_daily").fetchall()
+        proposal = conn.execute("SELECT connector_id FROM action_proposals").fetchone()
+        rules = conn.execute("SELECT id, enabled FROM rules WHERE name='Kill'").fetchall()
+        names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    assert [r[0] for r in connectors] == ["con_a"]
+    assert [tuple(r) for r in ents] == [("con_a", "c1", "kept"), ("con_a", "c2", "moved")]
+    assert [r[0] for r in metrics] == ["con_a"]
+    assert proposal[0] == "con_a"
+    assert [tuple(r) for r in rules] == [("rule_a", 1)]
+    assert {"idx_connectors_platform_name", "idx_rules_name"} <= names
+    db.close()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from commerce.config import Settings
+from commerce.connectors.base import ConnectorContext
+from commerce.db import AdsDB
+from commerce.executor import ExecutionError, execute_proposal, proposal_payload
+from commerce.repo import Repo
+
+
+def test_execute_proposal_records_execution_and_proposal_outcome(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    AdsDB(db_path).seed_default_connectors()
+    repo = Repo(db_path)
+    meta = next(c for c in repo.list_connectors() if c["platform"] == "meta")
+    pid = repo.create_action_proposal(
+        status="approved",
+        platform="meta",
+        connector_id=str(meta["id"]),
+        action_type="pause_entity",
+        account_id=None,
+        entity_type="campaign",
+        entity_id="c1",
+        payload={"op": "pause"},
+        reason="test",
+    )
+    settings = Settings(
+        db_path=db_path,
+        timezone="Asia/Seoul",
+        web_host="127.0.0.1",
+        web_port=0,
+        telegram_bot_token=None,
+        telegram_allowed_chat_id=None,
+        demo_mode=False,
+        execution_mode="manual",
+    )
+
+    write_threads: list[int] = []
+    complete = repo.complete_execution
+
+    def tracking_complete(*args, **kwargs) -> None:
+        write_threads.append(threading.get_ident())
+        complete(*args, **kwargs)
+
+    repo.complete_execution = tracking_complete  # type: ignore[method-assign]
+    asyncio.run(execute_proposal(settings, repo=repo, proposal_id=pid, actor="tester"))
+    assert write_threads and write_threads[0] != threading.get_ident()
+
+    proposal = repo.get_proposal(pid)
+    assert proposal is not None and proposal["status"] == "executed"
+    assert json.loads(proposal["result_json"])["actor"] == "tester"
+    with sqlite3.connect(db_path) as conn:
+        execs = conn.execute("SELECT status, finished_at FROM executions WHERE proposal_id=?", (pid,)).fetchall()
+    assert len(execs) == 1 and execs[0][0] == "success" and execs[0][1]
+
+
+def test_execute_proposal_reuses_a_caller_owned_connector(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    AdsDB(db_path).seed_default_connectors()
+    repo = Repo(db_path)
+    meta = next(c for c in repo.list_connectors() if c["platform"] == "meta")
+    pids = [
+        repo.create_action_proposal(
+            status="approved",
+            platform="meta",
+            connector_id=str(meta["id"]),
+            action_type="pause_entity",
+            account_id=None,
+            entity_type="campaign",
+            entity_id=entity_id,
+            payload={"op": "pause"},
+            reason="test",
+        )
+        for entity_id in ("c1", "c2")
+    ]
+
+    class FakeConnector:
+        def __init__(self, connector_id: str) -> None:
+            self.ctx = ConnectorContext(connector_id=connector_id, platform="meta", name="Meta", config={})
+            self.applied: list[str] = []
+            self.closed = False
+
+        async def apply_action(self, proposal: dict) -> dict:
+            self.applied.append(proposal["entity_id"])
+            return {"ok": True}
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    settings = Settings(
+        db_path=db_path,
+        timezone="Asia/Seoul",
+        web_host="127.0.0.1",
+        web_port=0,
+        telegram_bot_token=None,
+        telegram_allowed_chat_id=None,
+        demo_mode=False,
+        execution_mode="manual",
+    )
+    other = FakeConnector("con_other")
+    with pytest.raises(ExecutionError, match="does not match"):
+        asyncio.run(execute_proposal(settings, repo=repo, proposal_id=pids[0], actor="auto", connector=other))
+    assert other.applied == []
+
+    connector = FakeConnector(str(meta["id"]))
+
+    async def run() -> None:
+        for pid in pids:
+            await execute_proposal(settings, repo=repo, proposal_id=pid, actor="auto", connector=connector)
+
+    asyncio.run(run())
+
+    assert connector.applied == ["c1", "c2"]
+    assert not connector.closed
+    assert all(repo.get_proposal(pid)["status"] == "executed" for pid in pids)
+
+
+def test_proposal_payload_tolerates_bad_json() -> None:
+    payload = {"budget": 1}
+    assert proposal_payload({"payload_json": payload}) is payload
+    assert proposal_payload({"payload_json": '{"budget": 2}'}) == {"budget": 2}
+    assert proposal_payload({"payload_json": "{}"}) == {}
+    assert proposal_payload({"payload_json": "[1]"}) == {}
+    assert proposal_payload({"payload_json": "not json"}) == {}
+    assert proposal_payload({}) == {}
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from commerce.fixtures import load_entities, load_metrics_daily_rows, load_metrics_intraday_rows
+
+
+def test_metric_rows_parse_positionally_like_dictreader(tmp_path: Path) -> None:
+    (tmp_path / "metrics_daily.csv").write_text(
+        "\ufeffplatform,account_id,entity_type,entity_id,date,spend,impressions,clicks,metrics_json\n"
+        ' meta ,,campaign,c1,2026-02-15," 1,234.5 ",1000,"1,2",{"a": 1}\n'
+        "\n"
+        "meta,acc1,campaign,c2,2026-02-16,x\n",
+        encoding="utf-8",
+    )
+    rows = list(load_metrics_daily_rows(tmp_path))
+    assert len(rows) == 2
+    assert rows[0] == {
+        "platform": "meta",
+        "account_id": None,
+        "entity_type": "campaign",
+        "entity_id": "c1",
+        "date": "2026-02-15",
+        "spend": 1234.5,
+        "impressions": 1000,
+        "clicks": 12,
+        "conversions": None,
+        "conversion_value": None,
+        "metrics_json": {"a": 1},
+    }
+    assert rows[1]["account_id"] == "acc1"
+    assert rows[1]["spend"] is None and rows[1]["impressions"] is None and rows[1]["metrics_json"] == {}
+
+    (tmp_path / "metrics_intraday.csv").write_text(
+        "platform,entity_type,entity_id,hour_ts,spend,impressions\nmeta,campaign,c1,2026-02-15T09:00:00+09:00,3,2.0\n",
+        encoding="utf-8",
+    )
+    (row,) = load_metrics_intraday_rows(tmp_path)
+    assert row["hour_ts"] == "2026-02-15T09:00:00+09:00"
+    assert (row["spend"], row["impressions"]) == (3.0, 2)
+
+
+def test_load_entities_yields_parsed_objects_in_order(tmp_path: Path) -> None:
+    (tmp_path / "entities.json").write_text('[{"entity_id": "c1"}, {"entity_id": "c2"}]', encoding="utf-8")
+    assert [e["entity_id"] for e in load_entities(tmp_path)] == ["c1", "c2"]
+
+    (tmp_path / "entities.json").write_text('[{"entity_id": "c1"}, 3]', encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(load_entities(tmp_path))
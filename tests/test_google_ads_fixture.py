@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from commerce.connectors.base import ConnectorContext
+from commerce.connectors.google_ads import GoogleAdsConnector
+from commerce.db import AdsDB
+from commerce.repo import Repo
+
+
+_HEADER = (
+    "platform,account_id,entity_type,entity_id,{ts},spend,impressions,clicks,"
+    "conversions,conversion_value,metrics_json\n"
+)
+
+
+def _setup(tmp_path: Path) -> tuple[Repo, GoogleAdsConnector]:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    repo = Repo(db_path)
+
+    fixture_dir = tmp_path / "google_fixture"
+    fixture_dir.mkdir(parents=True, exist_ok=True)
+    (fixture_dir / "metrics_daily.csv").write_text(
+        _HEADER.format(ts="date")
+        + "google,acc1,campaign,c1,2026-02-13,100,10,1,0,0,\n"
+        + "google,acc1,campaign,c1,2026-02-14,200,20,2,0,0,\n"
+        + "google,acc1,campaign,c1,2026-02-15,300,30,3,1,900,\n"
+        + "google,acc1,campaign,c1,2026-02-16,400,40,4,0,0,\n",
+        encoding="utf-8",
+    )
+    (fixture_dir / "metrics_intraday.csv").write_text(
+        _HEADER.format(ts="hour_ts")
+        + "google,acc1,campaign,c1,2026-02-14T23:00:00+09:00,50,5,1,0,0,\n"
+        + "google,acc1,campaign,c1,2026-02-15T10:00:00+09:00,60,6,1,0,0,\n"
+        + "google,acc1,campaign,c1,2026-02-15T11:00:00+09:00,70,7,1,0,0,\n",
+        encoding="utf-8",
+    )
+
+    ctx = ConnectorContext(
+        connector_id="con_google_fixture",
+        platform="google",
+        name="Google Fixture",
+        config={"mode": "fixture", "fixture_dir": str(fixture_dir)},
+    )
+    return repo, GoogleAdsConnector(ctx, repo)
+
+
+def test_google_fixture_daily_filters_inclusive_range(tmp_path: Path) -> None:
+    repo, connector = _setup(tmp_path)
+
+    # Reversed bounds are normalized by the connector.
+    asyncio.run(connector.fetch_metrics_daily("2026-02-15", "2026-02-14"))
+
+    rows = repo.list_metrics_range_for_date(
+        platform="google",
+        entity_type="campaign",
+        start_day="2026-01-01",
+        end_day="2026-12-31",
+    )
+    assert len(rows) == 1
+    assert rows[0]["spend"] == 500.0
+    assert rows[0]["clicks"] == 5.0
+
+
+def test_google_fixture_intraday_matches_day_only(tmp_path: Path) -> None:
+    repo, connector = _setup(tmp_path)
+
+    asyncio.run(connector.fetch_metrics_intraday("2026-02-15"))
+
+    totals = repo.sum_intraday_for_entity_date(
+        platform="google",
+        entity_type="campaign",
+        entity_id="c1",
+        day="2026-02-15",
+    )
+    assert totals["spend"] == 130.0
+    assert totals["clicks"] == 2.0
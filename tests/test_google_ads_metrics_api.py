@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from commerce.connectors import google_ads
+from commerce.connectors.base import ConnectorContext
+from commerce.connectors.google_ads import GoogleAdsConnector
+
+CID = "8666829099"
+
+
+def _metrics(cost_micros: int, clicks: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        impressions=clicks * 10,
+        clicks=clicks,
+        cost_micros=cost_micros,
+        conversions=0.0,
+        conversions_value=0.0,
+        all_conversions=0.0,
+        all_conversions_value=0.0,
+    )
+
+
+def _keyword_row(day: str, kid: int, cost_micros: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        segments=SimpleNamespace(date=day),
+        campaign=SimpleNamespace(id=11, name="Camp", status="ENABLED"),
+        ad_group=SimpleNamespace(id=22, name="Group", status="ENABLED"),
+        ad_group_criterion=SimpleNamespace(
+            criterion_id=kid,
+            keyword=SimpleNamespace(text=f"kw{kid}"),
+            status="ENABLED",
+        ),
+        metrics=_metrics(cost_micros, 1),
+    )
+
+
+def _connector(levels: list[str]) -> tuple[GoogleAdsConnector, MagicMock]:
+    ctx = ConnectorContext(
+        connector_id="con_google_test",
+        platform="google",
+        name="Google Ads Test",
+        config={"mode": "api", "ingest_levels": levels, "include_today": True},
+    )
+    repo = MagicMock()
+    repo.get_meta.return_value = None
+    repo.metric_rows = []
+    repo.upsert_metrics_daily_bulk.side_effect = lambda rows: repo.metric_rows.extend(rows)
+    return GoogleAdsConnector(ctx, repo), repo
+
+
+def _client(rows: list) -> MagicMock:
+    ga_service = MagicMock()
+    ga_service.search_stream.side_effect = lambda **_: [SimpleNamespace(results=list(rows))]
+    client = MagicMock()
+    client.get_service.return_value = ga_service
+    return client
+
+
+def test_keyword_level_upserts_each_parent_once() -> None:
+    connector, repo = _connector(["keyword"])
+    rows = [
+        _keyword_row("2026-02-14", 33, 1_000_000),
+        _keyword_row("2026-02-15", 33, 2_000_000),
+        _keyword_row("2026-02-15", 34, 3_000_000),
+    ]
+    with patch.object(connector, "_google_client", return_value=_client(rows)):
+        with patch.object(connector, "_google_customer_id", return_value=CID):
+            asyncio.run(connector.fetch_metrics_daily("2026-02-14", "2026-02-15"))
+
+    entity_calls = [c.kwargs for c in repo.upsert_entity.call_args_list]
+    by_type: dict[str, list[str]] = {}
+    for kw in entity_calls:
+        by_type.setdefault(kw["entity_type"], []).append(kw["entity_id"])
+    assert by_type["campaign"] == ["11"]
+    assert by_type["adgroup"] == ["22"]
+    assert set(by_type["keyword"]) == {"33", "34"}
+
+    metric_calls = repo.metric_rows
+    assert len(metric_calls) == 3
+    assert sum(m["spend"] for m in metric_calls) == 6.0
+    assert {m["entity_id"] for m in metric_calls} == {"33", "34"}
+    assert all(m["metrics_json"]["parent_adgroup_id"] == "22" for m in metric_calls)
+
+
+def test_sync_entities_includes_campaigns_without_ad_groups() -> None:
+    connector, repo = _connector(["campaign"])
+    campaigns = [
+        SimpleNamespace(campaign=SimpleNamespace(id=cid, name=f"Camp{cid}", status="PAUSED"))
+        for cid in (11, 12)
+    ]
+    adgroups = [
+        SimpleNamespace(
+            campaign=SimpleNamespace(id=11),
+            ad_group=SimpleNamespace(id=gid, name=f"Group{gid}", status="ENABLED"),
+        )
+        for gid in (21, 22)
+    ]
+    client = _client([])
+    client.get_service.return_value.search_stream.side_effect = lambda query, **_: [
+        SimpleNamespace(results=campaigns if "FROM campaign" in query else adgroups)
+    ]
+    with patch.object(connector, "_google_client", return_value=client):
+        with patch.object(connector, "_google_customer_id", return_value=CID):
+            asyncio.run(connector.sync_entities())
+
+    upserts = [(c.kwargs["entity_type"], c.kwargs["entity_id"]) for c in repo.upsert_entity.call_args_list]
+    # Campaign 12 has no ad groups (e.g. Performance Max) and still gets its status.
+    assert upserts == [("campaign", "11"), ("campaign", "12"), ("adgroup", "21"), ("adgroup", "22")]
+    assert repo.upsert_entity.call_args_list[1].kwargs["status"] == "PAUSED"
+    assert repo.upsert_entity.call_args_list[2].kwargs["parent_id"] == "11"
+
+
+def test_token_bucket_sleeps_once_burst_is_spent(monkeypatch) -> None:
+    clock = [100.0]
+    slept: list[float] = []
+    monkeypatch.setattr(google_ads.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(google_ads.time, "sleep", lambda s: slept.append(s))
+
+    bucket = google_ads._TokenBucket(rate=1.0, capacity=2.0)
+    bucket.acquire()
+    bucket.acquire()
+    assert slept == []
+    bucket.acquire()
+    assert slept == [1.0]
+
+
+def test_ads_pool_size_falls_back_on_bad_env(monkeypatch) -> None:
+    monkeypatch.setenv("GOOGLE_ADS_POOL", "lots")
+    assert google_ads._ads_pool_size() == 16
+    monkeypatch.setenv("GOOGLE_ADS_POOL", "0")
+    assert google_ads._ads_pool_size() == 16
+    monkeypatch.setenv("GOOGLE_ADS_POOL", "4")
+    assert google_ads._ads_pool_size() == 4
@@ -82,3 +82,28 @@ def test_import_google_campaign_basic(tmp_path: Path) -> None:
         mj = json.loads(mj_raw[0])
         assert float(mj["conversions_all"]) == 7.0
         assert float(mj["conversion_value_all"]) == 250000.0
+
+
+def test_import_meta_adset_rows_share_parent_entities(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    repo = Repo(db_path)
+
+    csv_path = tmp_path / "meta.csv"
+    csv_path.write_text(
+        "Day,Campaign ID,Campaign name,Ad set ID,Ad set name,Amount spent,Spend\n"
+        "2026-02-14,c1,MetaCamp,s1,Set1,,100\n"
+        "2026-02-15,c1,MetaCamp,s1,Set1,200,\n"
+        "2026-02-15,c1,MetaCamp,s2,Set2,300,\n",
+        encoding="utf-8",
+    )
+
+    res = import_meta_ads_csv(repo, path=csv_path, opts=MetaImportOptions(level="adset"))
+    assert res["imported"] == 3
+
+    with sqlite3.connect(db_path) as conn:
+        ents = conn.execute("SELECT entity_type, entity_id, parent_id FROM entities ORDER BY entity_type, entity_id").fetchall()
+        spend = conn.execute("SELECT entity_id, date, spend FROM metrics_daily ORDER BY date, entity_id").fetchall()
+    assert ents == [("adset", "s1", "c1"), ("adset", "s2", "c1"), ("campaign", "c1", None)]
+    # A blank first alias falls through to the next one present in that row.
+    assert spend == [("s1", "2026-02-14", 100.0), ("s1", "2026-02-15", 200.0), ("s2", "2026-02-15", 300.0)]
@@ -4,7 +4,7 @@ import sqlite3
 from pathlib import Path
 
 from commerce.db import AdsDB
-from commerce.importers.standard import import_daily_csv
+from commerce.importers.standard import _parse_float, _parse_int, import_daily_csv
 from commerce.repo import Repo
 
 
@@ -32,3 +32,9 @@ def test_import_standard_daily_basic(tmp_path: Path) -> None:
         assert float(row[2]) == 1.0
         assert float(row[3]) == 90000.0
 
+
+def test_parse_numbers_fast_path_matches_fallback() -> None:
+    assert [_parse_float(v) for v in (None, "", "  ", "12", " 1,234.5 ", "x", 3)] == [
+        None, None, None, 12.0, 1234.5, None, 3.0,
+    ]
+    assert [_parse_int(v) for v in ("7", "2.9", "1,000", "")] == [7, 2, 1000, None]
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+from unittest.mock import MagicMock
+
+import httpx
+
+from commerce.connectors.base import ConnectorContext
+from commerce.connectors.meta_ads import MetaAdsConnector
+from commerce.db import AdsDB
+from commerce.repo import Repo
+
+
+def _connector(config: dict | None = None) -> MetaAdsConnector:
+    ctx = ConnectorContext(
+        connector_id="con_meta_test",
+        platform="meta",
+        name="Meta Test",
+        config={"mode": "api", **(config or {})},
+    )
+    return MetaAdsConnector(ctx, repo=None)
+
+
+def test_iter_graph_data_follows_paging_on_one_client(monkeypatch) -> None:
+    monkeypatch.setenv("META_ACCESS_TOKEN", "tok")
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        if "after=p2" in str(request.url):
+            body = {"data": [{"id": "2"}]}
+        else:
+            body = {"data": [{"id": "1"}], "paging": {"next": "https://graph.test/v21.0/act_1/campaigns?after=p2"}}
+        return httpx.Response(200, content=json.dumps(body).encode("utf-8"))
+
+    connector = _connector()
+    connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run() -> list[dict]:
+        client = connector._get_client()
+        out = await connector._iter_graph_data(path="act_1/campaigns", params={"fields": "id"})
+        assert connector._get_client() is client
+        await connector.aclose()
+        return out
+
+    out = asyncio.run(run())
+    assert [x["id"] for x in out] == ["1", "2"]
+    assert len(seen) == 2
+    assert "access_token=tok" in seen[0]
+    assert connector._client is None
+
+
+def _insights_handler(rows: list[dict]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=json.dumps({"data": rows}).encode("utf-8"))
+
+    return handler
+
+
+def test_fetch_metrics_daily_flushes_each_level_in_bulk(monkeypatch) -> None:
+    monkeypatch.setenv("META_ACCESS_TOKEN", "tok")
+    monkeypatch.setenv("META_AD_ACCOUNT_ID", "act_123")
+    rows = [
+        {
+            "date_start": day,
+            "campaign_id": "c1",
+            "campaign_name": "Camp",
+            "spend": "1,000",
+            "impressions": "100",
+            "clicks": "5",
+            "actions": [
+                {"action_type": "purchase", "value": "2"},
+                {"action_type": "offsite_conversion.fb_pixel_purchase", "value": "1"},
+            ],
+            "action_values": [{"action_type": "purchase", "value": "30000"}],
+        }
+        for day in ("2026-02-14", "2026-02-15")
+    ]
+    connector = _connector({"ingest_levels": ["campaign"], "include_today": True})
+    connector._client = httpx.AsyncClient(transport=httpx.MockTransport(_insights_handler(rows)))
+    repo = MagicMock()
+    repo.get_meta.return_value = None
+    repo.entity_rows = []
+    repo.metric_rows = []
+    repo.upsert_entities_bulk.side_effect = lambda it: repo.entity_rows.extend(it)
+    repo.upsert_metrics_daily_bulk.side_effect = lambda it: repo.metric_rows.extend(it)
+    connector.repo = repo
+
+    asyncio.run(connector.fetch_metrics_daily("2026-02-14", "2026-02-15"))
+
+    assert repo.upsert_entities_bulk.call_count == 1
+    assert repo.upsert_metrics_daily_bulk.call_count == 1
+    assert [e["entity_id"] for e in repo.entity_rows] == ["c1"]
+    assert [m["day"] for m in repo.metric_rows] == ["2026-02-14", "2026-02-15"]
+    m = repo.metric_rows[0]
+    assert m["spend"] == 1000.0
+    assert m["conversions"] == 3.0
+    assert m["conversion_value"] == 30000.0
+    assert m["metrics_json"]["conversions_all"] == 1.0
+    assert "actions" not in m["metrics_json"]  # raw maps are opt-in via store_raw_actions
+    repo.upsert_entity.assert_not_called()
+    repo.upsert_metric_daily.assert_not_called()
+
+
+def test_action_totals_skips_the_per_type_map_when_not_stored() -> None:
+    connector = _connector()
+    items = [
+        {"action_type": "offsite_conversion.fb_pixel_purchase", "value": "2"},
+        {"action_type": "link_click", "value": "5"},
+    ]
+    kept = connector._action_totals(items)
+    skipped = connector._action_totals(items, keep_map=False)
+    assert kept[0] == {"offsite_conversion.fb_pixel_purchase": 2.0, "link_click": 5.0}
+    assert skipped[0] == {}
+    assert skipped[1:] == kept[1:]
+
+
+def test_appsecret_proof_is_cached_per_secret_and_token(monkeypatch) -> None:
+    monkeypatch.setenv("META_ACCESS_TOKEN", "tok")
+    monkeypatch.setenv("META_APP_SECRET", "sec")
+    connector = _connector()
+
+    first = connector._appsecret_proof()
+    assert first == hmac.new(b"sec", b"tok", hashlib.sha256).hexdigest()
+    assert connector._appsecret_proof() is first
+
+    monkeypatch.setenv("META_ACCESS_TOKEN", "tok2")
+    assert connector._appsecret_proof() == hmac.new(b"sec", b"tok2", hashlib.sha256).hexdigest()
+
+
+def test_fetch_metrics_daily_runs_levels_concurrently(monkeypatch) -> None:
+    monkeypatch.setenv("META_ACCESS_TOKEN", "tok")
+    monkeypatch.setenv("META_AD_ACCOUNT_ID", "123")
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        row = {"date_start": "2026-02-15", "campaign_id": "c1", "adset_id": "s1", "spend": "1"}
+        return httpx.Response(200, content=json.dumps({"data": [row]}).encode("utf-8"))
+
+    connector = _connector({"ingest_levels": ["campaign", "adset"], "include_today": True})
+    connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    repo = MagicMock()
+    repo.get_meta.return_value = None
+    connector.repo = repo
+
+    asyncio.run(connector.fetch_metrics_daily("2026-02-15", "2026-02-15"))
+
+    assert peak == 2
+    flushed = {list(c.args[0])[0]["entity_type"] for c in repo.upsert_metrics_daily_bulk.call_args_list}
+    assert flushed == {"campaign", "adset"}
+
+
+def test_failed_level_cancels_other_levels(monkeypatch) -> None:
+    monkeypatch.setenv("META_ACCESS_TOKEN", "tok")
+    monkeypatch.setenv("META_AD_ACCOUNT_ID", "123")
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("level") == "campaign":
+            body = {"error": {"message": "transient", "code": 2}}
+            return httpx.Response(500, content=json.dumps(body).encode("utf-8"))
+        await asyncio.sleep(0.05)
+        row = {"date_start": "2026-02-15", "adset_id": "s1", "campaign_id": "c1", "spend": "1"}
+        return httpx.Response(200, content=json.dumps({"data": [row]}).encode("utf-8"))
+
+    connector = _connector({"ingest_levels": ["campaign", "adset"], "include_today": True})
+    connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    repo = MagicMock()
+    repo.get_meta.return_value = None
+    connector.repo = repo
+
+    async def tick_then_idle() -> None:
+        try:
+            await connector.fetch_metrics_daily("2026-02-15", "2026-02-15")
+        except* RuntimeError as eg:
+            assert "transient" in str(eg.exceptions[0])
+        else:
+            raise AssertionError("the failing level should propagate")
+        # The worker loop keeps running after a failed tick; no level may write meanwhile.
+        await asyncio.sleep(0.1)
+
+    asyncio.run(tick_then_idle())
+
+    repo.upsert_metrics_daily_bulk.assert_not_called()
+    repo.set_meta.assert_not_called()
+
+
+def test_conditional_paging_skips_unchanged_pages(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("META_ACCESS_TOKEN", "tok")
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    statuses: list[int] = []
+    tokens: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        tokens.append(request.url.params["access_token"])
+        page2 = "after=p2" in str(request.url)
+        etag = '"e2"' if page2 else '"e1"'
+        if request.headers.get("if-none-match") == etag:
+            statuses.append(304)
+            return httpx.Response(304)
+        statuses.append(200)
+        body = {"data": [{"id": "2" if page2 else "1"}]}
+        if not page2:
+            body["paging"] = {"next": "https://graph.test/v21.0/act_1/campaigns?after=p2&access_token=tok"}
+        return httpx.Response(200, content=json.dumps(body).encode("utf-8"), headers={"ETag": etag})
+
+    connector = _connector()
+    connector.repo = Repo(db_path)
+    connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def fetch() -> list[dict]:
+        return await connector._iter_graph_data(path="act_1/campaigns", params={"fields": "id"}, conditional=True)
+
+    assert [x["id"] for x in asyncio.run(fetch())] == ["1", "2"]
+    monkeypatch.setenv("META_ACCESS_TOKEN", "rotated")
+    assert asyncio.run(fetch()) == []
+    assert statuses == [200, 200, 304, 304]
+    assert tokens == ["tok", "tok", "rotated", "rotated"]
+
+
+def test_fetch_metrics_daily_flushes_per_page(monkeypatch) -> None:
+    monkeypatch.setenv("META_ACCESS_TOKEN", "tok")
+    monkeypatch.setenv("META_AD_ACCOUNT_ID", "123")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page2 = "after=p2" in str(request.url)
+        body = {"data": [{"date_start": "2026-02-15" if page2 else "2026-02-14", "campaign_id": "c1", "spend": "1"}]}
+        if not page2:
+            body["paging"] = {"next": "https://graph.test/v21.0/act_123/insights?after=p2"}
+        return httpx.Response(200, content=json.dumps(body).encode("utf-8"))
+
+    connector = _connector({"ingest_levels": ["campaign"], "include_today": True})
+    connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    repo = MagicMock()
+    repo.get_meta.return_value = None
+    connector.repo = repo
+
+    asyncio.run(connector.fetch_metrics_daily("2026-02-14", "2026-02-15"))
+
+    days = [[m["day"] for m in c.args[0]] for c in repo.upsert_metrics_daily_bulk.call_args_list]
+    assert days == [["2026-02-14"], ["2026-02-15"]]
+    entities = [[e["entity_id"] for e in c.args[0]] for c in repo.upsert_entities_bulk.call_args_list]
+    assert entities == [["c1"], []]
+
+
+def test_entity_sync_commits_etags_only_after_writes(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("META_ACCESS_TOKEN", "tok")
+    monkeypatch.setenv("META_AD_ACCOUNT_ID", "1")
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    fail_page2 = [True]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page2 = "after=p2" in str(request.url)
+        etag = '"e2"' if page2 else '"e1"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304)
+        if page2 and fail_page2[0]:
+            body = {"error": {"message": "transient", "code": 2}}
+            return httpx.Response(500, content=json.dumps(body).encode("utf-8"))
+        body = {"data": [{"id": "2" if page2 else "1", "name": "C"}]}
+        if not page2:
+            body["paging"] = {"next": "https://graph.test/v21.0/act_1/campaigns?after=p2"}
+        return httpx.Response(200, content=json.dumps(body).encode("utf-8"), headers={"ETag": etag})
+
+    def sync() -> None:
+        connector = _connector({"ingest_levels": ["campaign"]})
+        connector.repo = Repo(db_path)
+        connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        asyncio.run(connector.sync_entities())
+
+    try:
+        sync()
+    except RuntimeError as e:
+        assert "transient" in str(e)
+    else:
+        raise AssertionError("page 2 should have failed")
+    fail_page2[0] = False
+    sync()
+
+    ids = {e["entity_id"] for e in Repo(db_path).list_entities(platform="meta", entity_type="campaign")}
+    assert ids == {"1", "2"}
+
+
+def test_commit_etags_prunes_pages_no_longer_reached(tmp_path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    connector = _connector()
+    connector.repo = Repo(db_path)
+
+    connector._commit_etags("act_1/campaigns", {"meta:etag:a": '{"etag": "1"}', "meta:etag:b": '{"etag": "2"}'})
+    # Next pass: a is unchanged (304), b is gone, c is new, d came back without an ETag.
+    connector.repo.set_meta("meta:etag:d", '{"etag": "old"}')
+    connector._commit_etags("act_1/campaigns", {"meta:etag:a": None, "meta:etag:c": '{"etag": "3"}', "meta:etag:d": ""})
+
+    got = {k: connector.repo.get_meta(k) for k in ("meta:etag:a", "meta:etag:b", "meta:etag:c", "meta:etag:d")}
+    assert got == {"meta:etag:a": '{"etag": "1"}', "meta:etag:b": None, "meta:etag:c": '{"etag": "3"}', "meta:etag:d": None}
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from commerce.connectors.base import ConnectorContext
+from commerce.connectors.meta_ads import MetaAdsConnector
+from commerce.db import AdsDB
+from commerce.repo import Repo
+
+
+def test_meta_fixture_daily_filters_inclusive_range(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    repo = Repo(db_path)
+
+    fixture_dir = tmp_path / "meta_fixture"
+    fixture_dir.mkdir()
+    (fixture_dir / "metrics_daily.csv").write_text(
+        "platform,account_id,entity_type,entity_id,date,spend,impressions,clicks,"
+        "conversions,conversion_value,metrics_json\n"
+        "meta,acc1,campaign,c1,2026-02-13,100,10,1,0,0,\n"
+        "meta,acc1,campaign,c1,2026-02-14,200,20,2,0,0,\n"
+        "meta,acc1,campaign,c1,2026-02-15,300,30,3,1,900,\n"
+        "meta,acc1,campaign,c1,2026-02-16,400,40,4,0,0,\n",
+        encoding="utf-8",
+    )
+    ctx = ConnectorContext(
+        connector_id="con_meta_fixture",
+        platform="meta",
+        name="Meta Fixture",
+        config={"mode": "fixture", "fixture_dir": str(fixture_dir)},
+    )
+
+    asyncio.run(MetaAdsConnector(ctx, repo).fetch_metrics_daily("2026-02-14", "2026-02-15"))
+
+    rows = repo.list_metrics_range_for_date(
+        platform="meta",
+        entity_type="campaign",
+        start_day="2026-01-01",
+        end_day="2026-12-31",
+    )
+    assert len(rows) == 1
+    assert rows[0]["spend"] == 500.0
+    assert rows[0]["conversions"] == 1.0
+
+
+def test_meta_fixture_sync_entities_bulk(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    repo = Repo(db_path)
+
+    fixture_dir = tmp_path / "meta_fixture"
+    fixture_dir.mkdir()
+    (fixture_dir / "entities.json").write_bytes(
+        b'\xef\xbb\xbf[{"entity_type": "campaign", "entity_id": "c1", "name": "\xec\xba\xa0\xed\x8e\x98\xec\x9d\xb8"},'
+        b' {"entity_type": "adset", "entity_id": "s1", "parent_type": "campaign", "parent_id": "c1"}]'
+    )
+    ctx = ConnectorContext(
+        connector_id="con_meta_fixture",
+        platform="meta",
+        name="Meta Fixture",
+        config={"mode": "fixture", "fixture_dir": str(fixture_dir)},
+    )
+
+    asyncio.run(MetaAdsConnector(ctx, repo).sync_entities())
+
+    ents = {e["entity_id"]: e for e in repo.list_entities(platform="meta")}
+    assert ents["c1"]["name"] == "캠페인"
+    assert ents["s1"]["parent_id"] == "c1"
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+from pathlib import Path
+
+import httpx
+
+from commerce.connectors import naver_searchad
+from commerce.connectors.base import ConnectorContext
+from commerce.connectors.naver_searchad import NaverSearchAdConnector
+from commerce.db import AdsDB
+from commerce.repo import Repo
+
+
+def _ad_detail_line(camp: str, grp: str, kw: str, impr: int, clk: int, cost: int, conv: int) -> str:
+    cols = [
+        "20260215", "cust", camp, grp, kw, f"ad-{kw}", "bc", "00", "0", "70",
+        "P", str(impr), str(clk), str(cost), "0", str(conv),
+    ]
+    return "\t".join(cols)
+
+
+def _run(tmp_path: Path, monkeypatch, blob: bytes, *, levels: list[str], report_tp: str = "AD_DETAIL") -> Path:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    repo = Repo(db_path)
+    monkeypatch.setenv("NAVER_SEARCHAD_CUSTOMER_ID", "cust")
+
+    async def fake_build(client, *, report_tp: str, stat_dt: str, **_):
+        return blob if stat_dt == "20260215" else None
+
+    monkeypatch.setattr(naver_searchad, "_build_and_download_stat_report", fake_build)
+    ctx = ConnectorContext(
+        connector_id="con_naver_test",
+        platform="naver",
+        name="Naver Test",
+        config={"mode": "api", "ingest_levels": levels, "include_today": True, "report_tp": report_tp},
+    )
+    asyncio.run(NaverSearchAdConnector(ctx, repo).fetch_metrics_daily("2026-02-15", "2026-02-15"))
+    return db_path
+
+
+def _metrics(db_path: Path) -> dict[tuple[str, str], tuple]:
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT entity_type, entity_id, spend, impressions, clicks, conversions, metrics_json "
+            "FROM metrics_daily WHERE date='2026-02-15'"
+        ).fetchall()
+    return {(r[0], r[1]): (r[2], r[3], r[4], r[5], json.loads(r[6])) for r in rows}
+
+
+def test_headerless_ad_detail_rolls_up_levels(tmp_path: Path, monkeypatch) -> None:
+    blob = (
+        _ad_detail_line("c1", "g1", "k1", 100, 10, 1000, 1)
+        + "\n\n"
+        + _ad_detail_line("c1", "g1", "k2", 50, 5, 500, 0)
+        + "\r\n"
+        + _ad_detail_line("c2", "g2", "k3", 10, 1, 100, 0)
+        + "\n"
+    ).encode("utf-8")
+
+    db_path = _run(tmp_path, monkeypatch, blob, levels=["campaign", "keyword"])
+
+    m = _metrics(db_path)
+    assert set(m) == {("campaign", "c1"), ("campaign", "c2"), ("keyword", "k1"), ("keyword", "k2"), ("keyword", "k3")}
+    assert m[("campaign", "c1")][:4] == (1500.0, 150, 15, 1.0)
+    assert m[("keyword", "k2")][:4] == (500.0, 50, 5, 0.0)
+    assert m[("campaign", "c1")][4]["conversions_all"] == 1.0
+
+    with sqlite3.connect(db_path) as conn:
+        ents = dict(
+            ((r[0], r[1]), r[2])
+            for r in conn.execute("SELECT entity_type, entity_id, parent_id FROM entities").fetchall()
+        )
+    assert ents[("adgroup", "g1")] == "c1"
+    assert ents[("keyword", "k2")] == "g1"
+    assert ents[("ad", "ad-k3")] == "g2"
+
+
+def test_header_report_with_korean_columns(tmp_path: Path, monkeypatch) -> None:
+    text = (
+        "캠페인ID\t캠페인명\t노출수\t클릭수\t총비용\t전환수\t구매전환수\t전환매출\n"
+        "c1\tCamp1\t1,000\t10\t60,000\t5\t2\t90000\n"
+        "c1\tCamp1\t500\t5\t\t1\t\t\n"
+    )
+    db_path = _run(tmp_path, monkeypatch, text.encode("cp949"), levels=["campaign"], report_tp="CUSTOM")
+
+    m = _metrics(db_path)
+    spend, impr, clk, conv, mj = m[("campaign", "c1")]
+    assert (spend, impr, clk) == (60000.0, 1500, 15)
+    assert conv == 2.0
+    assert mj["conversions_all"] == 6.0
+    assert mj["conversion_value_all"] == 90000.0
+
+
+def test_report_entity_names_filled_from_later_rows(tmp_path: Path, monkeypatch) -> None:
+    text = (
+        "캠페인ID\t캠페인명\t광고그룹ID\t광고그룹명\t노출수\t클릭수\t총비용\n"
+        "c1\t\tg1\t\t100\t1\t10\n"
+        "c1\tCamp1\tg1\tGroup1\t50\t1\t10\n"
+        "c1\t\tg1\t\t50\t1\t10\n"
+    )
+    db_path = _run(tmp_path, monkeypatch, text.encode("cp949"), levels=["campaign", "adgroup"], report_tp="CUSTOM")
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT entity_type, entity_id, parent_id, name FROM entities ORDER BY entity_type").fetchall()
+    assert rows == [("adgroup", "g1", "c1", "Group1"), ("campaign", "c1", None, "Camp1")]
+
+
+def test_parse_tsv_returns_positional_rows() -> None:
+    cols, rows = naver_searchad._parse_tsv(b"nccCampaignId\timpCnt\nc1\t10\n\nc2\n")
+    assert cols == ["nccCampaignId", "impCnt"]
+    assert list(rows) == [["c1", "10"], ["c2"]]
+
+    cols, rows = naver_searchad._parse_tsv(b"c1\t10\n", fieldnames=["nccCampaignId", "impCnt"])
+    assert cols == ["nccCampaignId", "impCnt"]
+    assert list(rows) == [["c1", "10"]]
+
+
+def test_client_reuses_one_connection_pool_and_signs_requests() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, content=b'{"ok": true}')
+
+    client = naver_searchad._NaverSearchAdClient(
+        base_url="https://naver.test", api_key="k", secret_key="s", customer_id="cust"
+    )
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run() -> None:
+        async with client:
+            pool = client._get_client()
+            assert await client.request_json(method="GET", uri="/ncc/campaigns") == {"ok": True}
+            assert await client.download_report("https://naver.test/dl") == b'{"ok": true}'
+            assert client._get_client() is pool
+
+    asyncio.run(run())
+    assert client._client is None
+    assert len(seen) == 2
+    ts = seen[0].headers["X-Timestamp"]
+    assert ts.endswith("000")
+    assert seen[0].headers["X-Signature"] == client._signature(ts, "GET", "/ncc/campaigns")
+
+
+def test_report_days_build_concurrently(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    monkeypatch.setenv("NAVER_SEARCHAD_CUSTOMER_ID", "cust")
+    in_flight = 0
+    peak = 0
+
+    async def fake_build(client, *, report_tp: str, stat_dt: str, **_):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _ad_detail_line("c1", "g1", "k1", 10, 1, 100, 0).replace("20260215", stat_dt).encode("utf-8")
+
+    monkeypatch.setattr(naver_searchad, "_build_and_download_stat_report", fake_build)
+    ctx = ConnectorContext(
+        connector_id="con_naver_test",
+        platform="naver",
+        name="Naver Test",
+        config={"mode": "api", "include_today": True, "report_concurrency": 2},
+    )
+    asyncio.run(NaverSearchAdConnector(ctx, Repo(db_path)).fetch_metrics_daily("2026-02-12", "2026-02-15"))
+
+    assert peak == 2
+    with sqlite3.connect(db_path) as conn:
+        days = [r[0] for r in conn.execute("SELECT date FROM metrics_daily ORDER BY date").fetchall()]
+    assert days == ["2026-02-12", "2026-02-13", "2026-02-14", "2026-02-15"]
+
+
+def test_failed_report_day_cancels_remaining_days(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    monkeypatch.setenv("NAVER_SEARCHAD_CUSTOMER_ID", "cust")
+    finished: list[str] = []
+
+    async def fake_build(client, *, report_tp: str, stat_dt: str, **_):
+        if stat_dt == "20260212":
+            raise RuntimeError("report build failed")
+        await asyncio.sleep(0.05)
+        finished.append(stat_dt)
+        return _ad_detail_line("c1", "g1", "k1", 10, 1, 100, 0).replace("20260215", stat_dt).encode("utf-8")
+
+    monkeypatch.setattr(naver_searchad, "_build_and_download_stat_report", fake_build)
+    ctx = ConnectorContext(
+        connector_id="con_naver_test",
+        platform="naver",
+        name="Naver Test",
+        config={"mode": "api", "include_today": True, "report_concurrency": 4},
+    )
+
+    async def tick_then_idle() -> None:
+        try:
+            await NaverSearchAdConnector(ctx, Repo(db_path)).fetch_metrics_daily("2026-02-12", "2026-02-15")
+        except* RuntimeError as eg:
+            assert [str(e) for e in eg.exceptions] == ["report build failed"]
+        else:
+            raise AssertionError("the failing day should propagate")
+        # The worker loop keeps running after a failed tick; no sibling may write meanwhile.
+        await asyncio.sleep(0.1)
+
+    asyncio.run(tick_then_idle())
+
+    assert finished == []
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM metrics_daily").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM meta WHERE key LIKE 'naver:%'").fetchone()[0] == 0
+
+
+def test_stat_report_polling_backs_off(monkeypatch) -> None:
+    slept: list[float] = []
+    polls = iter(["RUNNING"] * 4 + ["BUILT"])
+
+    async def fake_sleep(seconds: float) -> None:
+        slept.append(round(seconds, 3))
+
+    class FakeClient:
+        async def request_json(self, *, method: str, uri: str, **_):
+            if method == "POST":
+                return {"reportJobId": 7, "status": "REGIST"}
+            return {"status": next(polls), "downloadUrl": "https://naver.test/dl"}
+
+        async def download_report(self, url: str) -> bytes:
+            return b"data"
+
+    monkeypatch.setattr(naver_searchad, "_sleep", fake_sleep)
+    blob = asyncio.run(
+        naver_searchad._build_and_download_stat_report(FakeClient(), report_tp="AD_DETAIL", stat_dt="20260215")
+    )
+    assert blob == b"data"
+    assert slept == [1.0, 1.6, 2.56, 4.096, 6.554]
+
+
+def test_ad_detail_decoder_matches_generic_decoder() -> None:
+    rows = [
+        _ad_detail_line("c1", "g1", "k1", 100, 10, 1000, 1).split("\t"),
+        _ad_detail_line("c2", "g2", " ", 5, 0, 0, 0).split("\t")[:14],
+    ]
+    fast = list(naver_searchad._decode_ad_detail_rows(rows))
+    generic = list(naver_searchad._decode_report_rows(naver_searchad._AD_DETAIL_COLUMNS, rows))
+    assert fast == generic
+    assert fast[1][4] is None and fast[1][11] is None
+
+
+def test_request_dict_normalizes_non_object_bodies() -> None:
+    bodies = iter([b"", b"[1]", b'{"nccKeywordId": "k1"}'])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=next(bodies))
+
+    client = naver_searchad._NaverSearchAdClient(
+        base_url="https://naver.test", api_key="k", secret_key="s", customer_id="cust"
+    )
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run() -> list:
+        async with client:
+            return [await client.request_dict(method="GET", uri="/ncc/keywords/k1") for _ in range(3)]
+
+    assert asyncio.run(run()) == [{}, {}, {"nccKeywordId": "k1"}]
+    assert naver_searchad._sid({"entity_id": " k1 "}, "entity_id") == "k1"
+    assert naver_searchad._sid({"entity_id": None}, "entity_id") == ""
+
+
+def test_apply_actions_share_one_client_until_aclose(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("NAVER_SEARCHAD_CUSTOMER_ID", "cust")
+    built: list = []
+    original = NaverSearchAdConnector._build_client
+
+    def build(self):
+        client = original(self)
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, content=b'{"dailyBudget": 5000}'))
+        )
+        built.append(client)
+        return client
+
+    monkeypatch.setattr(NaverSearchAdConnector, "_build_client", build)
+    ctx = ConnectorContext(connector_id="con_naver_test", platform="naver", name="Naver Test", config={"mode": "api"})
+    connector = NaverSearchAdConnector(ctx, repo=None)
+    proposal = {"action_type": "set_budget", "entity_type": "campaign", "entity_id": "c1", "payload_json": '{"budget": 5000}'}
+
+    async def run() -> list[dict]:
+        out = [await connector.apply_action(proposal) for _ in range(2)]
+        await connector.aclose()
+        return out
+
+    results = asyncio.run(run())
+    assert [r["after"]["dailyBudget"] for r in results] == [5000, 5000]
+    assert len(built) == 1 and built[0]._client is None
+
+
+def test_pause_keyword_sends_parent_adgroup(monkeypatch) -> None:
+    monkeypatch.setenv("NAVER_SEARCHAD_CUSTOMER_ID", "cust")
+    sent: list[tuple[str, str, bytes]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append((request.method, request.url.path, request.content))
+        return httpx.Response(200, content=b'{"userLock": true, "status": "PAUSED"}')
+
+    ctx = ConnectorContext(connector_id="con_naver_test", platform="naver", name="Naver Test", config={"mode": "api"})
+    connector = NaverSearchAdConnector(ctx, repo=None)
+    connector._get_apply_client()._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    proposal = {
+        "action_type": "pause_entity",
+        "entity_type": "Keyword",
+        "entity_id": "k1",
+        "payload_json": {"op": "pause", "parent_id": "g1"},
+    }
+
+    result = asyncio.run(connector.apply_action(proposal))
+    asyncio.run(connector.aclose())
+
+    assert [(m, p) for m, p, _ in sent] == [("GET", "/ncc/keywords/k1"), ("PUT", "/ncc/keywords/k1")]
+    assert json.loads(sent[1][2]) == {"nccKeywordId": "k1", "userLock": True, "nccAdgroupId": "g1"}
+    assert result["after"] == {"userLock": True, "status": "PAUSED"}
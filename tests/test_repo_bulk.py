@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from commerce.db import AdsDB
+from commerce.registry import _ConnectorScopedRepo
+from commerce.repo import Repo
+
+
+def _metric(entity_id: str, day: str, spend: float) -> dict:
+    return {
+        "platform": "google",
+        "account_id": "acc1",
+        "entity_type": "campaign",
+        "entity_id": entity_id,
+        "day": day,
+        "spend": spend,
+        "impressions": 10,
+        "clicks": 1,
+        "conversions": 0.0,
+        "conversion_value": 0.0,
+        "metrics_json": {"source": "test"},
+    }
+
+
+def test_upsert_metrics_daily_bulk_scoped_and_idempotent(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    repo = Repo(db_path)
+    scoped = _ConnectorScopedRepo(repo, connector_id="con_1")
+
+    n = scoped.upsert_metrics_daily_bulk(
+        _metric(eid, "2026-02-15", 100.0) for eid in ("c1", "c2")
+    )
+    assert n == 2
+    # Re-upserting the same key updates in place.
+    scoped.upsert_metrics_daily_bulk([_metric("c1", "2026-02-15", 250.0)])
+
+    totals = repo.sum_metrics_daily(platform="google", day="2026-02-15", connector_id="con_1")
+    assert totals["entity_count"] == 2.0
+    assert totals["spend"] == 350.0
+    assert repo.upsert_metrics_daily_bulk([]) == 0
+
+
+def test_upsert_entities_bulk_scoped(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    repo = Repo(db_path)
+    scoped = _ConnectorScopedRepo(repo, connector_id="con_1")
+
+    n = scoped.upsert_entities_bulk(
+        {
+            "platform": "meta",
+            "account_id": "123",
+            "entity_type": "adset",
+            "entity_id": sid,
+            "parent_type": "campaign",
+            "parent_id": "c1",
+            "name": f"Set {sid}",
+            "status": None,
+            "meta_json": {"source": "test"},
+        }
+        for sid in ("s1", "s2")
+    )
+    assert n == 2
+    ents = repo.list_entities(platform="meta", connector_id="con_1", entity_type="adset")
+    assert [e["entity_id"] for e in ents] == ["s1", "s2"]
+    assert all(e["parent_id"] == "c1" for e in ents)
+    assert repo.upsert_entities_bulk([]) == 0
+
+
+def test_bulk_upserts_accept_preserialized_json(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    repo = Repo(db_path)
+
+    row = _metric("c1", "2026-02-15", 10.0)
+    row["metrics_json"] = '{"source":"raw"}'
+    repo.upsert_metrics_daily_bulk([row])
+
+    rows = repo.list_metrics_daily_for_date(platform="google", entity_type="campaign", day="2026-02-15")
+    assert rows[0]["metrics_json"] == '{"source":"raw"}'
+
+
+def test_get_parent_ids_batches_lookup(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    repo = Repo(db_path)
+    scoped = _ConnectorScopedRepo(repo, connector_id="con_1")
+    scoped.upsert_entities_bulk(
+        {
+            "platform": "naver",
+            "account_id": "cust",
+            "entity_type": "keyword",
+            "entity_id": kid,
+            "parent_type": "adgroup" if parent else None,
+            "parent_id": parent,
+            "name": kid,
+            "status": None,
+            "meta_json": {},
+        }
+        for kid, parent in (("k1", "g1"), ("k2", "g2"), ("k3", None))
+    )
+
+    parents = repo.get_parent_ids(platform="naver", entity_type="keyword", entity_ids=["k1", "k2", "k3", "k1", "kx"])
+    assert parents == {"k1": "g1", "k2": "g2"}
+    assert repo.get_parent_ids(platform="naver", entity_type="keyword", entity_ids=[]) == {}
+
+
+def test_upsert_store_orders_bulk_updates_in_place(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    repo = Repo(db_path)
+
+    def order(order_id: str, status: str) -> dict:
+        return {
+            "store": "smartstore",
+            "order_id": order_id,
+            "ordered_at": "2026-01-15T17:08:45+09:00",
+            "date_kst": "2026-01-15",
+            "status": status,
+            "amount": 1000.0,
+            "currency": "KRW",
+            "meta_json": {"productOrderId": order_id},
+        }
+
+    assert repo.upsert_store_orders_bulk([order("po_1", "PAYED"), order("po_2", "PAYED")]) == 2
+    repo.upsert_store_orders_bulk([order("po_1", "PURCHASE_DECIDED")])
+
+    rows = {r["order_id"]: r for r in repo.list_store_orders(store="smartstore", limit=10)}
+    assert set(rows) == {"po_1", "po_2"}
+    assert rows["po_1"]["status"] == "PURCHASE_DECIDED"
+    assert rows["po_2"]["inflow_path"] is None
+    assert repo.upsert_store_orders_bulk([]) == 0
+
+
+def test_upsert_metrics_intraday_bulk_scoped(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    repo = Repo(db_path)
+    scoped = _ConnectorScopedRepo(repo, connector_id="con_1")
+
+    rows = [
+        {**_metric("c1", "", 5.0), "hour_ts": f"2026-02-15T{h:02d}:00:00+09:00"}
+        for h in (9, 10)
+    ]
+    assert scoped.upsert_metrics_intraday_bulk(rows) == 2
+    with sqlite3.connect(db_path) as conn:
+        got = conn.execute("SELECT connector_id, hour_ts, spend FROM metrics_intraday ORDER BY hour_ts").fetchall()
+    assert got == [("con_1", "2026-02-15T09:00:00+09:00", 5.0), ("con_1", "2026-02-15T10:00:00+09:00", 5.0)]
@@ -2,10 +2,23 @@ from __future__ import annotations
 
 import asyncio
 import json
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
+import bcrypt
+import httpx
+
+from commerce.connectors import smartstore
 from commerce.connectors.base import ConnectorContext
-from commerce.connectors.smartstore import SmartStoreConnector, _to_date_kst
+from commerce.connectors.smartstore import (
+    SmartStoreConnector,
+    _KST,
+    _kst_iso,
+    _parse_last_changed_at,
+    _to_date_kst,
+)
 from commerce.db import AdsDB
 from commerce.repo import Repo
 
@@ -97,3 +110,191 @@ def test_smartstore_to_date_kst_returns_empty_for_invalid_timestamp() -> None:
     assert _to_date_kst("2026-02-15T00:00:00.000+09:00") == "2026-02-15"
     assert _to_date_kst("bad-timestamp") == ""
     assert _to_date_kst(None) == ""
+
+
+def _api_connector(tmp_path: Path, monkeypatch, handler) -> tuple[SmartStoreConnector, Repo, list]:
+    monkeypatch.setenv("SMARTSTORE_CLIENT_ID", "cid")
+    monkeypatch.setenv("SMARTSTORE_CLIENT_SECRET", bcrypt.gensalt(4).decode("ascii"))
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    repo = Repo(db_path)
+    clients: list = []
+
+    class _Client(smartstore._SmartStoreClient):
+        def __init__(self, **kwargs) -> None:
+            super().__init__(**kwargs)
+            self._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            clients.append(self)
+
+    monkeypatch.setattr(smartstore, "_SmartStoreClient", _Client)
+    ctx = ConnectorContext(
+        connector_id="con_test",
+        platform="smartstore",
+        name="SmartStore Test",
+        # Pacing has its own test; keep the fan-out tests fast.
+        config={"mode": "api", "api_min_interval_sec": 0},
+    )
+    return SmartStoreConnector(ctx, repo), repo, clients
+
+
+def _order(po_id: str) -> dict:
+    return {
+        "productOrder": {
+            "productOrderId": po_id,
+            "placeOrderDate": "2026-01-15T17:08:45.418+09:00",
+            "productOrderStatus": "PAYED",
+            "totalPaymentAmount": 1000,
+        }
+    }
+
+
+def test_smartstore_api_reuses_client_and_token(tmp_path: Path, monkeypatch) -> None:
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("/oauth2/token"):
+            return httpx.Response(200, json={"access_token": "tok", "expires_in": 10800})
+        assert request.headers["authorization"] == "Bearer tok"
+        if request.url.path.endswith("/last-changed-statuses"):
+            items = [{"productOrderId": "po_1"}, {"productOrderId": "po_2"}, {"productOrderId": "po_1"}]
+            return httpx.Response(200, json={"data": {"lastChangeStatuses": items}})
+        ids = json.loads(request.content)["productOrderIds"]
+        return httpx.Response(200, json={"data": [_order(i) for i in ids]})
+
+    connector, repo, clients = _api_connector(tmp_path, monkeypatch, handler)
+    start = datetime.now(tz=ZoneInfo("Asia/Seoul")) - timedelta(hours=1)
+    repo.set_meta("smartstore:con_test:last_changed_from", start.isoformat())
+
+    asyncio.run(connector.sync_entities())
+
+    assert [p.rsplit("/", 1)[-1] for p in paths] == ["token", "last-changed-statuses", "query"]
+    assert len(clients) == 1 and clients[0]._client is None
+    assert sorted(r["order_id"] for r in repo.list_store_orders(store="smartstore", limit=10)) == ["po_1", "po_2"]
+
+
+def test_smartstore_api_fetches_windows_concurrently_and_retries_429(tmp_path: Path, monkeypatch) -> None:
+    in_flight = 0
+    peak = 0
+    tokens = 0
+    throttled: list[bool] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak, tokens
+        if request.url.path.endswith("/oauth2/token"):
+            tokens += 1
+            return httpx.Response(200, json={"access_token": "tok", "expires_in": 10800})
+        if request.url.path.endswith("/query"):
+            if not throttled:
+                throttled.append(True)
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            ids = json.loads(request.content)["productOrderIds"]
+            return httpx.Response(200, json={"data": [_order(i) for i in ids]})
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        pid = request.url.params["lastChangedFrom"]
+        return httpx.Response(200, json={"data": {"lastChangeStatuses": [{"productOrderId": pid}]}})
+
+    connector, repo, _ = _api_connector(tmp_path, monkeypatch, handler)
+    start = datetime.now(tz=ZoneInfo("Asia/Seoul")) - timedelta(days=3, hours=1)
+    repo.set_meta("smartstore:con_test:last_changed_from", start.isoformat())
+
+    asyncio.run(connector.sync_entities())
+
+    assert tokens == 1
+    assert peak > 1
+    assert throttled == [True]
+    assert len(repo.list_store_orders(store="smartstore", limit=10)) == 4
+
+
+def test_smartstore_api_queries_details_while_windows_scan(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(smartstore, "_DETAIL_BATCH", 2)
+    events: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/oauth2/token"):
+            return httpx.Response(200, json={"access_token": "tok", "expires_in": 10800})
+        if request.url.path.endswith("/query"):
+            ids = json.loads(request.content)["productOrderIds"]
+            events.append("query")
+            return httpx.Response(200, json={"data": [_order(i) for i in ids]})
+        cf = request.url.params["lastChangedFrom"]
+        # The newest window answers last, after the first batch has gone out.
+        await asyncio.sleep(0.05 if cf == last_window else 0)
+        events.append("window")
+        items = [{"productOrderId": f"{cf}-{n}"} for n in range(2)]
+        return httpx.Response(200, json={"data": {"lastChangeStatuses": items}})
+
+    connector, repo, _ = _api_connector(tmp_path, monkeypatch, handler)
+    start = datetime.now(tz=ZoneInfo("Asia/Seoul")) - timedelta(hours=25)
+    repo.set_meta("smartstore:con_test:last_changed_from", start.isoformat())
+    last_window = (start + timedelta(hours=23, minutes=59)).strftime("%Y-%m-%dT%H:%M:%S.000+09:00")
+
+    asyncio.run(connector.sync_entities())
+
+    assert events.index("query") < events.index("window", 1)
+    assert len(repo.list_store_orders(store="smartstore", limit=10)) == 4
+
+
+def test_smartstore_kst_iso_matches_strftime() -> None:
+    dt = datetime(2026, 2, 5, 7, 3, 9, 123456, tzinfo=ZoneInfo("Asia/Seoul"))
+    assert _kst_iso(dt) == dt.strftime("%Y-%m-%dT%H:%M:%S.000+09:00") == "2026-02-05T07:03:09.000+09:00"
+
+
+def test_smartstore_api_follows_more_within_saturated_window(tmp_path: Path, monkeypatch) -> None:
+    scans: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/oauth2/token"):
+            return httpx.Response(200, json={"access_token": "tok", "expires_in": 10800})
+        if request.url.path.endswith("/query"):
+            ids = json.loads(request.content)["productOrderIds"]
+            return httpx.Response(200, json={"data": [_order(i) for i in ids]})
+        params = dict(request.url.params)
+        scans.append(params)
+        if "moreSequence" not in params:
+            more = {"moreFrom": "2026-02-15T10:00:00.000+09:00", "moreSequence": "00042"}
+            return httpx.Response(200, json={"data": {"lastChangeStatuses": [{"productOrderId": "po_1"}], "more": more}})
+        return httpx.Response(200, json={"data": {"lastChangeStatuses": [{"productOrderId": "po_2"}]}})
+
+    connector, repo, _ = _api_connector(tmp_path, monkeypatch, handler)
+    start = datetime.now(tz=ZoneInfo("Asia/Seoul")) - timedelta(hours=1)
+    repo.set_meta("smartstore:con_test:last_changed_from", start.isoformat())
+
+    asyncio.run(connector.sync_entities())
+
+    assert len(scans) == 2
+    assert scans[1]["lastChangedFrom"] == "2026-02-15T10:00:00.000+09:00"
+    assert scans[1]["moreSequence"] == "00042"
+    assert scans[1]["lastChangedTo"] == scans[0]["lastChangedTo"]
+    assert sorted(r["order_id"] for r in repo.list_store_orders(store="smartstore", limit=10)) == ["po_1", "po_2"]
+
+
+def test_smartstore_cursor_round_trips_through_fast_path() -> None:
+    dt = datetime(2026, 2, 5, 7, 3, 9, tzinfo=_KST)
+    assert _parse_last_changed_at(_kst_iso(dt)) == dt
+    assert _parse_last_changed_at("2026-02-04T22:03:09Z") == dt
+    assert _parse_last_changed_at("2026-02-05T07:03:09.500+09:00").microsecond == 500000
+
+
+def test_smartstore_client_paces_concurrent_requests(monkeypatch) -> None:
+    starts: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        starts.append(time.monotonic())
+        return httpx.Response(200, json={})
+
+    client = smartstore._SmartStoreClient(min_interval=0.05)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._token, client._token_expires = "tok", time.time() + 3600
+
+    async def run() -> None:
+        await asyncio.gather(*(client.request_json("GET", "/x") for _ in range(4)))
+        await client.aclose()
+
+    asyncio.run(run())
+
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert len(gaps) == 3 and min(gaps) >= 0.045
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from commerce.connectors.base import ConnectorContext
+from commerce.connectors.tiktok_ads import TikTokAdsConnector
+
+_HEADER = (
+    "platform,account_id,entity_type,entity_id,date,spend,impressions,clicks,"
+    "conversions,conversion_value,metrics_json\n"
+)
+
+
+def test_tiktok_fixture_daily_slices_sorted_window(tmp_path: Path) -> None:
+    fixture_dir = tmp_path / "tiktok_fixture"
+    fixture_dir.mkdir()
+    csv_path = fixture_dir / "metrics_daily.csv"
+    csv_path.write_text(
+        _HEADER
+        + "tiktok,acc1,campaign,c1,2026-02-16,400,40,4,0,0,\n"
+        + "tiktok,acc1,campaign,c1,2026-02-14,200,20,2,0,0,\n"
+        + "tiktok,acc1,campaign,c1,,999,1,1,0,0,\n"
+        + "tiktok,acc1,campaign,c1,2026-02-13,100,10,1,0,0,\n"
+        + "tiktok,acc1,campaign,c2,2026-02-15,300,30,3,1,900,\n",
+        encoding="utf-8",
+    )
+    ctx = ConnectorContext(
+        connector_id="con_tiktok_fixture",
+        platform="tiktok",
+        name="TikTok Fixture",
+        config={"mode": "fixture", "fixture_dir": str(fixture_dir)},
+    )
+    repo = MagicMock()
+    connector = TikTokAdsConnector(ctx, repo)
+
+    asyncio.run(connector.fetch_metrics_daily("2026-02-14", "2026-02-15"))
+    rows = repo.upsert_metrics_daily_bulk.call_args.args[0]
+    assert [(r["entity_id"], r["day"], r["spend"]) for r in rows] == [("c1", "2026-02-14", 200.0), ("c2", "2026-02-15", 300.0)]
+
+    # An edited fixture is picked up rather than served from the sorted-row cache.
+    csv_path.write_text(_HEADER + "tiktok,acc1,campaign,c3,2026-02-14,50,5,1,0,0,\n", encoding="utf-8")
+    asyncio.run(connector.fetch_metrics_daily("2026-02-14", "2026-02-15"))
+    rows = repo.upsert_metrics_daily_bulk.call_args.args[0]
+    assert [r["entity_id"] for r in rows] == ["c3"]
+
+
+def test_tiktok_fixture_intraday_matches_day_prefix(tmp_path: Path) -> None:
+    fixture_dir = tmp_path / "tiktok_fixture"
+    fixture_dir.mkdir()
+    (fixture_dir / "metrics_intraday.csv").write_text(
+        "platform,account_id,entity_type,entity_id,hour_ts,spend,impressions,clicks,"
+        "conversions,conversion_value,metrics_json\n"
+        "tiktok,acc1,campaign,c1,2026-02-16T00:00:00+09:00,4,1,0,0,0,\n"
+        "tiktok,acc1,campaign,c1,2026-02-15T23:00:00+09:00,3,1,0,0,0,\n"
+        "tiktok,acc1,campaign,c1,2026-02-14T23:00:00+09:00,1,1,0,0,0,\n"
+        "tiktok,acc1,campaign,c1,2026-02-15T00:00:00+09:00,2,1,0,0,0,\n",
+        encoding="utf-8",
+    )
+    ctx = ConnectorContext(
+        connector_id="con_tiktok_fixture",
+        platform="tiktok",
+        name="TikTok Fixture",
+        config={"mode": "fixture", "fixture_dir": str(fixture_dir)},
+    )
+    repo = MagicMock()
+
+    asyncio.run(TikTokAdsConnector(ctx, repo).fetch_metrics_intraday("2026-02-15"))
+    rows = list(repo.upsert_metrics_intraday_bulk.call_args.args[0])
+    assert [(r["hour_ts"][:13], r["spend"]) for r in rows] == [("2026-02-15T00", 2.0), ("2026-02-15T23", 3.0)]
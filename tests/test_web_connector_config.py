@@ -626,3 +626,26 @@ def test_index_hides_top_roas_cards(tmp_path: Path) -> None:
     assert "블렌디드 ROAS" not in text
     assert "플랫폼 ROAS" not in text
     assert "어트리뷰션 ROAS" not in text
+
+
+def test_actions_page_lists_proposals(tmp_path: Path) -> None:
+    db_path = tmp_path / "ads.sqlite3"
+    AdsDB(db_path).init()
+    pid = Repo(db_path).create_action_proposal(
+        status="proposed",
+        platform="naver",
+        connector_id=None,
+        action_type="pause_entity",
+        account_id=None,
+        entity_type="campaign",
+        entity_id="c1",
+        payload={},
+        reason="spend guardrail",
+    )
+
+    client = TestClient(create_app(_settings_for_db(db_path)))
+    resp = client.get("/actions?status=proposed")
+    assert resp.status_code == 200
+    assert pid in resp.text
+    assert "campaign:c1" in resp.text
+    assert f"/actions/{pid}/approve" in resp.text